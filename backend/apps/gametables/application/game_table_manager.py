@@ -1,8 +1,12 @@
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Any, final
+import itertools
+import time
+from datetime import UTC, datetime, timedelta
 import uuid
 import logging
 
+from core.cache.lru_cache import LruCache
 from core.exceptions.infrastructure_exception import InfrastructureException
 from core.exceptions.app_exception import AppException
 from .igame_event_repository import IGameEventRepository
@@ -15,6 +19,7 @@ from ..registries.game_command_parsers import get_command_parser
 from ..registries.game_engines import get_game_engine
 from ..registries.game_classes import get_game_class
 from ..registries.game_event_parsers import get_game_event_parser
+from ..registries.snapshot_policies import get_snapshot_policy
 from apps.users.models import User
 from game.bot_strategy_kind import BotStrategyKind
 from game.common.game_event import GameEvent
@@ -26,6 +31,26 @@ from ..domain.game_table_config import GameTableConfig
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOTS_REPLAY_CHUNK_SIZE = 500  # events fetched from the database at once while replaying
+SNAPSHOTS_STORE_BATCH_SIZE = 200  # snapshots stored in one round trip while replaying
+
+# replayed game states and stored events kept in process, so browsing history event by event
+# is served by applying an event or two to a neighbouring game state instead of a round trip
+GAME_STATES_CACHE_SIZE = 4096
+GAME_EVENTS_CACHE_SIZE = 16384
+GAME_HISTORY_CACHE_TTL_SECONDS = 600
+REPLAY_SAFE_EVENT_NUMBERS_CACHE_SIZE = 1024
+MAX_ADJACENT_EVENTS = 2  # events applied to a cached game state at most, further ones are looked up
+
+COMPACTION_BATCH_SIZE = 100  # tables compacted by a single compaction run
+ARCHIVAL_BATCH_SIZE = 100  # tables archived by a single archival run
+ARCHIVE_ENDED_TABLES_AFTER = timedelta(hours=1)  # recently ended tables stay in place, e.g. for rematch views
+
+# bot turns taken within a single action, about one round of Five Hundred (random bots need at most ~30 turns),
+# so a single transaction (and its replays on conflicts) does not play the whole game of bots only;
+# the rest can be triggered by automatic turns
+MAX_CHAINED_BOT_TURNS = 50
+
 
 @final
 class GameTableManager:
@@ -34,10 +59,25 @@ class GameTableManager:
         game_table_repository: IGameTableRepository,
         game_event_repository: IGameEventRepository,
         game_state_snapshot_repository: IGameStateSnapshotRepository,
+        max_chained_bot_turns: int = MAX_CHAINED_BOT_TURNS,
     ) -> None:
         self._game_table_repository: IGameTableRepository = game_table_repository
         self._game_event_repository: IGameEventRepository = game_event_repository
         self._game_state_snapshot_repository: IGameStateSnapshotRepository = game_state_snapshot_repository
+        self._max_chained_bot_turns: int = max_chained_bot_turns
+        # (table id, event number) -> (game name, game state after the event)
+        self._game_states_cache: LruCache[tuple[str, int], tuple[GameName, GameState]] = LruCache(
+            GAME_STATES_CACHE_SIZE, GAME_HISTORY_CACHE_TTL_SECONDS
+        )
+        # (table id, event number) -> serialized event, only events already stored as snapshot deltas
+        self._game_events_cache: LruCache[tuple[str, int], dict[str, Any]] = LruCache(
+            GAME_EVENTS_CACHE_SIZE, GAME_HISTORY_CACHE_TTL_SECONDS
+        )
+        # table id -> replay safe event number of the table when it was last loaded, cached game states and events
+        # are never past it, and are served without loading the table only up to it
+        self._replay_safe_event_numbers: LruCache[str, int] = LruCache(
+            REPLAY_SAFE_EVENT_NUMBERS_CACHE_SIZE, GAME_HISTORY_CACHE_TTL_SECONDS
+        )
 
     def _generate_table_id(self) -> str:
         return str(uuid.uuid4())
@@ -61,6 +101,7 @@ class GameTableManager:
             table = self._game_table_repository.find_by_id(table_id)
             if table.can_remove(initiated_by):
                 self._game_table_repository.delete(table_id)
+                self._replay_safe_event_numbers.discard(table_id)
         except AppException as e:
             raise e.with_context(table_id=table_id, operation="remove_table")
 
@@ -128,7 +169,8 @@ class GameTableManager:
         try:
 
             def _modifier(table: GameTable) -> Sequence[GameEvent]:
-                return table.start_game(initiated_by=initiated_by)
+                events = table.start_game(initiated_by=initiated_by)
+                return self._with_chained_bot_turns(table, events)
 
             return self._game_table_repository.modify_during_game_action(table_id, _modifier)
         except AppException as e:
@@ -141,12 +183,21 @@ class GameTableManager:
 
             def _modifier(table: GameTable) -> Sequence[GameEvent]:
                 command = get_command_parser(table.config.game_name).from_dict(raw_command)
-                return table.take_regular_turn(user_id=user_id, command=command)
+                events = table.take_regular_turn(user_id=user_id, command=command)
+                return self._with_chained_bot_turns(table, events)
 
             return self._game_table_repository.modify_during_game_action(table_id, _modifier)
         except AppException as e:
             raise e.with_context(table_id=table_id, user_id=user_id, operation="take_regular_turn")
 
+    def _with_chained_bot_turns(self, table: GameTable, events: Sequence[GameEvent]) -> Sequence[GameEvent]:
+        """Takes bot turns following a human action within the same transaction, events are returned as one batch"""
+        bot_events = table.take_bot_turns(max_turns=self._max_chained_bot_turns)
+        if not table.is_game_ended and table.active_player.is_bot:
+            logger.info(f"Bot turns chaining stopped at bot's turn for table {table.id}")
+        return [*events, *bot_events]
+
+    # kept for clients which trigger bot turns themselves, takes exactly one bot turn
     def take_automatic_turn(self, table_id: str, initiated_by: int) -> tuple[Sequence[GameEvent], GameTable]:
         try:
 
@@ -185,71 +236,276 @@ class GameTableManager:
 
     def get_game_state_snapshot(self, table_id: str, event_number: int) -> Mapping[str, Any]:
         try:
-            data = self._game_state_snapshot_repository.get_exact_or_nearest_snapshot_data(table_id, event_number)
+            return self._get_game_state_snapshot(table_id, event_number, table=None)
+        except AppException as e:
+            raise e.with_context(table_id=table_id, event_number=event_number, operation="get_game_state_snapshot")
 
-            if data and data["is_exact"]:
+    def _get_game_state_snapshot(self, table_id: str, event_number: int, table: GameTable | None) -> Mapping[str, Any]:
+        """Returns the game state after the event, `table` is given by callers which have already loaded it"""
+        if table is not None:
+            self._replay_safe_event_numbers.put(table_id, table.replay_safe_game_event_number)
+
+        # cached game states, exact snapshots and cached keyframes are served without loading the table only
+        # for event numbers already validated against it, and only while it still exists
+        replay_safe_event_number = self._replay_safe_event_numbers.get(table_id)
+        is_validated = (
+            replay_safe_event_number is not None
+            and event_number <= replay_safe_event_number
+            and (table is not None or self._game_table_repository.exists(table_id))
+        )
+
+        if is_validated:
+            cached_game_state = self._get_adjacent_cached_game_state(table_id, event_number)
+            if cached_game_state is not None:
+                logger.debug(f"Cached game state used for table {table_id} and event number {event_number}")
+                return cached_game_state.to_dict()
+
+        data = self._game_state_snapshot_repository.get_exact_or_nearest_snapshot_data(table_id, event_number)
+
+        # deltas are stored only up to already validated event numbers, so a complete chain starting from
+        # a cached keyframe can be replayed without loading the table
+        is_chain_complete = data is not None and self._is_snapshot_chain_complete(data, event_number)
+        if is_validated and data and replay_safe_event_number is not None:
+            if data["is_exact"]:
                 logger.info(f"Exact snapshot found for table {table_id} and event number {event_number}")
                 return data["snapshot"]
-
+            cached_keyframe = self._game_states_cache.get((table_id, data["snapshot"]["event_number"]))
+            if is_chain_complete and cached_keyframe is not None:
+                game_name, keyframe = cached_keyframe
+                return self._replay_deltas(
+                    table_id, game_name, keyframe, data["deltas"], event_number, replay_safe_event_number
+                ).to_dict()
+
+        if table is None:
             table = self._game_table_repository.find_by_id(table_id)
+            self._replay_safe_event_numbers.put(table_id, table.replay_safe_game_event_number)
+        replay_safe_event_number = table.replay_safe_game_event_number
+
+        if replay_safe_event_number < event_number:
+            raise AppException(
+                detail="Event number is greater than the replay safe event number", reason="event_number_too_large"
+            )
 
-            if table.replay_safe_game_event_number < event_number:
+        if data and data["is_exact"]:
+            logger.info(f"Exact snapshot found for table {table_id} and event number {event_number}")
+            return data["snapshot"]
+
+        if data and is_chain_complete:
+            game_name = table.config.game_name
+            keyframe = get_game_class(game_name).from_dict(data["snapshot"])
+            self._game_states_cache.put((table_id, keyframe.event_number), (game_name, keyframe))
+            return self._replay_deltas(
+                table_id, game_name, keyframe, data["deltas"], event_number, replay_safe_event_number
+            ).to_dict()
+
+        return self.create_and_store_game_state_snapshots(
+            table, raw_initial_game_state=data["snapshot"] if data else None, up_to_event_number=event_number
+        )
+
+    def get_game_history(
+        self, table_id: str, from_event_number: int, to_event_number: int, with_game_states: bool = False
+    ) -> tuple[Mapping[str, Any], Iterator[Mapping[str, Any]]]:
+        """Returns the game state after `from_event_number` and a lazy iterator over the events following it,
+        up to `to_event_number`, or over game states after each of them if `with_game_states` is set.
+        Uses one table load, one snapshot lookup and one event range query, the range is validated before iterating.
+        Errors raised while iterating carry the context of the request too."""
+        try:
+            table = self._game_table_repository.find_by_id(table_id)
+            if table.replay_safe_game_event_number < to_event_number:
                 raise AppException(
                     detail="Event number is greater than the replay safe event number", reason="event_number_too_large"
                 )
-
-            return self.create_and_store_game_state_snapshots(
-                table, raw_initial_game_state=data["snapshot"] if data else None, up_to_event_number=event_number
-            )
-
+            game_state = self._get_game_state_snapshot(table_id, from_event_number, table=table)
         except AppException as e:
-            raise e.with_context(table_id=table_id, event_number=event_number, operation="get_game_state_snapshot")
+            raise e.with_context(table_id=table_id, event_number=to_event_number, operation="get_game_history")
+
+        raw_events = self._game_event_repository.iter_data(
+            table_id, from_event_number + 1, to_event_number, chunk_size=SNAPSHOTS_REPLAY_CHUNK_SIZE
+        )
+        items = self._iter_game_states(table, game_state, raw_events) if with_game_states else raw_events
+        return game_state, self._iter_game_history(table_id, to_event_number, items)
+
+    def _iter_game_history(
+        self, table_id: str, to_event_number: int, items: Iterator[Mapping[str, Any]]
+    ) -> Iterator[Mapping[str, Any]]:
+        # the iterator is consumed after `get_game_history` returns, e.g. while streaming the response
+        try:
+            yield from items
+        except AppException as e:
+            raise e.with_context(table_id=table_id, event_number=to_event_number, operation="get_game_history")
+
+    def _iter_game_states(
+        self, table: GameTable, raw_game_state: Mapping[str, Any], raw_events: Iterator[dict[str, Any]]
+    ) -> Iterator[Mapping[str, Any]]:
+        game_state = get_game_class(table.config.game_name).from_dict(raw_game_state)
+        game_event_parser = get_game_event_parser(table.config.game_name)
+        for raw_events_batch in itertools.batched(raw_events, SNAPSHOTS_REPLAY_CHUNK_SIZE):
+            for event in game_event_parser.parse_many(raw_events_batch):
+                game_state = table.get_initial_or_after_event_game_state(game_state, event)
+                yield game_state.to_dict()
+
+    def _get_adjacent_cached_game_state(self, table_id: str, event_number: int) -> GameState | None:
+        """Returns the game state after the event, built from a cached game state at most MAX_ADJACENT_EVENTS
+        before it and cached events following it, or None if they are not cached."""
+        for distance in range(MAX_ADJACENT_EVENTS + 1):
+            cached = self._game_states_cache.get((table_id, event_number - distance))
+            if cached is None:
+                continue
+            raw_events: list[dict[str, Any]] = []
+            for number in range(event_number - distance + 1, event_number + 1):
+                raw_event = self._game_events_cache.get((table_id, number))
+                if raw_event is None:
+                    return None
+                raw_events.append(raw_event)
+            game_name, game_state = cached
+            return self._replay_deltas(table_id, game_name, game_state, raw_events, event_number, event_number)
+        return None
+
+    def _is_snapshot_chain_complete(self, data: Mapping[str, Any], event_number: int) -> bool:
+        return data["snapshot"]["event_number"] + len(data["deltas"]) >= event_number
+
+    def _replay_deltas(
+        self,
+        table_id: str,
+        game_name: GameName,
+        game_state: GameState,
+        raw_deltas: Sequence[dict[str, Any]],
+        up_to_event_number: int,
+        replay_safe_event_number: int,
+    ) -> GameState:
+        """Applies deltas following the game state up to the event number. Deltas up to the replay safe event
+        number are cached as events, including those past the event number, and game states after each of them
+        are cached too."""
+        engine = get_game_engine(game_name)
+        raw_deltas_to_apply: list[dict[str, Any]] = []
+        for raw_delta in raw_deltas:
+            if raw_delta["seq_number"] <= replay_safe_event_number:
+                self._game_events_cache.put((table_id, raw_delta["seq_number"]), raw_delta)
+            if game_state.event_number < raw_delta["seq_number"] <= up_to_event_number:
+                raw_deltas_to_apply.append(raw_delta)
+        for event in get_game_event_parser(game_name).parse_many(raw_deltas_to_apply):
+            game_state = engine.apply_event(game_state, event)
+            self._game_states_cache.put((table_id, game_state.event_number), (game_name, game_state))
+        return game_state
+
+    def compact_ended_games_events(self, max_tables: int = COMPACTION_BATCH_SIZE) -> tuple[int, int]:
+        """Compacts game events of tables with ended games, one row per table instead of one row per event.
+        Returns:
+            Number of compacted tables and game events
+        """
+        started_at = time.perf_counter()
+        table_ids = self._game_event_repository.find_table_ids_to_compact(max_tables)
+        compacted_events_count = 0
+        for table_id in table_ids:
+            try:
+                compacted_events_count += self._game_event_repository.compact(table_id)
+            except AppException as e:
+                raise e.with_context(table_id=table_id, operation="compact_ended_games_events")
+
+        logger.info(
+            f"Compacted {compacted_events_count} game events of {len(table_ids)} tables in {(time.perf_counter() - started_at) * 1000:.1f}ms"
+        )
+        return len(table_ids), compacted_events_count
+
+    def archive_ended_tables(self, max_tables: int = ARCHIVAL_BATCH_SIZE) -> tuple[int, int]:
+        """Moves tables with games ended more than `ARCHIVE_ENDED_TABLES_AFTER` ago and their game events
+        to the archive, so indexes of tables and game events cover mostly active games.
+        Returns:
+            Number of archived tables and game events
+        """
+        started_at = time.perf_counter()
+        table_ids = self._game_event_repository.find_table_ids_to_archive(
+            max_tables, ended_before=datetime.now(UTC) - ARCHIVE_ENDED_TABLES_AFTER
+        )
+        archived_events_count = 0
+        for table_id in table_ids:
+            try:
+                archived_events_count += self._game_event_repository.archive(table_id)
+            except AppException as e:
+                raise e.with_context(table_id=table_id, operation="archive_ended_tables")
+
+        logger.info(
+            f"Archived {len(table_ids)} tables with {archived_events_count} game events in {(time.perf_counter() - started_at) * 1000:.1f}ms"
+        )
+        return len(table_ids), archived_events_count
 
     def create_and_store_game_state_snapshots(
         self, table: GameTable, raw_initial_game_state: dict[str, Any] | None, up_to_event_number: int | None
     ) -> Mapping[str, Any]:
         try:
-            raw_game_state: dict[str, Any] | None = raw_initial_game_state
             game_state: GameState | None = None
-            start_event_number: int | None = raw_game_state["event_number"] + 1 if raw_game_state else None
+            start_event_number: int | None = (
+                raw_initial_game_state["event_number"] + 1 if raw_initial_game_state else None
+            )
 
             logger.info(
                 f"Creating and storing game state snapshots for table {table.id} from event number {start_event_number or 0} up to event number {up_to_event_number}"
             )
 
-            db_events = self._game_event_repository.find_many(table.id, start_event_number, up_to_event_number)
+            if raw_initial_game_state:
+                game_state = get_game_class(table.config.game_name).from_dict(raw_initial_game_state)
 
-            if raw_game_state:
-                game_state = get_game_class(table.config.game_name).from_dict(raw_game_state)
+            # full snapshots (keyframes) are stored only at checkpoints, events following them are stored as deltas
+            snapshot_policy = get_snapshot_policy(table.config.game_name)
+            started_at = time.perf_counter()
+            replayed_events_count = 0
+            stored_snapshots_count = 0
 
-            data_to_store: list[dict[str, Any]] = []
+            # only the latest game state, deltas since the last keyframe and one batch to store are kept in memory
+            snapshots_to_store: list[dict[str, Any]] = []
+            deltas_to_store: dict[int, list[dict[str, Any]]] = {}
+            deltas_to_store_count = 0
 
             game_event_parser = get_game_event_parser(table.config.game_name)
 
             if not game_state:
                 game_state = table.get_initial_or_after_event_game_state(None, None)
-                raw_game_state = game_state.to_dict()
-                data_to_store.append(raw_game_state)
-
-            db_events = self._game_event_repository.find_many(table.id, start_event_number, up_to_event_number)
-
-            for db_event in db_events:
-                event = game_event_parser.from_dict(db_event.data)
-                game_state = table.get_initial_or_after_event_game_state(game_state=game_state, event_to_apply=event)
-                raw_game_state = game_state.to_dict()
+                if snapshot_policy.is_checkpoint(game_state):
+                    snapshots_to_store.append(game_state.to_dict())
 
-                if raw_game_state["event_number"] != event.seq_number:
-                    logger.error(f"Event number mismatch: {raw_game_state['event_number']} != {event.seq_number}")
-                    raise InfrastructureException(detail="Event number mismatch", reason="event_number_mismatch")
+            keyframe_event_number = game_state.event_number
+            keyframe_deltas: list[dict[str, Any]] = []
 
-                data_to_store.append(raw_game_state)
+            raw_events = self._game_event_repository.iter_data(
+                table.id, start_event_number, up_to_event_number, chunk_size=SNAPSHOTS_REPLAY_CHUNK_SIZE
+            )
 
-            self._game_state_snapshot_repository.store(table.id, data_to_store)
+            for raw_events_batch in itertools.batched(raw_events, SNAPSHOTS_REPLAY_CHUNK_SIZE):
+                events = game_event_parser.parse_many(raw_events_batch)
+                for raw_event, event in zip(raw_events_batch, events, strict=True):
+                    game_state = table.get_initial_or_after_event_game_state(
+                        game_state=game_state, event_to_apply=event
+                    )
+
+                    if game_state.event_number != event.seq_number:
+                        logger.error(f"Event number mismatch: {game_state.event_number} != {event.seq_number}")
+                        raise InfrastructureException(detail="Event number mismatch", reason="event_number_mismatch")
+
+                    replayed_events_count += 1
+                    keyframe_deltas.append(raw_event)
+                    if not snapshot_policy.is_checkpoint(game_state):
+                        continue
+
+                    snapshots_to_store.append(game_state.to_dict())
+                    deltas_to_store[keyframe_event_number] = keyframe_deltas
+                    deltas_to_store_count += len(keyframe_deltas)
+                    keyframe_event_number, keyframe_deltas = game_state.event_number, []
+
+                    if deltas_to_store_count >= SNAPSHOTS_STORE_BATCH_SIZE:
+                        self._game_state_snapshot_repository.store(table.id, snapshots_to_store, deltas_to_store)
+                        stored_snapshots_count += len(snapshots_to_store)
+                        snapshots_to_store, deltas_to_store, deltas_to_store_count = [], {}, 0
+
+            if keyframe_deltas:
+                deltas_to_store[keyframe_event_number] = keyframe_deltas
+            self._game_state_snapshot_repository.store(table.id, snapshots_to_store, deltas_to_store)
+            stored_snapshots_count += len(snapshots_to_store)
 
-            if not raw_game_state:
-                raise AppException(detail="Could not restore game state from events", reason="game_state_not_restored")
+            logger.info(
+                f"Replayed {replayed_events_count} events and stored {stored_snapshots_count} snapshots for table {table.id} in {(time.perf_counter() - started_at) * 1000:.1f}ms"
+            )
 
-            return raw_game_state
+            return game_state.to_dict()
 
         except AppException as e:
             raise e.with_context(table_id=table.id, operation="create_and_store_game_state_snapshots")
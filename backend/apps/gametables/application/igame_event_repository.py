@@ -1,15 +1,73 @@
-from typing import Protocol
-from django.db.models import QuerySet
+from collections.abc import Collection, Iterator, Sequence
+from datetime import datetime
+from typing import Any, Protocol
 
+from game.game_name import GameName
+from ..domain.table_status import TableStatus
 from ..models import GameEventModel
 
 
 class IGameEventRepository(Protocol):
     def find_many(
         self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None
-    ) -> QuerySet[GameEventModel]:
-        """List/browse game events by table ID and sequence numbers (inclusive) sorted by sequence number ascending
+    ) -> Sequence[GameEventModel]:
+        """List/browse game events by table ID and sequence numbers (inclusive) sorted by sequence number ascending,
+        including compacted ones (as unsaved model instances)
         Returns:
-            QuerySet of GameEventModel
+            Sequence of GameEventModel
+        """
+        ...
+
+    def iter_data(
+        self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None, chunk_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        """Streams raw data of game events by table ID and sequence numbers (inclusive) sorted by sequence number
+        ascending, fetched from the database in chunks without building model instances
+        Returns:
+            Iterator of serialized game events
+        """
+        ...
+
+    def iter_tables_events(
+        self,
+        game_name: GameName,
+        table_ids: Collection[str] | None = None,
+        statuses: Collection[TableStatus] | None = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple[str, int, dict[str, Any]]]:
+        """Streams game events of many tables of the game, optionally filtered by table IDs and statuses,
+        sorted by table ID and sequence number ascending. Chunks are fetched with keyset pagination,
+        so each of them costs the same regardless of how far the iteration is.
+        Returns:
+            Iterator of (table ID, sequence number, serialized game event)
+        """
+        ...
+
+    def find_table_ids_to_compact(self, limit: int) -> list[str]:
+        """Finds tables with ended games that still have game events stored one row per event
+        Returns:
+            List of table IDs, at most `limit` long
+        """
+        ...
+
+    def compact(self, table_id: str) -> int:
+        """Moves game events of a table with ended game into a single compacted row, does nothing for other tables
+        Returns:
+            Number of compacted game events
+        """
+        ...
+
+    def find_table_ids_to_archive(self, limit: int, ended_before: datetime) -> list[str]:
+        """Finds tables with games ended (last modified) before the given time, oldest first
+        Returns:
+            Up to `limit` table IDs
+        """
+        ...
+
+    def archive(self, table_id: str) -> int:
+        """Moves a table with ended game to the archive table, with its game events compacted into a single row,
+        does nothing for other tables
+        Returns:
+            Number of archived game events
         """
         ...
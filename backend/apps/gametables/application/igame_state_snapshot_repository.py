@@ -5,13 +5,21 @@ from typing import Any, Protocol
 class IGameStateSnapshotRepository(Protocol):
     def get_exact_or_nearest_snapshot_data(self, table_id: str, event_number: int = 0) -> Mapping[str, Any] | None:
         f"""
-        Gets serialized game-state snapshot and metadata for specific table based on event number
-        Returns: {"is_exact": bool, "snapshot": dict[str, Any]}
+        Gets serialized game-state snapshot and metadata for specific table based on event number.
+        If there is no exact snapshot, the nearest preceding one (keyframe) is returned along with all stored deltas
+        (serialized events) following it, sorted by sequence number ascending. Deltas may reach past the event number.
+        Returns: {"is_exact": bool, "snapshot": dict[str, Any], "deltas": list[dict[str, Any]]}
         """
         ...
 
-    def store(self, table_id: str, raw_snapshots: Sequence[dict[str, Any]]) -> None:
+    def store(
+        self,
+        table_id: str,
+        raw_snapshots: Sequence[dict[str, Any]],
+        raw_deltas_by_keyframe: Mapping[int, Sequence[dict[str, Any]]] | None = None,
+    ) -> None:
         """
-        Stores serialized game-state snapshots in bulk.
+        Stores serialized game-state snapshots (keyframes) in bulk, optionally along with serialized events (deltas)
+        following each keyframe, keyed by keyframe's event number. Deltas replace ones stored for the same keyframe.
         """
         ...
@@ -1,17 +1,27 @@
 from collections.abc import Sequence
-from typing import Callable, Protocol
+from datetime import datetime
+from typing import Any, Callable, Protocol
 from django.db.models import QuerySet
 
 from game.common.game_event import GameEvent
-from ..models import GameTableModel
 from ..domain.game_table import GameTable
 
 
 class IGameTableRepository(Protocol):
-    def find_many(self, filters: dict[str, set[str]]) -> QuerySet[GameTableModel]:
-        """List/browse tables by important fields (configs, status, players, etc.)
+    def find_many(self, filters: dict[str, set[str]]) -> QuerySet[Any, dict[str, Any]]:
+        """List/browse tables by important fields (status, game name), newest first, including archived tables
+        when ended statuses are listed
         Returns:
-            QuerySet of GameTableModel
+            QuerySet of table rows with lobby projections
+        """
+        ...
+
+    def find_page(
+        self, filters: dict[str, set[str]], limit: int, after: tuple[datetime, str] | None = None
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """List tables like `find_many`, continuing after the (created_at, id) of the last listed table
+        Returns:
+            Tuple of up to `limit` table rows with lobby projections and whether more tables follow
         """
         ...
 
@@ -22,6 +32,13 @@ class IGameTableRepository(Protocol):
         """
         ...
 
+    def exists(self, id: str) -> bool:
+        """Check whether a GameTable with the ID exists, without loading it, including archived tables
+        Returns:
+            True if the table exists
+        """
+        ...
+
     def create(self, game_table: GameTable) -> str:
         """Create a new GameTable instance, create new GameTableModel record and all related models
         Returns:
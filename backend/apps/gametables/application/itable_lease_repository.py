@@ -0,0 +1,22 @@
+from enum import Enum
+from typing import Protocol
+
+
+class TableLeaseAcquisition(Enum):
+    RENEWED = "renewed"  # the owner already held the lease, nobody could modify the table in between
+    ACQUIRED = "acquired"  # the lease was free, the table could have been modified by anybody before
+    REJECTED = "rejected"  # the lease is held by another owner
+
+
+class ITableLeaseRepository(Protocol):
+    def acquire(self, table_id: str, owner: str) -> TableLeaseAcquisition:
+        """
+        Acquires a lease of the table for the owner or renews it if the owner already holds it.
+        """
+        ...
+
+    def release(self, table_id: str, owner: str) -> None:
+        """
+        Releases a lease of the table if it is held by the owner.
+        """
+        ...
@@ -2,6 +2,7 @@ from redis import Redis, ConnectionPool
 
 from config import settings
 from .infra.task_lock_repository import TaskLockRepository
+from .infra.table_lease_repository import TableLeaseRepository
 from .infra.game_state_snapshot_repository import GameStateSnapshotRepository
 from .infra.game_table_repository import GameTableRepository
 from .infra.game_event_repository import GameEventRepository
@@ -14,6 +15,7 @@ _game_table_repo: GameTableRepository | None = None
 _game_event_repo: GameEventRepository | None = None
 _game_state_snapshot_repo: GameStateSnapshotRepository | None = None
 _task_lock_repo: TaskLockRepository | None = None
+_table_lease_repo: TableLeaseRepository | None = None
 _table_manager: GameTableManager | None = None
 
 
@@ -33,7 +35,9 @@ def get_redis_cache_conn() -> Redis:
 def get_game_table_repository() -> GameTableRepository:
     global _game_table_repo
     if _game_table_repo is None:
-        _game_table_repo = GameTableRepository()
+        _game_table_repo = GameTableRepository(
+            table_lease_repository=get_table_lease_repository() if settings.HOT_GAME_TABLES_ENABLED else None
+        )
     return _game_table_repo
 
 
@@ -58,6 +62,13 @@ def get_task_lock_repository() -> TaskLockRepository:
     return _task_lock_repo
 
 
+def get_table_lease_repository() -> TableLeaseRepository:
+    global _table_lease_repo
+    if _table_lease_repo is None:
+        _table_lease_repo = TableLeaseRepository(redis_conn=get_redis_cache_conn())
+    return _table_lease_repo
+
+
 def get_table_manager() -> GameTableManager:
     global _table_manager
     if _table_manager is None:
@@ -4,7 +4,7 @@ from typing import Any, override
 import uuid
 
 from ..exceptions import GameTableInternalException, GameTableRulesException
-from .table_status import TableStatus
+from .table_status import ENDED_GAME_TABLE_STATUSES, TableStatus
 from game.common.bot_strategy import BotStrategy
 from game.common.game_command import GameCommand
 from game.common.game_engine import GameEngine
@@ -12,9 +12,12 @@ from game.common.game_event import GameEvent
 from game.common.game_state import GameState
 from game.common.seat import SeatNumber
 from game.common.game_ending import GameEndingReason
+from game.common.game_exception import GameRulesException
 from .game_table_config import GameTableConfig
 from .player import Player
 
+BOT_COMMAND_ATTEMPTS = 3  # commands asked from a bot strategy for a single turn before giving up chaining
+
 
 class GameTable:
     def __init__(
@@ -80,7 +83,7 @@ class GameTable:
 
     @property
     def is_game_ended(self) -> bool:
-        return self.status in {TableStatus.FINISHED, TableStatus.ABORTED, TableStatus.CANCELLED}
+        return self.status in ENDED_GAME_TABLE_STATUSES
 
     def add_human_player(self, user_id: int, screen_name: str, preferred_seat_number: SeatNumber | None = None) -> None:
         self._validate_status(acceptable_statuses={TableStatus.NOT_STARTED})
@@ -156,18 +159,45 @@ class GameTable:
     def take_automatic_turn(self, initiated_by: int) -> Sequence[GameEvent]:
         self._validate_status(acceptable_statuses={TableStatus.IN_PROGRESS})
         self._validate_is_player(initiated_by)
-        active_player = self.active_player
-        if not active_player.is_bot:
+        if not self.active_player.is_bot:
             raise GameTableRulesException(reason="not_bot_turn", detail="Could not take turn: not a bot's turn")
+        game_state = self.game_state
+        command = self._get_active_bot_strategy().create_command(game_state)
+        return self._process_game_command(game_state, command)
+
+    # bot turns are chained on the server right after an action, up to the next human player's turn (or game end),
+    # so bots do not wait for clients to trigger their turns one by one, at most `max_turns` are taken at once
+    def take_bot_turns(self, max_turns: int) -> Sequence[GameEvent]:
+        events: list[GameEvent] = []
+        for _ in range(max_turns):
+            if self._status != TableStatus.IN_PROGRESS or not self.active_player.is_bot:
+                break
+            turn_events = self._take_bot_turn()
+            if not turn_events:
+                break  # bot could not come up with a valid command, its turn is left for take_automatic_turn
+            events.extend(turn_events)
+        return events
+
+    def _take_bot_turn(self) -> Sequence[GameEvent]:
+        bot_strategy = self._get_active_bot_strategy()
+        game_state = self.game_state
+        for _ in range(BOT_COMMAND_ATTEMPTS):
+            command = bot_strategy.create_command(game_state)
+            try:
+                return self._process_game_command(game_state, command)
+            except GameRulesException:
+                continue  # strategies may be non-deterministic, ask for another command
+        return []
+
+    def _get_active_bot_strategy(self) -> BotStrategy:
+        active_player = self.active_player
         bot_strategy = active_player.bot_strategy
         if bot_strategy is None:
             raise GameTableInternalException(
                 reason="bot_strategy_not_set",
                 detail=f"Could not take bot's turn: bot strategy is not set for bot {active_player.screen_name}",
             )
-        game_state = self.game_state
-        command = bot_strategy.create_command(game_state)
-        return self._process_game_command(game_state, command)
+        return bot_strategy
 
     def cancel_game(self, initiated_by: int, command: GameCommand) -> Sequence[GameEvent]:
         # TODO: check if all other players have agreed for this... (for now owner can cancel without asking)
@@ -184,16 +214,26 @@ class GameTable:
 
     def _process_game_command(self, game_state: GameState, command: GameCommand) -> Sequence[GameEvent]:
         game_state_updated, events = self._engine.process_command(game_state, command)
-        if game_state_updated.ending is not None:
-            match game_state_updated.ending.reason:
+        self._set_game_state(game_state_updated)
+        return events
+
+    def _set_game_state(self, game_state: GameState) -> None:
+        if game_state.ending is not None:
+            match game_state.ending.reason:
                 case GameEndingReason.FINISHED:
                     self._status = TableStatus.FINISHED
                 case GameEndingReason.ABORTED:
                     self._status = TableStatus.ABORTED
                 case GameEndingReason.CANCELLED:
                     self._status = TableStatus.CANCELLED
-        self._game_state = game_state_updated
-        return events
+        self._game_state = game_state
+
+    # table snapshots are not stored after every event, events stored after the snapshot are applied when loading it
+    def apply_stored_events(self, events: Sequence[GameEvent]) -> None:
+        game_state = self.game_state
+        for event in events:
+            game_state = self._engine.apply_event(game_state, event)
+        self._set_game_state(game_state)
 
     def can_remove(self, initiated_by: int) -> bool:
         self._validate_status(acceptable_statuses={TableStatus.NOT_STARTED})
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from game.common.game_state import GameState
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotPolicy:
+    """Which game states are stored as full snapshots (checkpoints).
+    States in between are rebuilt on demand by replaying events from the nearest checkpoint,
+    so fewer checkpoints mean less memory in the snapshot store but more events to replay per request.
+    """
+
+    at_replay_safe_events: bool = True  # checkpoint when replay safe event number is reached (e.g. round ends)
+    every_n_events: int | None = None  # additional checkpoint every N events, bounds replay length of long rounds
+
+    def is_checkpoint(self, game_state: GameState) -> bool:
+        event_number = game_state.event_number
+        if event_number == 0:
+            return True
+        if self.at_replay_safe_events and event_number == game_state.replay_safe_event_number:
+            return True
+        return self.every_n_events is not None and event_number % self.every_n_events == 0
@@ -7,3 +7,10 @@ class TableStatus(Enum):
     FINISHED = "finished"  # game is finished (winners are determined)
     ABORTED = "aborted"  # game is aborted (someone left the table or something unexpected happened)
     CANCELLED = "cancelled"  # table is cancelled, players agreed to cancel the game
+
+
+# game is over, nothing is changed at the table anymore
+ENDED_GAME_TABLE_STATUSES = frozenset({TableStatus.FINISHED, TableStatus.ABORTED, TableStatus.CANCELLED})
+
+# tables listed in the lobby, ended ones are moved to the archive
+ACTIVE_GAME_TABLE_STATUSES = frozenset({TableStatus.NOT_STARTED, TableStatus.IN_PROGRESS})
@@ -0,0 +1,261 @@
+"""Columnar archive of game event logs for analytics and bot training.
+
+An archive is a directory with `manifest.json` and one file per column in NumPy `.npy` format (version 1.0,
+little-endian, C order), so columns can be memory-mapped both here (`GameEventArchive`) and with
+`numpy.load(path, mmap_mode="r")`, without numpy being a dependency. Row i of every event column describes
+the same event. Variable-length fields are stored as flat value columns with `<name>_offsets` columns:
+values of event i are `<name>[<name>_offsets[i]:<name>_offsets[i + 1]]`. Events of table j are rows
+`table_offsets[j]:table_offsets[j + 1]`, table IDs are listed in the manifest.
+"""
+
+import ast
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Self
+
+from core.exceptions.infrastructure_exception import InfrastructureException
+from game.common.game_event_columns import GameEventColumnsEncoder, GameEventRow
+from game.game_name import GameName
+
+from ..application.igame_event_repository import IGameEventRepository
+from ..domain.table_status import TableStatus
+
+ARCHIVE_FORMAT_VERSION = 1
+MANIFEST_FILE_NAME = "manifest.json"
+
+NPY_MAGIC = b"\x93NUMPY"
+NPY_HEADER_SIZE = 128  # fixed, so the header can be rewritten with the final shape after streaming the data
+
+COLUMN_BUFFER_SIZE = 65536  # values buffered per column before writing them to the file
+
+EXPORT_CHUNK_SIZE = 5000  # events fetched from the database at once
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveColumn:
+    name: str
+    typecode: str  # `array` module type code
+    descr: str  # NumPy dtype descriptor
+
+
+ARCHIVE_COLUMNS: tuple[ArchiveColumn, ...] = (
+    ArchiveColumn("table", "i", "<i4"),  # index of the table in the manifest
+    ArchiveColumn("seq", "i", "<i4"),
+    ArchiveColumn("type", "B", "|u1"),  # index of the event type in the manifest
+    ArchiveColumn("seat", "b", "|i1"),
+    ArchiveColumn("card", "b", "|i1"),
+    ArchiveColumn("bid", "h", "<i2"),
+    ArchiveColumn("cards_offsets", "q", "<i8"),
+    ArchiveColumn("cards", "b", "|i1"),
+    ArchiveColumn("points_offsets", "q", "<i8"),
+    ArchiveColumn("points", "i", "<i4"),
+    ArchiveColumn("table_offsets", "q", "<i8"),
+)
+
+
+def _npy_header(descr: str, length: int) -> bytes:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}"
+    header = header.ljust(NPY_HEADER_SIZE - len(NPY_MAGIC) - 4 - 1) + "\n"
+    return NPY_MAGIC + bytes((1, 0)) + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class _NpyColumnWriter:
+    def __init__(self, path: Path, column: ArchiveColumn):
+        self.column: ArchiveColumn = column
+        self.values: array[int] = array(column.typecode)
+        self.length: int = 0
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115 - kept open while streaming values
+        _ = self._file.write(_npy_header(column.descr, 0))
+
+    def flush(self) -> None:
+        if sys.byteorder != "little":
+            self.values.byteswap()
+        self.values.tofile(self._file)
+        self.length += len(self.values)
+        self.values = array(self.column.typecode)
+
+    def close(self) -> None:
+        self.flush()
+        _ = self._file.seek(0)
+        _ = self._file.write(_npy_header(self.column.descr, self.length))
+        self._file.close()
+
+
+class GameEventArchiveWriter:
+    """Streams rows of game events to a new archive directory, keeping only small column buffers in memory.
+    Events of a table must be added together, in sequence order."""
+
+    def __init__(self, path: Path, game_name: GameName, event_types: Sequence[str]):
+        self.path: Path = path
+        self.game_name: GameName = game_name
+        self.event_types: Sequence[str] = event_types
+        self.table_ids: list[str] = []
+        self.events_count: int = 0
+        self._cards_count: int = 0
+        self._points_count: int = 0
+
+        path.mkdir(parents=True, exist_ok=False)
+        self._columns: dict[str, _NpyColumnWriter] = {
+            column.name: _NpyColumnWriter(path / f"{column.name}.npy", column) for column in ARCHIVE_COLUMNS
+        }
+        self._columns["cards_offsets"].values.append(0)
+        self._columns["points_offsets"].values.append(0)
+        self._columns["table_offsets"].values.append(0)
+
+    def add_event(self, table_id: str, seq_number: int, row: GameEventRow) -> None:
+        columns = self._columns
+        if not self.table_ids or self.table_ids[-1] != table_id:
+            if self.table_ids:
+                columns["table_offsets"].values.append(self.events_count)
+            self.table_ids.append(table_id)
+
+        columns["table"].values.append(len(self.table_ids) - 1)
+        columns["seq"].values.append(seq_number)
+        columns["type"].values.append(row.type_code)
+        columns["seat"].values.append(row.seat)
+        columns["card"].values.append(row.card)
+        columns["bid"].values.append(row.bid)
+        columns["cards"].values.extend(row.cards)
+        self._cards_count += len(row.cards)
+        columns["cards_offsets"].values.append(self._cards_count)
+        columns["points"].values.extend(row.points)
+        self._points_count += len(row.points)
+        columns["points_offsets"].values.append(self._points_count)
+        self.events_count += 1
+
+        if len(columns["cards"].values) >= COLUMN_BUFFER_SIZE or len(columns["seq"].values) >= COLUMN_BUFFER_SIZE:
+            for column in columns.values():
+                column.flush()
+
+    def close(self, is_complete: bool = True) -> None:
+        """Writes final column headers and, for a complete archive, the manifest. Archives without
+        a manifest (e.g. after a failed export) can't be opened."""
+        if self.table_ids:
+            self._columns["table_offsets"].values.append(self.events_count)
+        for column in self._columns.values():
+            column.close()
+        if not is_complete:
+            return
+        manifest = {
+            "format_version": ARCHIVE_FORMAT_VERSION,
+            "game_name": self.game_name.value,
+            "event_types": list(self.event_types),
+            "tables": self.table_ids,
+            "events": self.events_count,
+            "columns": {column.name: column.descr for column in ARCHIVE_COLUMNS},
+        }
+        (self.path / MANIFEST_FILE_NAME).write_text(json.dumps(manifest))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close(is_complete=exc_type is None)
+
+
+class GameEventArchive:
+    """Read-only view of an archive, columns are memory-mapped, so opening an archive does not read its data.
+    Columns are memoryviews of integers, valid until the archive is closed."""
+
+    def __init__(self, path: Path):
+        self.path: Path = path
+        try:
+            self.manifest: dict[str, Any] = json.loads((path / MANIFEST_FILE_NAME).read_text())
+        except (OSError, ValueError) as e:
+            raise InfrastructureException(
+                detail=f"Could not open game event archive {path}: {e}", reason="game_event_archive_error"
+            ) from e
+        if self.manifest.get("format_version") != ARCHIVE_FORMAT_VERSION:
+            raise InfrastructureException(
+                detail=f"Could not open game event archive {path}: unsupported format {self.manifest.get('format_version')}",
+                reason="game_event_archive_error",
+            )
+        self._maps: list[mmap.mmap] = []
+        self.columns: dict[str, memoryview] = {column.name: self._map_column(column) for column in ARCHIVE_COLUMNS}
+
+    @property
+    def table_ids(self) -> Sequence[str]:
+        return self.manifest["tables"]
+
+    @property
+    def event_types(self) -> Sequence[str]:
+        return self.manifest["event_types"]
+
+    def __len__(self) -> int:
+        return self.manifest["events"]
+
+    def table_rows(self, table_index: int) -> range:
+        table_offsets = self.columns["table_offsets"]
+        return range(table_offsets[table_index], table_offsets[table_index + 1])
+
+    def cards(self, row: int) -> memoryview:
+        cards_offsets = self.columns["cards_offsets"]
+        return self.columns["cards"][cards_offsets[row] : cards_offsets[row + 1]]
+
+    def points(self, row: int) -> memoryview:
+        points_offsets = self.columns["points_offsets"]
+        return self.columns["points"][points_offsets[row] : points_offsets[row + 1]]
+
+    def _map_column(self, column: ArchiveColumn) -> memoryview:
+        column_path = self.path / f"{column.name}.npy"
+        with open(column_path, "rb") as file:
+            column_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(column_map)
+
+        if column_map[: len(NPY_MAGIC)] != NPY_MAGIC or column_map[len(NPY_MAGIC)] != 1:
+            raise InfrastructureException(
+                detail=f"Could not open archive column {column_path}: not a NPY 1.x file",
+                reason="game_event_archive_error",
+            )
+        (header_length,) = struct.unpack_from("<H", column_map, len(NPY_MAGIC) + 2)
+        data_offset = len(NPY_MAGIC) + 4 + header_length
+        header = ast.literal_eval(column_map[len(NPY_MAGIC) + 4 : data_offset].decode("latin1"))
+        if header["descr"] != column.descr or header["fortran_order"] or sys.byteorder != "little":
+            raise InfrastructureException(
+                detail=f"Could not open archive column {column_path}: unsupported layout {header}",
+                reason="game_event_archive_error",
+            )
+        (length,) = header["shape"]
+        data = memoryview(column_map)[data_offset:]
+        return data[: length * array(column.typecode).itemsize].cast(column.typecode)
+
+    def close(self) -> None:
+        for column in self.columns.values():
+            column.release()
+        for column_map in self._maps:
+            column_map.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+def export_game_events_archive(
+    game_event_repository: IGameEventRepository,
+    encoder: GameEventColumnsEncoder,
+    path: Path,
+    game_name: GameName,
+    table_ids: Collection[str] | None = None,
+    statuses: Collection[TableStatus] | None = (TableStatus.FINISHED,),
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> GameEventArchiveWriter:
+    """Writes events of tables of the game (finished ones by default) to a new archive at `path`.
+    Returns the closed writer, with the exported tables and events count."""
+    with GameEventArchiveWriter(path, game_name, encoder.event_types) as writer:
+        events = game_event_repository.iter_tables_events(game_name, table_ids, statuses, chunk_size=chunk_size)
+        for table_id, seq_number, data in events:
+            writer.add_event(table_id, seq_number, encoder.to_row(data))
+    return writer
@@ -1,28 +1,283 @@
-from typing import override
+import heapq
+from collections.abc import Collection, Iterator
+from datetime import datetime
+from typing import Any, override
 
-from django.db.models import QuerySet
+from django.db import transaction
+from django.db.models import Q
 
-from core.exceptions.not_exist_exception import NotExistException
 from core.exceptions.infrastructure_exception import InfrastructureException
+from core.exceptions.not_exist_exception import NotExistException
+from game.game_name import GameName
+
 from ..application.igame_event_repository import IGameEventRepository
-from ..models import GameEventModel
+from ..domain.table_status import ENDED_GAME_TABLE_STATUSES, TableStatus
+from ..models import (
+    ArchivedGameEventsModel,
+    ArchivedGameTableModel,
+    CompactedGameEventsModel,
+    GameEventModel,
+    GameTableModel,
+)
+from .payload_codec import PayloadCodec, pack_offsets, unpack_offsets
+
+COMPACTED_TABLES_CHUNK_SIZE = 20  # compacted tables (a few KB each) fetched at once while streaming many tables
 
 
 class GameEventRepository(IGameEventRepository):
+    """Game events are stored one row per event while the game is played. Events of ended games can be
+    compacted into a single row and later moved to the archive with their table, reads combine all transparently."""
+
+    def __init__(self, codec: PayloadCodec | None = None):
+        self.codec: PayloadCodec = codec or PayloadCodec()
+
     @override
     def find_many(
         self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None
-    ) -> QuerySet[GameEventModel]:
+    ) -> list[GameEventModel]:
         try:
-            query_set = GameEventModel.objects.filter(game_table_id=table_id)
-
-            if start_inclusive is not None:
-                query_set = query_set.filter(sequence_number__gte=start_inclusive)
-            if end_inclusive is not None:
-                query_set = query_set.filter(sequence_number__lte=end_inclusive)
-            return query_set
+            compacted_events = [
+                GameEventModel(game_table_id=table_id, sequence_number=data["seq_number"], data=data)
+                for data in self._read_compacted(table_id, start_inclusive, end_inclusive)
+            ]
+            return sorted(
+                [*compacted_events, *self._filter_rows(table_id, start_inclusive, end_inclusive)],
+                key=lambda event: event.sequence_number,
+            )
 
         except GameEventModel.DoesNotExist:
             raise NotExistException(reason="game_event_not_exist")
+        except InfrastructureException:
+            raise
         except Exception as e:
             raise InfrastructureException(detail=f"Could not find game events: {e}") from e
+
+    @override
+    def iter_data(
+        self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None, chunk_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        try:
+            # compacted events precede rows, rows are only added after compaction if it raced with the game ending
+            yield from self._read_compacted(table_id, start_inclusive, end_inclusive)
+            query_set = self._filter_rows(table_id, start_inclusive, end_inclusive)
+            yield from query_set.values_list("data", flat=True).iterator(chunk_size=chunk_size)
+        except InfrastructureException:
+            raise
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not stream game events: {e}") from e
+
+    @override
+    def iter_tables_events(
+        self,
+        game_name: GameName,
+        table_ids: Collection[str] | None = None,
+        statuses: Collection[TableStatus] | None = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple[str, int, dict[str, Any]]]:
+        try:
+            table_filter = Q(game_table__game_name=game_name.value)
+            if table_ids is not None:
+                table_filter &= Q(game_table_id__in=table_ids)
+            if statuses:
+                table_filter &= Q(game_table__status__in=[status.value for status in statuses])
+
+            # both streams are sorted by table ID and sequence number, so they merge without buffering
+            yield from heapq.merge(
+                self._iter_rows_of_tables(table_filter, chunk_size),
+                self._iter_compacted_of_tables(CompactedGameEventsModel, table_filter),
+                self._iter_compacted_of_tables(ArchivedGameEventsModel, table_filter),
+                key=lambda event: (event[0], event[1]),
+            )
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not stream game events of tables: {e}") from e
+
+    @override
+    def find_table_ids_to_compact(self, limit: int) -> list[str]:
+        try:
+            table_ids = (
+                GameEventModel.objects.filter(
+                    game_table__status__in=[status.value for status in ENDED_GAME_TABLE_STATUSES]
+                )
+                .order_by()
+                .values_list("game_table_id", flat=True)
+                .distinct()[:limit]
+            )
+            return [str(table_id) for table_id in table_ids]
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not find game tables to compact: {e}") from e
+
+    @override
+    @transaction.atomic
+    def compact(self, table_id: str) -> int:
+        try:
+            # ended games get no more events, the lock keeps compaction and archiving of the table apart
+            db_game_table = GameTableModel.objects.select_for_update().get(id=table_id)
+            if TableStatus(db_game_table.status) not in ENDED_GAME_TABLE_STATUSES:
+                return 0
+
+            rows_count, events = self._read_all_of_table(table_id)
+            if not rows_count:
+                return 0
+
+            data, offsets = self.codec.encode_sequence(events)
+            _ = CompactedGameEventsModel.objects.update_or_create(
+                game_table_id=table_id,
+                defaults={
+                    "first_sequence_number": events[0]["seq_number"],
+                    "events_count": len(events),
+                    "data": data,
+                    "offsets": pack_offsets(offsets),
+                },
+            )
+            _ = GameEventModel.objects.filter(game_table_id=table_id).delete()
+            return rows_count
+
+        except GameTableModel.DoesNotExist:
+            raise NotExistException(reason="game_table_not_exist")
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not compact game events: {e}") from e
+
+    @override
+    def find_table_ids_to_archive(self, limit: int, ended_before: datetime) -> list[str]:
+        try:
+            table_ids = (
+                GameTableModel.objects.filter(
+                    status__in=[status.value for status in ENDED_GAME_TABLE_STATUSES], updated_at__lt=ended_before
+                )
+                .order_by("updated_at")
+                .values_list("id", flat=True)[:limit]
+            )
+            return [str(table_id) for table_id in table_ids]
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not find game tables to archive: {e}") from e
+
+    @override
+    @transaction.atomic
+    def archive(self, table_id: str) -> int:
+        try:
+            # ended games get no more events, the lock keeps compaction and archiving of the table apart
+            db_game_table = GameTableModel.objects.select_for_update().get(id=table_id)
+            if TableStatus(db_game_table.status) not in ENDED_GAME_TABLE_STATUSES:
+                return 0
+
+            _, events = self._read_all_of_table(table_id)
+            db_archived_game_table = ArchivedGameTableModel.objects.create(
+                id=db_game_table.id,
+                game_name=db_game_table.game_name,
+                status=db_game_table.status,
+                owner_id=db_game_table.owner_id,
+                created_at=db_game_table.created_at,
+                updated_at=db_game_table.updated_at,
+                snapshot=db_game_table.snapshot,
+                packed_snapshot=db_game_table.packed_snapshot,
+                version=db_game_table.version,
+                lobby=db_game_table.lobby,
+            )
+            if events:
+                data, offsets = self.codec.encode_sequence(events)
+                _ = ArchivedGameEventsModel.objects.create(
+                    game_table=db_archived_game_table,
+                    first_sequence_number=events[0]["seq_number"],
+                    events_count=len(events),
+                    data=data,
+                    offsets=pack_offsets(offsets),
+                )
+            # players, configs, event rows and compacted events are deleted with the table
+            _ = GameTableModel.objects.filter(id=table_id).delete()
+            return len(events)
+
+        except GameTableModel.DoesNotExist:
+            raise NotExistException(reason="game_table_not_exist")
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not archive game table: {e}") from e
+
+    def _read_all_of_table(self, table_id: str) -> tuple[int, list[dict[str, Any]]]:
+        """Returns the number of events stored one row per event and all events of the table"""
+        rows = list(
+            GameEventModel.objects.filter(game_table_id=table_id)
+            .order_by("sequence_number")
+            .values_list("data", flat=True)
+        )
+        return len(rows), [*self._read_compacted(table_id), *rows]
+
+    def _filter_rows(self, table_id: str, start_inclusive: int | None, end_inclusive: int | None):
+        query_set = GameEventModel.objects.filter(game_table_id=table_id)
+        if start_inclusive is not None:
+            query_set = query_set.filter(sequence_number__gte=start_inclusive)
+        if end_inclusive is not None:
+            query_set = query_set.filter(sequence_number__lte=end_inclusive)
+        return query_set
+
+    def _read_compacted(
+        self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None
+    ) -> list[dict[str, Any]]:
+        # events of a table are either compacted or archived, both are looked up in one query
+        fields = ("first_sequence_number", "events_count", "data", "offsets")
+        compacted = list(
+            CompactedGameEventsModel.objects.filter(game_table_id=table_id)
+            .values_list(*fields)
+            .union(ArchivedGameEventsModel.objects.filter(game_table_id=table_id).values_list(*fields), all=True)
+        )
+        if not compacted:
+            return []
+        return self._decode_compacted(*compacted[0], start_inclusive, end_inclusive)
+
+    def _decode_compacted(
+        self,
+        first_sequence_number: int,
+        events_count: int,
+        data: bytes | memoryview,
+        offsets: bytes | memoryview,
+        start_inclusive: int | None = None,
+        end_inclusive: int | None = None,
+    ) -> list[dict[str, Any]]:
+        # sequence numbers of compacted events are consecutive, so positions of the range are known upfront
+        start = max((start_inclusive or 0) - first_sequence_number, 0)
+        end = events_count if end_inclusive is None else min(end_inclusive - first_sequence_number + 1, events_count)
+        if start >= end:
+            return []
+        return self.codec.decode_sequence(data, unpack_offsets(offsets), start, end)
+
+    def _iter_rows_of_tables(self, table_filter: Q, chunk_size: int) -> Iterator[tuple[str, int, dict[str, Any]]]:
+        rows_query_set = (
+            GameEventModel.objects.filter(table_filter)
+            .order_by("game_table_id", "sequence_number")
+            .values_list("game_table_id", "sequence_number", "data")
+        )
+        # continues after the last row instead of using offsets, so chunks are range scans of the (table, seq) index
+        last_table_id, last_sequence_number = None, None
+        while True:
+            page = rows_query_set
+            if last_table_id is not None:
+                page = page.filter(
+                    Q(game_table_id__gt=last_table_id)
+                    | Q(game_table_id=last_table_id, sequence_number__gt=last_sequence_number)
+                )
+            rows = list(page[:chunk_size])
+            for table_id, sequence_number, data in rows:
+                yield str(table_id), sequence_number, data
+            if len(rows) < chunk_size:
+                return
+            last_table_id, last_sequence_number, _ = rows[-1]
+
+    def _iter_compacted_of_tables(
+        self, model: type[CompactedGameEventsModel | ArchivedGameEventsModel], table_filter: Q
+    ) -> Iterator[tuple[str, int, dict[str, Any]]]:
+        # archived events reference archived tables, which have the same fields as tables filtered by `table_filter`
+        compacted_query_set = (
+            model.objects.filter(table_filter)
+            .order_by("game_table_id")
+            .values_list("game_table_id", "first_sequence_number", "events_count", "data", "offsets")
+        )
+        last_table_id = None
+        while True:
+            page = compacted_query_set
+            if last_table_id is not None:
+                page = page.filter(game_table_id__gt=last_table_id)
+            compacted_tables = list(page[:COMPACTED_TABLES_CHUNK_SIZE])
+            for table_id, *compacted in compacted_tables:
+                for data in self._decode_compacted(*compacted):
+                    yield str(table_id), data["seq_number"], data
+            if len(compacted_tables) < COMPACTED_TABLES_CHUNK_SIZE:
+                return
+            last_table_id = compacted_tables[-1][0]
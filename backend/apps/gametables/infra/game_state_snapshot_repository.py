@@ -1,60 +1,106 @@
 from collections.abc import Mapping, Sequence
-import json
 import logging
 from typing import Any, override
 from redis import Redis
+from redis.commands.core import Script
 
 from core.exceptions.infrastructure_exception import InfrastructureException
 from ..application.igame_state_snapshot_repository import IGameStateSnapshotRepository
+from .payload_codec import PayloadCodec
 
 logger = logging.getLogger(__name__)
 
+# KEYS[1] - exact snapshot key, KEYS[2] - index of snapshots, ARGV[1] - event number, ARGV[2] - deltas key prefix.
+# Returns {is_exact, snapshot event number, snapshot, deltas} or nil if there is no snapshot at or before the event.
+# Nearest snapshot and deltas keys are read from the index inside the script, so it needs all keys of a table
+# on one node (as with a single Redis instance).
+GET_EXACT_OR_NEAREST_SNAPSHOT_SCRIPT = """
+local exact_snapshot = redis.call("GET", KEYS[1])
+if exact_snapshot then
+    return {1, ARGV[1], exact_snapshot, false}
+end
+local nearest = redis.call("ZREVRANGEBYSCORE", KEYS[2], ARGV[1], "-inf", "WITHSCORES", "LIMIT", 0, 1)
+if #nearest == 0 then
+    return false
+end
+return {0, nearest[2], redis.call("GET", nearest[1]), redis.call("GET", ARGV[2] .. nearest[2])}
+"""
+
 
 class GameStateSnapshotRepository(IGameStateSnapshotRepository):
-    def __init__(self, redis_conn: Redis):
+    def __init__(self, redis_conn: Redis, codec: PayloadCodec | None = None):
         self.redis: Redis = redis_conn
+        self.codec: PayloadCodec = codec or PayloadCodec()
         self.prefix: str = "game_state_snapshot"
         self.ttl_in_seconds: int = 60 * 60 * 6  # 6 hours
+        # loaded to Redis on the first call, called by its SHA afterwards
+        self._get_exact_or_nearest_snapshot_script: Script = self.redis.register_script(
+            GET_EXACT_OR_NEAREST_SNAPSHOT_SCRIPT
+        )
 
     def _make_key(self, table_id: str, event_number: int) -> str:
         return f"{self.prefix}:{table_id}:{event_number}"
 
+    def _make_index_key(self, table_id: str) -> str:
+        # zset of snapshot keys scored by event number, to find the nearest snapshot to desired one
+        return f"index:zset:table_id:{table_id}"
+
+    def _make_deltas_key_prefix(self, table_id: str) -> str:
+        return f"{self.prefix}_deltas:{table_id}:"
+
+    def _make_deltas_key(self, table_id: str, keyframe_event_number: int) -> str:
+        return f"{self._make_deltas_key_prefix(table_id)}{keyframe_event_number}"
+
+    def _encode_deltas(self, raw_deltas: Sequence[dict[str, Any]]) -> bytes:
+        # events following a keyframe are stored as one list, their sequence numbers are implied
+        # by positions in the list
+        return self.codec.encode(
+            [{key: value for key, value in data.items() if key != "seq_number"} for data in raw_deltas]
+        )
+
+    def _decode_deltas(self, raw: bytes, keyframe_event_number: int) -> list[dict[str, Any]]:
+        return [
+            {**data, "seq_number": keyframe_event_number + position}
+            for position, data in enumerate(self.codec.decode(raw), start=1)
+        ]
+
     @override
     def get_exact_or_nearest_snapshot_data(self, table_id: str, event_number: int = 0) -> Mapping[str, Any] | None:
         try:
-            # attempt to get exact snapshot
-            exact_key = self._make_key(table_id, event_number)
-            raw_exact_snapshot = self.redis.get(exact_key)
-
-            if raw_exact_snapshot:
-                return {
-                    "is_exact": True,
-                    "snapshot": json.loads(raw_exact_snapshot),
-                }
+            # exact snapshot, or nearest preceding one along with deltas following it, in a single round trip
+            result = self._get_exact_or_nearest_snapshot_script(
+                keys=[self._make_key(table_id, event_number), self._make_index_key(table_id)],
+                args=[event_number, self._make_deltas_key_prefix(table_id)],
+            )
 
-            # attempt to find a key for neareast snapshot to the desired one
-            zset_key = f"index:zset:table_id:{table_id}"
-            nearest_keys = self.redis.zrevrangebyscore(name=zset_key, max=event_number, min="-inf", start=0, num=1)
-
-            if not nearest_keys:
+            if not result:
                 return None
 
-            nearest_key = nearest_keys[0].decode() if isinstance(nearest_keys[0], bytes) else nearest_keys[0]
-            raw_nearest_snapshot = self.redis.get(nearest_key)
+            is_exact, raw_snapshot_event_number, raw_snapshot, raw_deltas = result
+            snapshot_event_number = int(raw_snapshot_event_number)
 
-            if not raw_nearest_snapshot:
+            if not raw_snapshot:
                 logger.error(f"Could not find game_state snapshot for table {table_id} and event number {event_number}")
                 return None
 
-            return {"is_exact": False, "snapshot": json.loads(raw_nearest_snapshot)}
+            return {
+                "is_exact": bool(is_exact),
+                "snapshot": self.codec.decode(raw_snapshot),
+                "deltas": self._decode_deltas(raw_deltas, snapshot_event_number) if raw_deltas else [],
+            }
 
         except Exception as e:
             logger.error(f"Unexpected error getting snapshot for table {table_id}, event {event_number}", exc_info=True)
             raise InfrastructureException(detail=f"Unexpected error: {e}", reason="unexpected_error") from e
 
     @override
-    def store(self, table_id: str, raw_snapshots: Sequence[dict[str, Any]]) -> None:
-        if not raw_snapshots:
+    def store(
+        self,
+        table_id: str,
+        raw_snapshots: Sequence[dict[str, Any]],
+        raw_deltas_by_keyframe: Mapping[int, Sequence[dict[str, Any]]] | None = None,
+    ) -> None:
+        if not raw_snapshots and not raw_deltas_by_keyframe:
             return
 
         # batch mode
@@ -62,13 +108,17 @@ class GameStateSnapshotRepository(IGameStateSnapshotRepository):
             with self.redis.pipeline(transaction=False) as pipe:
                 for data in raw_snapshots:
                     key = self._make_key(table_id, event_number=data["event_number"])
-                    _ = pipe.set(key, json.dumps(data), ex=self.ttl_in_seconds)
+                    _ = pipe.set(key, self.codec.encode(data), ex=self.ttl_in_seconds)
 
                     # add zset index so we can find the nearest snapshot to desired one by event_number
-                    zset_key = f"index:zset:table_id:{table_id}"
+                    zset_key = self._make_index_key(table_id)
                     _ = pipe.zadd(zset_key, {key: data["event_number"]})
                     _ = pipe.expire(zset_key, self.ttl_in_seconds)
 
+                for keyframe_event_number, raw_deltas in (raw_deltas_by_keyframe or {}).items():
+                    deltas_key = self._make_deltas_key(table_id, keyframe_event_number)
+                    _ = pipe.set(deltas_key, self._encode_deltas(raw_deltas), ex=self.ttl_in_seconds)
+
                 _ = pipe.execute()
         except Exception as e:
             logger.error(f"Unexpected error storing snapshots for table {table_id}", exc_info=True)
@@ -1,6 +1,7 @@
 from typing import Any
 
 from ..registries.game_classes import get_game_class
+from ..registries.game_state_codecs import get_game_state_codec
 from ..domain.table_status import TableStatus
 from ..registries.table_config_parsers import get_table_config_parser
 from ..registries.game_config_parsers import get_game_config_parser
@@ -50,8 +51,12 @@ class GameTableDeserializer:
             status=TableStatus(data["status"]),
         )
 
-        if data["game_state"]:
-            table._game_state = get_game_class(config.game_name).from_dict(data["game_state"])
+        raw_game_state = data["game_state"]
+        if isinstance(raw_game_state, list):
+            table._game_state = get_game_state_codec(config.game_name).decode(raw_game_state)
+        elif raw_game_state:
+            # snapshots stored before the compact codec was introduced
+            table._game_state = get_game_class(config.game_name).from_dict(raw_game_state)
 
         for pdata in data["players"]:
             player = GameTableDeserializer._deserialize_player(pdata, config.game_name)
@@ -1,12 +1,23 @@
-from typing import Callable, override
+import logging
+import random
+import threading
+import time
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar, override
 from collections.abc import Sequence
-from django.db import transaction
-from django.db.models import QuerySet
+from uuid import uuid4
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
 from django.utils import timezone
+from redis.exceptions import RedisError
+from core.cache.lru_cache import LruCache
+from core.exceptions.app_exception import AppException
 from core.exceptions.not_exist_exception import NotExistException
 from core.exceptions.infrastructure_exception import InfrastructureException
 from game.common.game_event import GameEvent
 from ..models import (
+    ArchivedGameTableModel,
     GameEventModel,
     GameTableModel,
     PlayerModel,
@@ -14,39 +25,136 @@ from ..models import (
     GameConfigModel,
 )
 from ..application.igame_table_repository import IGameTableRepository
+from ..application.itable_lease_repository import ITableLeaseRepository, TableLeaseAcquisition
 from ..domain.game_table import GameTable
+from ..domain.table_status import ENDED_GAME_TABLE_STATUSES, TableStatus
+from ..registries.game_event_parsers import get_game_event_parser
 from .game_table_deserializer import GameTableDeserializer
+from .game_table_serializer import GameTableSerializer
+from .payload_codec import PayloadCodec
+
+logger = logging.getLogger(__name__)
+
+HOT_TABLES_CACHE_SIZE = 1024
+HOT_TABLES_CACHE_TTL_SECONDS = 60 * 60
+SNAPSHOT_INTERVAL_EVENTS = 50  # events of a hot table stored at most before its snapshot is stored again
+MODIFY_ATTEMPTS = 5  # attempts to load, modify and store a table modified concurrently
+MODIFY_RETRY_BACKOFF_SECONDS = 0.005  # upper bound of random delay before an attempt, multiplied by attempts made
+
+LOBBY_FIELDS = ("id", "game_name", "status", "owner_id", "created_at", "updated_at", "lobby")
+
+T = TypeVar("T")
+
+
+class _StaleGameTableVersion(Exception):
+    """Raised inside a transaction to roll it back when the table was stored by someone else after it was loaded"""
+
+
+@dataclass(slots=True)
+class _HotTable:
+    game_table: GameTable
+    persisted_event_number: int  # event number of the game state in the stored snapshot
+    version: int  # version of the stored snapshot
+    lock: threading.Lock = field(default_factory=threading.Lock)  # game actions of the table in this process
 
 
 class GameTableRepository(IGameTableRepository):
+    """Tables are stored as versioned snapshots, game actions append events. Modifications are optimistic:
+    a table is loaded and modified without locks, and stored only if its version is unchanged. Appended events
+    are guarded by the unique (table, sequence number) constraint. Conflicting modifications are repeated
+    on top of the stored table.
+
+    With a lease repository, the process holding the lease of a table in progress keeps the table in memory
+    and applies game actions to it: a game action stores only its events, the snapshot is stored at round ends,
+    when the status changes and every `snapshot_interval_events` events. Snapshots lagging behind events
+    are caught up from the event log when tables are loaded. Other processes modify stored tables as without
+    the lease, after which the owner's next insert or snapshot conflicts, and the owner drops its copy."""
+
+    def __init__(
+        self,
+        codec: PayloadCodec | None = None,
+        table_lease_repository: ITableLeaseRepository | None = None,
+        snapshot_interval_events: int = SNAPSHOT_INTERVAL_EVENTS,
+    ):
+        self.codec: PayloadCodec = codec or PayloadCodec()
+        self.table_lease_repository: ITableLeaseRepository | None = table_lease_repository
+        self.snapshot_interval_events: int = snapshot_interval_events
+        self._lease_owner: str = uuid4().hex  # repositories are per-process singletons
+        self.conflicts: int = 0  # modifications repeated because the table was modified concurrently
+        self._hot_tables: LruCache[str, _HotTable] = LruCache(
+            max_size=HOT_TABLES_CACHE_SIZE, ttl_seconds=HOT_TABLES_CACHE_TTL_SECONDS
+        )
+
+    def _deserialize_table(self, db_game_table: GameTableModel | ArchivedGameTableModel) -> GameTable:
+        if db_game_table.packed_snapshot is not None:
+            return GameTableDeserializer.deserialize_table(self.codec.decode(db_game_table.packed_snapshot))
+        return GameTableDeserializer.deserialize_table(db_game_table.snapshot)
+
+    def _load_table(self, db_game_table: GameTableModel) -> GameTable:
+        game_table = self._deserialize_table(db_game_table)
+        if game_table.status != TableStatus.IN_PROGRESS:
+            return game_table
+
+        # snapshots of hot tables are not stored after every game action
+        raw_events = list(
+            GameEventModel.objects.filter(
+                game_table_id=db_game_table.id, sequence_number__gt=game_table.game_state.event_number
+            )
+            .order_by("sequence_number")
+            .values_list("data", flat=True)
+        )
+        if raw_events:
+            parser = get_game_event_parser(game_table.config.game_name)
+            game_table.apply_stored_events(parser.parse_many(raw_events))
+        return game_table
+
+    def _acquire_lease(self, table_id: str) -> TableLeaseAcquisition:
+        if self.table_lease_repository is None:
+            return TableLeaseAcquisition.REJECTED
+        try:
+            return self.table_lease_repository.acquire(table_id, self._lease_owner)
+        except RedisError as e:
+            # tables can always be modified under the row lock, the lease only enables the in-memory copy
+            logger.warning(f"Could not acquire lease of game table {table_id}: {e}")
+            return TableLeaseAcquisition.REJECTED
+
+    def _release_lease(self, table_id: str) -> None:
+        self._hot_tables.discard(table_id)
+        if self.table_lease_repository is None:
+            return
+        try:
+            self.table_lease_repository.release(table_id, self._lease_owner)
+        except RedisError as e:
+            logger.warning(f"Could not release lease of game table {table_id}: {e}")
+
     @transaction.atomic
     @override
     def create(self, game_table: GameTable) -> str:
         try:
             # Create game table
+            serialized_table = GameTableSerializer.serialize_table(game_table)
             db_game_table = GameTableModel.objects.create(
                 id=game_table.id,
                 game_name=game_table.config.game_name.value,
                 status=game_table.status.value,
                 owner_id=game_table.owner_id,
-                snapshot=game_table.to_dict(),
+                packed_snapshot=self.codec.encode(serialized_table),
+                lobby=GameTableSerializer.serialize_lobby(serialized_table),
             )
 
-            # Create game configs
-            for config_key, value in game_table.config.table_config.to_dict().items():
-                _ = TableConfigModel.objects.create(
-                    game_table=db_game_table,
-                    config_key=config_key,
-                    value=value,
-                )
-
-            # Create game configs
-            for config_key, value in game_table.config.game_config.to_dict().items():
-                _ = GameConfigModel.objects.create(
-                    game_table=db_game_table,
-                    config_key=config_key,
-                    value=value,
-                )
+            # Create table and game configs
+            _ = TableConfigModel.objects.bulk_create(
+                [
+                    TableConfigModel(game_table=db_game_table, config_key=config_key, value=value)
+                    for config_key, value in game_table.config.table_config.to_dict().items()
+                ]
+            )
+            _ = GameConfigModel.objects.bulk_create(
+                [
+                    GameConfigModel(game_table=db_game_table, config_key=config_key, value=value)
+                    for config_key, value in game_table.config.game_config.to_dict().items()
+                ]
+            )
         # No GameTablePlayers creation, because there is no players at the moment when table is created
 
         except Exception as e:
@@ -55,71 +163,190 @@ class GameTableRepository(IGameTableRepository):
         return game_table.id
 
     @override
-    @transaction.atomic
     def modify_during_game_action(
         self, table_id: str, modifier: Callable[[GameTable], Sequence[GameEvent]]
     ) -> tuple[Sequence[GameEvent], GameTable]:
-        try:
-            db_game_table = GameTableModel.objects.select_for_update().get(id=table_id)
-            game_table = GameTableDeserializer.deserialize_table(db_game_table.snapshot)
+        lease = self._acquire_lease(table_id)
+        hot_table = self._hot_tables.get(table_id) if lease == TableLeaseAcquisition.RENEWED else None
+        if hot_table is not None:
+            with hot_table.lock:
+                # another thread could have dropped the table while this one was waiting
+                if self._hot_tables.get(table_id) is hot_table:
+                    game_state, status = hot_table.game_table.game_state, hot_table.game_table.status
+                    try:
+                        return self._modify_hot_during_game_action(hot_table, modifier)
+                    except (IntegrityError, _StaleGameTableVersion):
+                        # the table was modified by another process, the action is repeated on the stored table below
+                        logger.info(f"Game table {table_id} in memory is outdated, releasing its lease")
+                        self._release_lease(table_id)
+                        lease = TableLeaseAcquisition.REJECTED
+                    except AppException:
+                        # actions rejected before changing the table (e.g. not the player's turn) leave it valid,
+                        # others could have changed it partially, e.g. a human move followed by a failed bot turn
+                        game_table = hot_table.game_table
+                        if game_table.game_state is not game_state or game_table.status != status:
+                            self._hot_tables.discard(table_id)
+                        raise
+                    except Exception:
+                        # the table in memory could be modified partially
+                        self._hot_tables.discard(table_id)
+                        raise
 
-            events = modifier(game_table)  # mutates game_table and returns sequence of game events
+        events, game_table, version = self._retry_on_conflict(
+            table_id, lambda: self._modify_stored_during_game_action(table_id, modifier)
+        )
+        if lease != TableLeaseAcquisition.REJECTED:
+            if game_table.status == TableStatus.IN_PROGRESS:
+                self._hot_tables.put(table_id, _HotTable(game_table, game_table.game_state.event_number, version))
+            else:
+                self._release_lease(table_id)
+        return events, game_table
 
-            # appending events logic
-            rows = []
+    def _modify_hot_during_game_action(
+        self, hot_table: _HotTable, modifier: Callable[[GameTable], Sequence[GameEvent]]
+    ) -> tuple[Sequence[GameEvent], GameTable]:
+        game_table = hot_table.game_table
+        status = game_table.status
 
-            for event in events:
-                rows.append(
-                    GameEventModel(game_table=db_game_table, sequence_number=event.seq_number, data=event.to_dict())
-                )
+        events = modifier(game_table)  # mutates game_table and returns sequence of game events
+        if not events and game_table.status == status:
+            return events, game_table
 
-            _ = GameEventModel.objects.bulk_create(rows)
+        game_state = game_table.game_state
+        should_store_snapshot = (
+            game_table.status != status
+            # a round ended since the stored snapshot, the next round may already be dealt within the same action
+            or game_state.replay_safe_event_number > hot_table.persisted_event_number
+            or game_state.event_number - hot_table.persisted_event_number >= self.snapshot_interval_events
+        )
+        with transaction.atomic():
+            _ = GameEventModel.objects.bulk_create(
+                [
+                    GameEventModel(game_table_id=game_table.id, sequence_number=event.seq_number, data=event.to_dict())
+                    for event in events
+                ]
+            )
+            if should_store_snapshot:
+                self._store_snapshot(game_table, hot_table.version)
 
-            db_game_table.snapshot = game_table.to_dict()
-            db_game_table.status = game_table.status.value
-            db_game_table.updated_at = timezone.now()
-            db_game_table.save(update_fields=["snapshot", "status", "updated_at"])
+        if should_store_snapshot:
+            hot_table.persisted_event_number = game_state.event_number
+            hot_table.version += 1
+        if game_table.status != TableStatus.IN_PROGRESS:
+            self._release_lease(game_table.id)
+        return events, game_table
 
-            return events, game_table
+    def _modify_stored_during_game_action(
+        self, table_id: str, modifier: Callable[[GameTable], Sequence[GameEvent]]
+    ) -> tuple[Sequence[GameEvent], GameTable, int]:
+        db_game_table = self._get_model(table_id)
+        game_table = self._load_table(db_game_table)
 
-        except GameTableModel.DoesNotExist:
-            raise NotExistException(reason="game_table_not_exist")
+        events = modifier(game_table)  # mutates game_table and returns sequence of game events
+
+        with transaction.atomic():
+            # events are appended first, the (table, sequence number) constraint rejects events stored concurrently
+            _ = GameEventModel.objects.bulk_create(
+                [
+                    GameEventModel(game_table_id=table_id, sequence_number=event.seq_number, data=event.to_dict())
+                    for event in events
+                ]
+            )
+            self._store_snapshot(game_table, db_game_table.version)
+
+        return events, game_table, db_game_table.version + 1
 
     @override
-    @transaction.atomic
     def modify(self, table_id: str, modifier: Callable[[GameTable], None]) -> GameTable:
-        try:
-            db_game_table = GameTableModel.objects.select_for_update().get(id=table_id)
-            game_table = GameTableDeserializer.deserialize_table(db_game_table.snapshot)
-
-            modifier(game_table)  # mutates game_table
-
-            # deletes all players from the table and reinserts new ones
-            _ = PlayerModel.objects.filter(game_table_id=game_table.id).delete()
-            for player in game_table.players:
-                _ = PlayerModel.objects.create(
-                    game_table_id=game_table.id,
-                    user_id=player.user_id,
-                    screen_name=player.screen_name,
-                    bot_strategy_kind=player.bot_strategy.kind.value if player.bot_strategy else None,
+        self._hot_tables.discard(table_id)
+        return self._retry_on_conflict(table_id, lambda: self._modify_stored(table_id, modifier))
+
+    def _modify_stored(self, table_id: str, modifier: Callable[[GameTable], None]) -> GameTable:
+        db_game_table = self._get_model(table_id)
+        game_table = self._load_table(db_game_table)
+        # player rows are stored together with snapshots, so they match players of the loaded table
+        stored_player_rows = self._player_rows(game_table)
+
+        modifier(game_table)  # mutates game_table
+
+        player_rows = self._player_rows(game_table)
+        removed_player_rows = stored_player_rows - player_rows
+        added_player_rows = player_rows - stored_player_rows
+        with transaction.atomic():
+            if removed_player_rows:
+                # screen names are unique per table
+                _ = PlayerModel.objects.filter(
+                    game_table_id=table_id, screen_name__in=[screen_name for _, screen_name, _ in removed_player_rows]
+                ).delete()
+            if added_player_rows:
+                _ = PlayerModel.objects.bulk_create(
+                    [
+                        PlayerModel(
+                            game_table_id=table_id,
+                            user_id=user_id,
+                            screen_name=screen_name,
+                            bot_strategy_kind=bot_strategy_kind,
+                        )
+                        for user_id, screen_name, bot_strategy_kind in added_player_rows
+                    ]
                 )
 
             # configs do not change during the game_table's life cycle, so we do not need to update them
 
-            db_game_table.snapshot = game_table.to_dict()
-            db_game_table.status = game_table.status.value
-            db_game_table.updated_at = timezone.now()
-            db_game_table.save(update_fields=["snapshot", "status", "updated_at"])
+            self._store_snapshot(game_table, db_game_table.version, with_lobby=True)
 
-            return game_table
+        return game_table
+
+    def _player_rows(self, game_table: GameTable) -> set[tuple[int | None, str, str | None]]:
+        return {
+            (player.user_id, player.screen_name, player.bot_strategy.kind.value if player.bot_strategy else None)
+            for player in game_table.players
+        }
 
+    def _get_model(self, table_id: str) -> GameTableModel:
+        try:
+            return GameTableModel.objects.get(id=table_id)
         except GameTableModel.DoesNotExist:
             raise NotExistException(reason="game_table_not_exist")
 
+    def _store_snapshot(self, game_table: GameTable, version: int, with_lobby: bool = False) -> None:
+        """Stores the table if it's still at the version it was loaded at, otherwise rolls back the transaction.
+        The lobby projection is stored only when players may have changed, game actions don't change it."""
+        serialized_table = GameTableSerializer.serialize_table(game_table)
+        lobby_fields = {"lobby": GameTableSerializer.serialize_lobby(serialized_table)} if with_lobby else {}
+        updated = GameTableModel.objects.filter(id=game_table.id, version=version).update(
+            snapshot=None,
+            packed_snapshot=self.codec.encode(serialized_table),
+            status=game_table.status.value,
+            updated_at=timezone.now(),
+            version=version + 1,
+            **lobby_fields,
+        )
+        if not updated:
+            raise _StaleGameTableVersion(f"game table {game_table.id} is not at version {version}")
+
+    def _retry_on_conflict(self, table_id: str, modification: Callable[[], T]) -> T:
+        # the table is loaded and modified again on top of the concurrent modification
+        attempt = 1
+        while True:
+            try:
+                return modification()
+            except (IntegrityError, _StaleGameTableVersion) as e:
+                self.conflicts += 1
+                if attempt == MODIFY_ATTEMPTS:
+                    raise InfrastructureException(
+                        detail=f"Could not modify game table {table_id}: modified concurrently, {attempt} attempts made",
+                        reason="game_table_modified_concurrently",
+                    ) from e
+                time.sleep(random.uniform(0, MODIFY_RETRY_BACKOFF_SECONDS * attempt))
+                attempt += 1
+
     @override
     def delete(self, id: str) -> None:
+        self._release_lease(id)
         try:
             _ = GameTableModel.objects.filter(id=id).delete()
+            _ = ArchivedGameTableModel.objects.filter(id=id).delete()
         except GameTableModel.DoesNotExist:
             # table already deleted
             return None
@@ -129,25 +356,74 @@ class GameTableRepository(IGameTableRepository):
         try:
             db_game_table = GameTableModel.objects.get(id=id)
         except GameTableModel.DoesNotExist:
-            raise NotExistException(reason="game_table_not_exist")
+            return self._find_archived_by_id(id)
         except Exception as e:
             raise InfrastructureException(detail=f"Could not find game table by id: {e}") from e
-        return GameTableDeserializer.deserialize_table(db_game_table.snapshot)
+        return self._load_table(db_game_table)
 
     @override
-    def find_many(self, filters: dict[str, set[str]]) -> QuerySet[GameTableModel]:
+    def exists(self, id: str) -> bool:
         try:
-            query_set = (
-                GameTableModel.objects.select_related("owner")
-                .prefetch_related("players", "game_configs", "table_configs")
-                .order_by("-created_at")
+            return (
+                GameTableModel.objects.filter(id=id).exists() or ArchivedGameTableModel.objects.filter(id=id).exists()
             )
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not check if game table exists: {e}") from e
+
+    def _find_archived_by_id(self, id: str) -> GameTable:
+        try:
+            db_archived_game_table = ArchivedGameTableModel.objects.get(id=id)
+        except ArchivedGameTableModel.DoesNotExist:
+            raise NotExistException(reason="game_table_not_exist")
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not find archived game table by id: {e}") from e
+        # games of archived tables are ended, their snapshots are stored after the last event
+        return self._deserialize_table(db_archived_game_table)
 
-            # apply filters
-            if "status" in filters and filters["status"]:
-                query_set = query_set.filter(status__in=filters["status"])
-            if "game_name" in filters and filters["game_name"]:
-                query_set = query_set.filter(game_name__in=filters["game_name"])
-            return query_set.all()
+    @override
+    def find_many(self, filters: dict[str, set[str]]) -> QuerySet[Any, dict[str, Any]]:
+        try:
+            query_set = self._filter_lobby(GameTableModel.objects.all(), filters)
+            if self._includes_archive(filters):
+                query_set = query_set.union(self._filter_lobby(ArchivedGameTableModel.objects.all(), filters), all=True)
+            return query_set.order_by("-created_at", "-id")
         except Exception as e:
             raise InfrastructureException(detail=f"Could not find game tables by filters: {e}") from e
+
+    @override
+    def find_page(
+        self, filters: dict[str, set[str]], limit: int, after: tuple[datetime, str] | None = None
+    ) -> tuple[list[dict[str, Any]], bool]:
+        try:
+            query_sets: list[QuerySet[Any]] = [GameTableModel.objects.all()]
+            if self._includes_archive(filters):
+                query_sets.append(ArchivedGameTableModel.objects.all())
+
+            tables: dict[Any, dict[str, Any]] = {}
+            for query_set in query_sets:
+                query_set = self._filter_lobby(query_set, filters)
+                if after is not None:
+                    # continues after the last listed table, so deep pages are index range scans as well
+                    created_at, table_id = after
+                    query_set = query_set.filter(
+                        Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=table_id)
+                    )
+                # a table moved to the archive between the queries is listed once
+                tables.update((table["id"], table) for table in query_set.order_by("-created_at", "-id")[: limit + 1])
+
+            page = sorted(tables.values(), key=lambda table: (table["created_at"], table["id"]), reverse=True)
+            return page[:limit], len(page) > limit
+        except Exception as e:
+            raise InfrastructureException(detail=f"Could not find page of game tables: {e}") from e
+
+    def _filter_lobby(self, query_set: QuerySet[Any], filters: dict[str, set[str]]) -> QuerySet[Any, dict[str, Any]]:
+        # lobby projections hold players and configs, so tables are listed without joins
+        if "status" in filters and filters["status"]:
+            query_set = query_set.filter(status__in=filters["status"])
+        if "game_name" in filters and filters["game_name"]:
+            query_set = query_set.filter(game_name__in=filters["game_name"])
+        return query_set.values(*LOBBY_FIELDS)
+
+    def _includes_archive(self, filters: dict[str, set[str]]) -> bool:
+        statuses = filters.get("status")
+        return not statuses or any(TableStatus(status) in ENDED_GAME_TABLE_STATUSES for status in statuses)
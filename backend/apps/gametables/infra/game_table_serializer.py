@@ -0,0 +1,40 @@
+from typing import Any
+
+from ..domain.game_table import GameTable
+from ..registries.game_state_codecs import get_game_state_codec
+
+
+class GameTableSerializer:
+    @staticmethod
+    def serialize_table(table: GameTable) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict for storing as table snapshot.
+        Same as `GameTable.to_dict`, except the game state is encoded with the game's compact codec."""
+        game_state = table._game_state
+        return {
+            "id": table.id,
+            "config": table.config.to_dict(),
+            "players": [player.to_dict() for player in table.players],
+            "owner_id": table.owner_id,
+            "game_state": get_game_state_codec(table.config.game_name).encode(game_state) if game_state else None,
+            "status": table.status.value,
+        }
+
+    @staticmethod
+    def serialize_lobby(serialized_table: dict[str, Any]) -> dict[str, Any]:
+        """Projection of a serialized table listed in the lobby, stored with the table,
+        so table lists are read without joining players and configs"""
+        players = sorted(serialized_table["players"], key=lambda player: player["seat_number"])
+        return {
+            "players": [
+                {
+                    "user": player["user_id"],
+                    "screen_name": player["screen_name"],
+                    "bot_strategy_kind": player["bot_strategy_kind"],
+                    "seat_number": player["seat_number"],
+                }
+                for player in players
+            ],
+            "player_count": len(players),
+            "table_config": serialized_table["config"]["table_config"],
+            "game_config": serialized_table["config"]["game_config"],
+        }
@@ -0,0 +1,127 @@
+import json
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from enum import IntEnum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import msgpack
+
+from core.exceptions.infrastructure_exception import InfrastructureException
+
+PAYLOAD_DICTIONARIES_DIR = Path(__file__).parent / "payload_dictionaries"
+
+
+class PayloadFormat(IntEnum):
+    """First byte of an encoded payload. Payloads stored as plain JSON, before formats were introduced,
+    start with '{' or '[' and are recognized without a header."""
+
+    MSGPACK = 1
+    MSGPACK_ZLIB_FIVE_HUNDRED_V1 = 2  # zlib with preset dictionary trained on Five Hundred payloads
+
+
+# preset dictionaries must never change once payloads are stored with them, retraining needs a new format
+PAYLOAD_FORMAT_DICTIONARIES: dict[PayloadFormat, str] = {
+    PayloadFormat.MSGPACK_ZLIB_FIVE_HUNDRED_V1: "five_hundred_v1.zdict",
+}
+
+JSON_PAYLOAD_FIRST_BYTES = frozenset(b"{[")
+
+
+@cache
+def get_payload_dictionary(payload_format: PayloadFormat) -> bytes:
+    return (PAYLOAD_DICTIONARIES_DIR / PAYLOAD_FORMAT_DICTIONARIES[payload_format]).read_bytes()
+
+
+@cache
+def _get_primed_compressor(payload_format: PayloadFormat, compression_level: int) -> "zlib._Compress":
+    # loading a preset dictionary costs more than compressing a snapshot, so compressors are copied from this one
+    return zlib.compressobj(compression_level, zdict=get_payload_dictionary(payload_format))
+
+
+def pack_offsets(offsets: Sequence[int]) -> bytes:
+    """Offsets returned by `encode_sequence` as a little-endian uint32 array, to store them with the blob"""
+    packed = array("I", offsets)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_offsets(data: bytes | memoryview) -> array[int]:
+    offsets = array("I")
+    offsets.frombytes(bytes(data))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
+
+
+class PayloadCodec:
+    """Encodes JSON-compatible payloads (snapshots, events) to bytes with a format header.
+    Decodes payloads of any known format, including plain JSON ones, so the format can be changed
+    without migrating stored data."""
+
+    def __init__(
+        self, payload_format: PayloadFormat = PayloadFormat.MSGPACK_ZLIB_FIVE_HUNDRED_V1, compression_level: int = 6
+    ):
+        self.payload_format: PayloadFormat = payload_format
+        self.compression_level: int = compression_level
+
+    def encode(self, payload: Any) -> bytes:
+        return self._compress(msgpack.packb(payload, use_bin_type=True))
+
+    def encode_sequence(self, payloads: Sequence[Any]) -> tuple[bytes, list[int]]:
+        """Encodes payloads into one blob, so they are compressed together. Returns the blob and offsets
+        of payloads in the decompressed blob (one more than payloads, the last one is its length),
+        which let `decode_sequence` unpack only some of them."""
+        offsets = [0]
+        packed_payloads: list[bytes] = []
+        for payload in payloads:
+            packed_payloads.append(msgpack.packb(payload, use_bin_type=True))
+            offsets.append(offsets[-1] + len(packed_payloads[-1]))
+        return self._compress(b"".join(packed_payloads)), offsets
+
+    def decode_sequence(
+        self, data: bytes | memoryview, offsets: Sequence[int], start: int = 0, end: int | None = None
+    ) -> list[Any]:
+        """Decodes payloads from `start` to `end` (exclusive) of a blob created by `encode_sequence`"""
+        body = memoryview(self._decompress(bytes(data)))
+        end = len(offsets) - 1 if end is None else end
+        return [
+            msgpack.unpackb(body[offsets[i] : offsets[i + 1]], raw=False, strict_map_key=False)
+            for i in range(start, end)
+        ]
+
+    def decode(self, data: bytes | memoryview | str) -> Any:
+        if isinstance(data, str):
+            return json.loads(data)
+        data = bytes(data)
+        if data and data[0] in JSON_PAYLOAD_FIRST_BYTES:
+            return json.loads(data)
+        return msgpack.unpackb(self._decompress(data), raw=False, strict_map_key=False)
+
+    def _compress(self, packed: bytes) -> bytes:
+        if self.payload_format == PayloadFormat.MSGPACK:
+            return bytes((self.payload_format,)) + packed
+        compressor = _get_primed_compressor(self.payload_format, self.compression_level).copy()
+        return bytes((self.payload_format,)) + compressor.compress(packed) + compressor.flush()
+
+    def _decompress(self, data: bytes) -> bytes:
+        if not data:
+            raise InfrastructureException(
+                detail="Could not decode payload: empty payload", reason="payload_decoding_error"
+            )
+        header = data[0]
+        try:
+            payload_format = PayloadFormat(header)
+        except ValueError:
+            raise InfrastructureException(
+                detail=f"Could not decode payload: unknown format {header}", reason="payload_decoding_error"
+            )
+        body = data[1:]
+        if payload_format != PayloadFormat.MSGPACK:
+            decompressor = zlib.decompressobj(zdict=get_payload_dictionary(payload_format))
+            body = decompressor.decompress(body) + decompressor.flush()
+        return body
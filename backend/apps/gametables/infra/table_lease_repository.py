@@ -0,0 +1,56 @@
+from typing import override
+
+from redis import Redis
+from redis.commands.core import Script
+
+from ..application.itable_lease_repository import ITableLeaseRepository, TableLeaseAcquisition
+
+# KEYS[1] - lease key, ARGV[1] - owner, ARGV[2] - lease TTL in milliseconds.
+# Returns 1 if the lease was renewed, 2 if it was acquired, 0 if it is held by another owner.
+ACQUIRE_LEASE_SCRIPT = """
+local owner = redis.call("GET", KEYS[1])
+if owner == ARGV[1] then
+    redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    return 1
+end
+if owner then
+    return 0
+end
+redis.call("SET", KEYS[1], ARGV[1], "PX", ARGV[2])
+return 2
+"""
+
+# KEYS[1] - lease key, ARGV[1] - owner. Deletes the lease only if it is held by the owner.
+RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+LEASE_ACQUISITIONS: dict[int, TableLeaseAcquisition] = {
+    0: TableLeaseAcquisition.REJECTED,
+    1: TableLeaseAcquisition.RENEWED,
+    2: TableLeaseAcquisition.ACQUIRED,
+}
+
+
+class TableLeaseRepository(ITableLeaseRepository):
+    def __init__(self, redis_conn: Redis, ttl_in_milliseconds: int = 30_000):
+        self.redis: Redis = redis_conn
+        self.prefix: str = "game_table_lease"
+        self.ttl_in_milliseconds: int = ttl_in_milliseconds
+        self._acquire_script: Script = self.redis.register_script(ACQUIRE_LEASE_SCRIPT)
+        self._release_script: Script = self.redis.register_script(RELEASE_LEASE_SCRIPT)
+
+    def _make_key(self, table_id: str) -> str:
+        return f"{self.prefix}:{table_id}"
+
+    @override
+    def acquire(self, table_id: str, owner: str) -> TableLeaseAcquisition:
+        result = self._acquire_script(keys=[self._make_key(table_id)], args=[owner, self.ttl_in_milliseconds])
+        return LEASE_ACQUISITIONS[int(result)]
+
+    @override
+    def release(self, table_id: str, owner: str) -> None:
+        _ = self._release_script(keys=[self._make_key(table_id)], args=[owner])
@@ -0,0 +1,27 @@
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...application.game_table_manager import ARCHIVAL_BATCH_SIZE
+from ...dependencies import get_table_manager
+
+
+class Command(BaseCommand):
+    help = "Moves tables with ended games and their game events to the archive, in batches until none is left."
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--batch-size", type=int, default=ARCHIVAL_BATCH_SIZE)
+        parser.add_argument("--max-batches", type=int, default=None, help="stop after this many batches")
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        total_tables, total_events, batches = 0, 0, 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            tables_count, events_count = get_table_manager().archive_ended_tables(options["batch_size"])
+            total_tables += tables_count
+            total_events += events_count
+            batches += 1
+            if tables_count < options["batch_size"]:
+                break
+        self.stdout.write(f"Archived {total_tables} tables with {total_events} game events")
@@ -0,0 +1,66 @@
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
+from game.five_hundred.five_hundred_event_parser import EVENT_CLASSES
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from game.five_hundred.five_hundred_simulation import play_game
+from game.game_name import GameName
+
+from ...registries.game_event_parsers import get_game_event_parser
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares parsing of serialized Five Hundred events one by one through event classes with the batched "
+        "parser, on a synthetic game of bot games joined into one event log."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--events", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = self._synthetic_game(options["events"], options["seed"])
+        game_event_parser = get_game_event_parser(GameName.FIVE_HUNDRED)
+        if game_event_parser.parse_many(rows) != [EVENT_CLASSES[row["type"]].from_dict(row) for row in rows]:
+            raise RuntimeError("Batched parser returned different events than event classes")
+
+        parsers: dict[str, Callable[[list[dict[str, Any]]], Any]] = {
+            "event classes": lambda rows: [EVENT_CLASSES[row["type"]].from_dict(row) for row in rows],
+            "parser from_dict": lambda rows: [game_event_parser.from_dict(row) for row in rows],
+            "parser parse_many": game_event_parser.parse_many,
+        }
+
+        self.stdout.write(f"{len(rows)} events, best and median of {options['repeat']} runs:")
+        baseline = 0.0
+        for name, parse in parsers.items():
+            timings: list[float] = []
+            for _ in range(options["repeat"]):
+                started_at = time.perf_counter()
+                _ = parse(rows)
+                timings.append(time.perf_counter() - started_at)
+            best = min(timings)
+            baseline = baseline or best
+            self.stdout.write(
+                f"  {name}: {best * 1000:.2f}ms ({best / len(rows) * 1e6:.2f}us/event, {baseline / best:.2f}x), "
+                f"median {statistics.median(timings) * 1000:.2f}ms"
+            )
+
+    def _synthetic_game(self, events_count: int, seed: int) -> list[dict[str, Any]]:
+        """Event log of bot games played one after another, renumbered as a single game"""
+        game_config = FiveHundredGameConfig(max_rounds=50, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+        bot_strategy_factories = [FiveHundredRandomBotStrategy] * 3
+        rows: list[dict[str, Any]] = []
+        while len(rows) < events_count:
+            for row in play_game(game_config, bot_strategy_factories, seed, collect_events=True).events:
+                rows.append({**row, "seq_number": len(rows) + 1})
+            seed += 1
+        return rows[:events_count]
@@ -0,0 +1,50 @@
+import json
+import time
+from collections.abc import Callable
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from ...infra.payload_codec import PayloadCodec, PayloadFormat
+from ..payload_samples import collect_payload_samples
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares size and encode/decode cost of payload formats with JSON, "
+        "on payloads of Five Hundred games played by bots."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--games", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=1, help="differs from training seed of the dictionary")
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        samples = collect_payload_samples(options["games"], options["seed"])
+        encoders: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+            "json": (lambda payload: json.dumps(payload).encode(), json.loads),
+        }
+        for payload_format in PayloadFormat:
+            codec = PayloadCodec(payload_format)
+            encoders[payload_format.name.lower()] = (codec.encode, codec.decode)
+
+        for kind, payloads in samples.items():
+            self.stdout.write(f"{kind} ({len(payloads)} payloads):")
+            json_size = 0
+            for name, (encode, decode) in encoders.items():
+                started_at = time.perf_counter()
+                encoded = [encode(payload) for payload in payloads]
+                encoded_at = time.perf_counter()
+                for data in encoded:
+                    _ = decode(data)
+                decoded_at = time.perf_counter()
+
+                size = sum(len(data) for data in encoded)
+                json_size = json_size or size
+                self.stdout.write(
+                    f"  {name}: {size / len(payloads):.0f} bytes/payload ({size / json_size:.0%} of json), "
+                    f"encode {(encoded_at - started_at) / len(payloads) * 1e6:.1f}us, "
+                    f"decode {(decoded_at - encoded_at) / len(payloads) * 1e6:.1f}us"
+                )
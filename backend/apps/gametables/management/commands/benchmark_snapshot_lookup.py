@@ -0,0 +1,115 @@
+import json
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from game.five_hundred.five_hundred_simulation import play_game
+from game.game_name import GameName
+
+from ...dependencies import get_redis_cache_conn
+from ...infra.game_state_snapshot_repository import GameStateSnapshotRepository
+from ...registries.game_engines import get_game_engine
+from ...registries.game_event_parsers import get_game_event_parser
+from ...registries.snapshot_policies import get_snapshot_policy
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares latency of snapshot lookups done in sequential round trips (GET, ZREVRANGEBYSCORE, GET) "
+        "with the single round trip script. Runs against the configured cache Redis (REDIS_URL), "
+        "meant for a local instance, e.g. `docker compose up redis`."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--lookups", type=int, default=2000)
+        parser.add_argument("--max-rounds", type=int, default=50, help="rounds of the game used as test data")
+        parser.add_argument("--seed", type=int, default=0)
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        redis = get_redis_cache_conn()
+        repository = GameStateSnapshotRepository(redis)
+        table_id = f"benchmark-{uuid.uuid4()}"
+
+        last_event_number = self._store_game(repository, table_id, options["max_rounds"], options["seed"])
+        rng = random.Random(options["seed"])
+        event_numbers = [rng.randint(0, last_event_number) for _ in range(options["lookups"])]
+
+        try:
+            results = {
+                "round trips": self._measure(
+                    lambda event_number: self._get_in_round_trips(repository, table_id, event_number), event_numbers
+                ),
+                "script": self._measure(
+                    lambda event_number: repository.get_exact_or_nearest_snapshot_data(table_id, event_number),
+                    event_numbers,
+                ),
+            }
+        finally:
+            keys = list(redis.scan_iter(match=f"*{table_id}*"))
+            if keys:
+                _ = redis.delete(*keys)
+
+        self.stdout.write(f"{len(event_numbers)} lookups over {last_event_number} events")
+        for name, latencies in results.items():
+            percentiles = statistics.quantiles(latencies, n=100)
+            self.stdout.write(f"{name}: p50 {percentiles[49] * 1000:.3f}ms, p99 {percentiles[98] * 1000:.3f}ms")
+
+    def _store_game(self, repository: GameStateSnapshotRepository, table_id: str, max_rounds: int, seed: int) -> int:
+        game_config = FiveHundredGameConfig(
+            max_rounds=max_rounds, max_bid_no_marriage=120, min_bid=60, give_up_points=50
+        )
+        bot_strategy_factories = [FiveHundredRandomBotStrategy] * 3
+        simulated_game = play_game(game_config, bot_strategy_factories, seed, collect_events=True)
+
+        # same layout as stored by GameTableManager: keyframes at checkpoints, events following them as deltas
+        engine = get_game_engine(GameName.FIVE_HUNDRED)
+        game_event_parser = get_game_event_parser(GameName.FIVE_HUNDRED)
+        snapshot_policy = get_snapshot_policy(GameName.FIVE_HUNDRED)
+        game_state = engine.init_game_state(game_config, frozenset(range(1, len(bot_strategy_factories) + 1)))
+        snapshots = [game_state.to_dict()]
+        deltas_by_keyframe: dict[int, list[dict[str, Any]]] = {0: []}
+        events = game_event_parser.parse_many(simulated_game.events)
+        for raw_event, event in zip(simulated_game.events, events, strict=True):
+            deltas_by_keyframe[max(deltas_by_keyframe)].append(raw_event)
+            game_state = engine.apply_event(game_state, event)
+            if snapshot_policy.is_checkpoint(game_state):
+                snapshots.append(game_state.to_dict())
+                deltas_by_keyframe[game_state.event_number] = []
+
+        repository.store(table_id, snapshots, deltas_by_keyframe)
+        return game_state.event_number
+
+    def _get_in_round_trips(self, repository: GameStateSnapshotRepository, table_id: str, event_number: int) -> Any:
+        # lookup as done before the script: exact snapshot, nearest snapshot key, then nearest snapshot with deltas
+        redis = repository.redis
+        raw_exact_snapshot = redis.get(f"{repository.prefix}:{table_id}:{event_number}")
+        if raw_exact_snapshot:
+            return json.loads(raw_exact_snapshot)
+        nearest_keys = redis.zrevrangebyscore(
+            name=f"index:zset:table_id:{table_id}", max=event_number, min="-inf", start=0, num=1, withscores=True
+        )
+        if not nearest_keys:
+            return None
+        nearest_key, nearest_score = nearest_keys[0]
+        with redis.pipeline(transaction=False) as pipe:
+            _ = pipe.get(nearest_key)
+            _ = pipe.get(f"{repository.prefix}_deltas:{table_id}:{int(nearest_score)}")
+            raw_nearest_snapshot, raw_deltas = pipe.execute()
+        return json.loads(raw_nearest_snapshot), json.loads(raw_deltas) if raw_deltas else []
+
+    def _measure(self, lookup: Callable[[int], Any], event_numbers: list[int]) -> list[float]:
+        latencies: list[float] = []
+        for event_number in event_numbers:
+            started_at = time.perf_counter()
+            _ = lookup(event_number)
+            latencies.append(time.perf_counter() - started_at)
+        return latencies
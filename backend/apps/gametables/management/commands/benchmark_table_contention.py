@@ -0,0 +1,134 @@
+import statistics
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DatabaseError, connection, transaction
+
+from apps.users.models import User
+from core.exceptions.app_exception import AppException
+from game.common.game_event import GameEvent
+from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from game.game_name import GameName
+
+from ...configs.five_hundred_table_config import FiveHundredTableConfig
+from ...domain.game_table import GameTable
+from ...domain.game_table_config import GameTableConfig
+from ...infra.game_table_repository import GameTableRepository
+from ...models import GameEventModel, GameTableModel
+from ...registries.game_engines import get_game_engine
+
+
+class _LockingGameTableRepository(GameTableRepository):
+    """Game actions as done before optimistic concurrency: the row is locked while the table is modified"""
+
+    @override
+    @transaction.atomic
+    def _modify_stored_during_game_action(
+        self, table_id: str, modifier: Callable[[GameTable], Sequence[GameEvent]]
+    ) -> tuple[Sequence[GameEvent], GameTable, int]:
+        db_game_table = GameTableModel.objects.select_for_update().get(id=table_id)
+        game_table = self._load_table(db_game_table)
+        events = modifier(game_table)
+        _ = GameEventModel.objects.bulk_create(
+            [
+                GameEventModel(game_table_id=table_id, sequence_number=event.seq_number, data=event.to_dict())
+                for event in events
+            ]
+        )
+        self._store_snapshot(game_table, db_game_table.version)
+        return events, game_table, db_game_table.version + 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures game actions of concurrent writers on bot tables, with the row locked while the table "
+        "is modified and with optimistic concurrency. Runs against the configured database, meant for "
+        "a local PostgreSQL instance, e.g. `docker compose up db`."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--writers", type=int, default=16, help="threads taking bot turns concurrently")
+        parser.add_argument("--actions", type=int, default=20, help="bot turns taken by each writer")
+        parser.add_argument("--tables", type=int, default=1, help="tables the writers are spread over")
+        parser.add_argument("--max-rounds", type=int, default=100, help="rounds of the game, so it does not end")
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        user, is_user_created = User.objects.get_or_create(username="contention-benchmark")
+        try:
+            repositories: dict[str, GameTableRepository] = {
+                "row lock": _LockingGameTableRepository(),
+                "optimistic": GameTableRepository(),
+            }
+            for name, repository in repositories.items():
+                table_ids = [
+                    self._create_table(repository, user.pk, options["max_rounds"]) for _ in range(options["tables"])
+                ]
+                try:
+                    latencies, elapsed = self._run_writers(
+                        repository, table_ids, options["writers"], options["actions"]
+                    )
+                finally:
+                    for table_id in table_ids:
+                        repository.delete(table_id)
+                percentiles = statistics.quantiles(latencies, n=100)
+                self.stdout.write(
+                    f"{name}: {len(latencies) / elapsed:.0f} actions/s, p50 {percentiles[49] * 1000:.1f}ms, "
+                    f"p99 {percentiles[98] * 1000:.1f}ms, {repository.conflicts} conflicts"
+                )
+        finally:
+            if is_user_created:
+                _ = user.delete()
+
+    def _create_table(self, repository: GameTableRepository, owner_id: int, max_rounds: int) -> str:
+        config = GameTableConfig(
+            GameName.FIVE_HUNDRED,
+            FiveHundredGameConfig(max_rounds=max_rounds, max_bid_no_marriage=120, min_bid=60, give_up_points=50),
+            FiveHundredTableConfig.from_dict({}),
+        )
+        table = GameTable(str(uuid.uuid4()), config, get_game_engine(GameName.FIVE_HUNDRED), owner_id=owner_id)
+        for _ in range(3):
+            table.add_bot_player(FiveHundredRandomBotStrategy(), initiated_by=owner_id)
+        table_id = repository.create(table)
+        _ = repository.modify_during_game_action(table_id, lambda table: table.start_game(initiated_by=owner_id))
+        return table_id
+
+    def _run_writers(
+        self, repository: GameTableRepository, table_ids: list[str], writers: int, actions: int
+    ) -> tuple[list[float], float]:
+        latencies: list[float] = []
+        errors: list[AppException | DatabaseError] = []
+        barrier = threading.Barrier(writers)
+
+        def _write(table_id: str) -> None:
+            try:
+                _ = barrier.wait()
+                for _ in range(actions):
+                    started_at = time.perf_counter()
+                    _ = repository.modify_during_game_action(table_id, lambda table: table.take_bot_turns(1))
+                    latencies.append(time.perf_counter() - started_at)
+            except (AppException, DatabaseError) as e:
+                # e.g. a table modified concurrently more times than a modification is attempted
+                errors.append(e)
+            finally:
+                connection.close()  # each thread has its own connection
+
+        threads = [
+            threading.Thread(target=_write, args=(table_ids[writer % len(table_ids)],)) for writer in range(writers)
+        ]
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started_at
+
+        if errors:
+            self.stderr.write(f"{len(errors)} writers failed, first error: {errors[0]}")
+        return latencies, elapsed
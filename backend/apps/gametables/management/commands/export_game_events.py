@@ -0,0 +1,51 @@
+import time
+from pathlib import Path
+from typing import Any, override
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from game.game_name import GameName
+
+from ...dependencies import get_game_event_repository
+from ...domain.table_status import TableStatus
+from ...infra.game_event_archive import EXPORT_CHUNK_SIZE, export_game_events_archive
+from ...registries.game_event_columns_encoders import get_game_event_columns_encoder
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports event logs of tables (finished ones by default) to a columnar archive directory, "
+        "memory-mappable with numpy.load(path, mmap_mode='r') per column."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("output", type=Path, help="archive directory to create, must not exist")
+        parser.add_argument("--game-name", default=GameName.FIVE_HUNDRED.value)
+        parser.add_argument("--tables", help="comma separated table IDs, all tables of the game by default")
+        parser.add_argument("--status", default=TableStatus.FINISHED.value, help="comma separated table statuses")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        game_name = GameName.from_str(options["game_name"])
+        table_ids = [table_id.strip() for table_id in options["tables"].split(",")] if options["tables"] else None
+        statuses = [TableStatus(status.strip()) for status in options["status"].split(",") if status.strip()]
+
+        started_at = time.perf_counter()
+        writer = export_game_events_archive(
+            get_game_event_repository(),
+            get_game_event_columns_encoder(game_name),
+            options["output"],
+            game_name,
+            table_ids=table_ids,
+            statuses=statuses,
+            chunk_size=options["chunk_size"],
+        )
+        elapsed = time.perf_counter() - started_at
+
+        size = sum(path.stat().st_size for path in options["output"].iterdir())
+        self.stdout.write(
+            f"Exported {writer.events_count} events of {len(writer.table_ids)} tables to {options['output']} "
+            f"({size / 1024:.1f} KiB) in {elapsed:.2f}s ({writer.events_count / elapsed if elapsed else 0:.0f} events/sec)"
+        )
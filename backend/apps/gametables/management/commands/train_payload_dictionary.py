@@ -0,0 +1,43 @@
+import random
+from pathlib import Path
+from typing import Any, override
+
+import msgpack
+from django.core.management.base import BaseCommand, CommandParser
+
+from ..payload_samples import collect_payload_samples
+
+MAX_DICTIONARY_SIZE = 32 * 1024  # zlib uses at most 32KB of a preset dictionary
+
+
+class Command(BaseCommand):
+    help = (
+        "Trains a zlib preset dictionary for payload codec from payloads of Five Hundred games played by bots. "
+        "Stored dictionaries must never change, a retrained one needs a new payload format."
+    )
+
+    @override
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("output", type=Path)
+        parser.add_argument("--games", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+
+    @override
+    def handle(self, *args: Any, **options: Any) -> None:
+        samples = [
+            msgpack.packb(payload, use_bin_type=True)
+            for payloads in collect_payload_samples(options["games"], options["seed"]).values()
+            for payload in payloads
+        ]
+
+        # zlib finds matches closer to the end of the dictionary cheaper, so random samples fill it from the end
+        random.Random(options["seed"]).shuffle(samples)
+        dictionary = b""
+        for sample in samples:
+            if len(dictionary) >= MAX_DICTIONARY_SIZE:
+                break
+            dictionary = sample + dictionary
+        dictionary = dictionary[-MAX_DICTIONARY_SIZE:]
+
+        _ = options["output"].write_bytes(dictionary)
+        self.stdout.write(f"Dictionary of {len(dictionary)} bytes from {len(samples)} samples: {options['output']}")
@@ -0,0 +1,45 @@
+import random
+from typing import Any
+
+from game.five_hundred.five_hundred_game_engine import FiveHundredGameEngine
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from game.game_name import GameName
+
+from ..configs.five_hundred_table_config import FiveHundredTableConfig
+from ..domain.game_table import GameTable
+from ..domain.game_table_config import GameTableConfig
+from ..infra.game_table_serializer import GameTableSerializer
+from ..registries.game_config_parsers import get_game_config_parser
+
+DELTAS_PER_SAMPLE = 25  # around one round of Five Hundred, as stored after each keyframe
+
+
+def collect_payload_samples(games: int, seed: int, sample_rate: float = 0.05) -> dict[str, list[Any]]:
+    """Payloads as stored by repositories, from Five Hundred games played by bots:
+    table snapshots, game state snapshots (keyframes) and lists of events following them (deltas)"""
+    random.seed(seed)
+    samples: dict[str, list[Any]] = {"table_snapshots": [], "game_state_snapshots": [], "deltas": []}
+    for _ in range(games):
+        game_config = get_game_config_parser(GameName.FIVE_HUNDRED)({"max_rounds": 20})
+        table_config = FiveHundredTableConfig.from_dict({})
+        config = GameTableConfig(GameName.FIVE_HUNDRED, game_config, table_config)
+        table = GameTable("sample", config, FiveHundredGameEngine(), owner_id=1)
+        for _ in range(table_config.max_seats):
+            table.add_bot_player(FiveHundredRandomBotStrategy(), initiated_by=1)
+
+        events = [event.to_dict() for event in table.start_game(initiated_by=1)]
+        while not table.is_game_ended:
+            if random.random() < sample_rate:
+                samples["table_snapshots"].append(GameTableSerializer.serialize_table(table))
+                samples["game_state_snapshots"].append(table.game_state.to_dict())
+            events.extend(event.to_dict() for event in table.take_bot_turns(max_turns=1))
+
+        # deltas are stored without sequence numbers, those are implied by positions in the list
+        for start in range(0, len(events), DELTAS_PER_SAMPLE):
+            samples["deltas"].append(
+                [
+                    {key: value for key, value in data.items() if key != "seq_number"}
+                    for data in events[start : start + DELTAS_PER_SAMPLE]
+                ]
+            )
+    return samples
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 05:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gametables", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gametablemodel",
+            name="packed_snapshot",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AlterField(
+            model_name="gametablemodel",
+            name="snapshot",
+            field=models.JSONField(null=True),
+        ),
+    ]
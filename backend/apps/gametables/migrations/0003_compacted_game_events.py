@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gametables", "0002_packed_table_snapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompactedGameEventsModel",
+            fields=[
+                (
+                    "game_table",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="compacted_events",
+                        serialize=False,
+                        to="gametables.gametablemodel",
+                    ),
+                ),
+                ("first_sequence_number", models.IntegerField()),
+                ("events_count", models.IntegerField()),
+                ("data", models.BinaryField()),
+                ("offsets", models.BinaryField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "gameevent_compacted",
+            },
+        ),
+    ]
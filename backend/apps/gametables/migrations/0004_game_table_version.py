@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gametables", "0003_compacted_game_events"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gametablemodel",
+            name="version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:17
+
+import json
+import zlib
+from pathlib import Path
+
+import msgpack
+from django.conf import settings
+from django.db import migrations, models
+
+LOBBY_BATCH_SIZE = 500
+
+# payload formats and the lobby projection as of this migration, later changes of the live code don't affect it
+MSGPACK_PAYLOAD_FORMAT = 1
+MSGPACK_ZLIB_PAYLOAD_DICTIONARIES = {2: "five_hundred_v1.zdict"}  # preset dictionaries never change
+PAYLOAD_DICTIONARIES_DIR = Path(__file__).resolve().parent.parent / "infra" / "payload_dictionaries"
+
+
+def decode_snapshot(table):
+    if table.packed_snapshot is None:
+        return table.snapshot
+    data = bytes(table.packed_snapshot)
+    if data[:1] in (b"{", b"["):
+        return json.loads(data)
+    payload_format, body = data[0], data[1:]
+    if payload_format != MSGPACK_PAYLOAD_FORMAT:
+        zdict = (PAYLOAD_DICTIONARIES_DIR / MSGPACK_ZLIB_PAYLOAD_DICTIONARIES[payload_format]).read_bytes()
+        decompressor = zlib.decompressobj(zdict=zdict)
+        body = decompressor.decompress(body) + decompressor.flush()
+    return msgpack.unpackb(body, raw=False, strict_map_key=False)
+
+
+def lobby_projection(serialized_table):
+    players = sorted(serialized_table["players"], key=lambda player: player["seat_number"])
+    return {
+        "players": [
+            {
+                "user": player["user_id"],
+                "screen_name": player["screen_name"],
+                "bot_strategy_kind": player["bot_strategy_kind"],
+                "seat_number": player["seat_number"],
+            }
+            for player in players
+        ],
+        "player_count": len(players),
+        "table_config": serialized_table["config"]["table_config"],
+        "game_config": serialized_table["config"]["game_config"],
+    }
+
+
+def fill_lobby_projections(apps, schema_editor):
+    # projections are built from stored snapshots, which hold players with seats and configs
+    GameTableModel = apps.get_model("gametables", "GameTableModel")
+    tables = []
+    for table in GameTableModel.objects.only("id", "snapshot", "packed_snapshot").iterator(chunk_size=LOBBY_BATCH_SIZE):
+        table.lobby = lobby_projection(decode_snapshot(table))
+        tables.append(table)
+        if len(tables) == LOBBY_BATCH_SIZE:
+            GameTableModel.objects.bulk_update(tables, ["lobby"])
+            tables = []
+    if tables:
+        GameTableModel.objects.bulk_update(tables, ["lobby"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gametables", "0004_game_table_version"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gametablemodel",
+            name="lobby",
+            field=models.JSONField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name="gametablemodel",
+            index=models.Index(fields=["-created_at", "-id"], name="created_at_id_index"),
+        ),
+        migrations.AddIndex(
+            model_name="gametablemodel",
+            index=models.Index(
+                condition=models.Q(("status__in", ["in_progress", "not_started"])),
+                fields=["status", "-created_at", "-id"],
+                name="active_status_created_id_index",
+            ),
+        ),
+        migrations.RunPython(fill_lobby_projections, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.7 on 2026-10-18 06:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("gametables", "0005_lobby_projection"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedGameTableModel",
+            fields=[
+                ("id", models.UUIDField(primary_key=True, serialize=False)),
+                ("game_name", models.CharField(max_length=50)),
+                ("status", models.CharField(max_length=30)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("snapshot", models.JSONField(null=True)),
+                ("packed_snapshot", models.BinaryField(null=True)),
+                ("version", models.PositiveIntegerField(default=0)),
+                ("lobby", models.JSONField(null=True)),
+            ],
+            options={
+                "db_table": "gametable_archive",
+            },
+        ),
+        migrations.RemoveIndex(
+            model_name="gameeventmodel",
+            name="event_table_seq_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="gametablemodel",
+            name="game_name_status_index",
+        ),
+        migrations.AddIndex(
+            model_name="gametablemodel",
+            index=models.Index(
+                condition=models.Q(("status__in", ["in_progress", "not_started"])),
+                fields=["game_name", "status"],
+                name="active_game_name_status_index",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gametablemodel",
+            index=models.Index(
+                condition=models.Q(("status__in", ["aborted", "cancelled", "finished"])),
+                fields=["updated_at"],
+                name="ended_updated_at_index",
+            ),
+        ),
+        migrations.CreateModel(
+            name="ArchivedGameEventsModel",
+            fields=[
+                (
+                    "game_table",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="archived_events",
+                        serialize=False,
+                        to="gametables.archivedgametablemodel",
+                    ),
+                ),
+                ("first_sequence_number", models.IntegerField()),
+                ("events_count", models.IntegerField()),
+                ("data", models.BinaryField()),
+                ("offsets", models.BinaryField()),
+            ],
+            options={
+                "db_table": "gameevent_archive",
+            },
+        ),
+        migrations.AddField(
+            model_name="archivedgametablemodel",
+            name="owner",
+            field=models.ForeignKey(
+                null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="+", to=settings.AUTH_USER_MODEL
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedgametablemodel",
+            index=models.Index(fields=["game_name", "status"], name="archive_game_name_status_index"),
+        ),
+        migrations.AddIndex(
+            model_name="archivedgametablemodel",
+            index=models.Index(fields=["-created_at", "-id"], name="archive_created_at_id_index"),
+        ),
+        migrations.AddIndex(
+            model_name="archivedgametablemodel",
+            index=models.Index(fields=["status", "-created_at", "-id"], name="archive_status_created_index"),
+        ),
+    ]
@@ -2,17 +2,25 @@ from django.db.models import (
     CASCADE,
     SET_NULL,
     ForeignKey,
+    OneToOneField,
     Index,
     Model,
     UUIDField,
     CharField,
     IntegerField,
+    PositiveIntegerField,
     JSONField,
+    BinaryField,
     DateTimeField,
+    Q,
 )
 from django.db.models.constraints import UniqueConstraint
 
 from apps.users.models import User
+from .domain.table_status import ACTIVE_GAME_TABLE_STATUSES, ENDED_GAME_TABLE_STATUSES
+
+_ACTIVE_STATUSES = Q(status__in=sorted(status.value for status in ACTIVE_GAME_TABLE_STATUSES))
+_ENDED_STATUSES = Q(status__in=sorted(status.value for status in ENDED_GAME_TABLE_STATUSES))
 
 
 class GameTableModel(Model):
@@ -23,11 +31,25 @@ class GameTableModel(Model):
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
 
-    snapshot = JSONField()  # serialized GameTable instance, snapshot
+    snapshot = JSONField(null=True)  # serialized GameTable instance, snapshot (rows written before packed_snapshot)
+    packed_snapshot = BinaryField(null=True)  # serialized GameTable instance encoded by payload codec
+    version = PositiveIntegerField(default=0)  # incremented on every stored snapshot, for optimistic concurrency
+    lobby = JSONField(null=True)  # projection listed in the lobby: players with seats, player count and configs
 
     class Meta:
         db_table = "gametable"
-        indexes = [Index(fields=["game_name", "status"], name="game_name_status_index")]
+        indexes = [
+            # indexes by status cover only tables in the lobby or ended tables waiting to be archived
+            Index(fields=["game_name", "status"], name="active_game_name_status_index", condition=_ACTIVE_STATUSES),
+            # keyset pagination of table lists, newest first
+            Index(fields=["-created_at", "-id"], name="created_at_id_index"),
+            Index(
+                fields=["status", "-created_at", "-id"],
+                name="active_status_created_id_index",
+                condition=_ACTIVE_STATUSES,
+            ),
+            Index(fields=["updated_at"], name="ended_updated_at_index", condition=_ENDED_STATUSES),
+        ]
 
 
 class PlayerModel(Model):
@@ -80,5 +102,59 @@ class GameEventModel(Model):
         constraints = [
             UniqueConstraint(fields=["game_table", "sequence_number"], name="uniq_event_seq_per_table"),
         ]
-        indexes = [Index(fields=["game_table", "sequence_number"], name="event_table_seq_idx")]
         ordering = ["sequence_number"]
+
+
+class CompactedGameEventsModel(Model):
+    """All game events of a table with ended game, stored in one row instead of one row per event"""
+
+    game_table = OneToOneField(GameTableModel, on_delete=CASCADE, primary_key=True, related_name="compacted_events")
+    first_sequence_number = IntegerField()
+    events_count = IntegerField()
+    data = BinaryField()  # serialized events encoded together by payload codec
+    offsets = BinaryField()  # offsets of events in decoded data, little-endian uint32 array, events_count + 1 long
+    created_at = DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "gameevent_compacted"
+
+
+class ArchivedGameTableModel(Model):
+    """Table with ended game moved out of the game tables, so their indexes cover mostly active tables.
+    Players and configs are kept in the snapshot and lobby projection."""
+
+    id = UUIDField(primary_key=True)
+    game_name = CharField(max_length=50)
+    status = CharField(max_length=30)
+    owner = ForeignKey(User, on_delete=SET_NULL, null=True, related_name="+")
+    created_at = DateTimeField()
+    updated_at = DateTimeField()
+    archived_at = DateTimeField(auto_now_add=True)
+
+    snapshot = JSONField(null=True)
+    packed_snapshot = BinaryField(null=True)
+    version = PositiveIntegerField(default=0)
+    lobby = JSONField(null=True)
+
+    class Meta:
+        db_table = "gametable_archive"
+        indexes = [
+            Index(fields=["game_name", "status"], name="archive_game_name_status_index"),
+            Index(fields=["-created_at", "-id"], name="archive_created_at_id_index"),
+            Index(fields=["status", "-created_at", "-id"], name="archive_status_created_index"),
+        ]
+
+
+class ArchivedGameEventsModel(Model):
+    """All game events of an archived table, stored like compacted game events"""
+
+    game_table = OneToOneField(
+        ArchivedGameTableModel, on_delete=CASCADE, primary_key=True, related_name="archived_events"
+    )
+    first_sequence_number = IntegerField()
+    events_count = IntegerField()
+    data = BinaryField()
+    offsets = BinaryField()
+
+    class Meta:
+        db_table = "gameevent_archive"
@@ -0,0 +1,13 @@
+from collections.abc import Mapping
+
+from game.common.game_event_columns import GameEventColumnsEncoder
+from game.five_hundred.five_hundred_event_columns import FiveHundredEventColumnsEncoder
+from game.game_name import GameName
+
+GAME_EVENT_COLUMNS_ENCODERS: Mapping[GameName, GameEventColumnsEncoder] = {
+    GameName.FIVE_HUNDRED: FiveHundredEventColumnsEncoder(),
+}
+
+
+def get_game_event_columns_encoder(game_name: GameName) -> GameEventColumnsEncoder:
+    return GAME_EVENT_COLUMNS_ENCODERS[game_name]
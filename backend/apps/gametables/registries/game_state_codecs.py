@@ -0,0 +1,13 @@
+from collections.abc import Mapping
+
+from game.common.game_state_codec import GameStateCodec
+from game.five_hundred.five_hundred_game_codec import FiveHundredGameCodec
+from game.game_name import GameName
+
+GAME_STATE_CODECS: Mapping[GameName, GameStateCodec] = {
+    GameName.FIVE_HUNDRED: FiveHundredGameCodec(),
+}
+
+
+def get_game_state_codec(game_name: GameName) -> GameStateCodec:
+    return GAME_STATE_CODECS[game_name]
@@ -0,0 +1,14 @@
+from collections.abc import Mapping
+
+from game.game_name import GameName
+
+from ..domain.snapshot_policy import SnapshotPolicy
+
+# Five Hundred rounds take around 25 events, replaying at most one round is cheaper than storing every state
+SNAPSHOT_POLICIES: Mapping[GameName, SnapshotPolicy] = {
+    GameName.FIVE_HUNDRED: SnapshotPolicy(at_replay_safe_events=True, every_n_events=None),
+}
+
+
+def get_snapshot_policy(game_name: GameName) -> SnapshotPolicy:
+    return SNAPSHOT_POLICIES[game_name]
@@ -1,30 +1,27 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
 from typing import Any, override
+from uuid import UUID
+from rest_framework.exceptions import ValidationError
 from rest_framework.fields import (
+    BooleanField,
     CharField,
     ChoiceField,
     DictField,
     IntegerField,
-    SerializerMethodField,
     MultipleChoiceField,
 )
 from rest_framework.serializers import ModelSerializer, Serializer
 
 from game.bot_strategy_kind import BotStrategyKind
 from game.game_name import GameName
-from .models import PlayerModel, GameTableModel
+from .models import GameTableModel
 from .domain.table_status import TableStatus
 
 
-class GameTablePlayerSerializer(ModelSerializer[PlayerModel]):
-    class Meta:
-        model = PlayerModel
-        fields = ["user", "screen_name", "bot_strategy_kind"]
-
-
-class GameTableWithRelationsSerializer(ModelSerializer[GameTableModel]):
-    players = GameTablePlayerSerializer(many=True, read_only=True)
-    game_config = SerializerMethodField(read_only=True)
-    table_config = SerializerMethodField(read_only=True)
+class GameTableListSerializer(ModelSerializer[GameTableModel]):
+    """Table row in table lists (as returned by `IGameTableRepository.find_page`), players (with seat numbers),
+    player count and configs come from its lobby projection"""
 
     class Meta:
         model = GameTableModel
@@ -35,22 +32,28 @@ class GameTableWithRelationsSerializer(ModelSerializer[GameTableModel]):
             "owner_id",
             "created_at",
             "updated_at",
-            "players",
-            "table_config",
-            "game_config",
         ]
 
-    def get_game_config(self, obj: GameTableModel) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        for row in obj.game_configs.all():
-            result[row.config_key] = row.value
-        return result
+    @override
+    def to_representation(self, instance: dict[str, Any]) -> dict[str, Any]:
+        return {**super().to_representation(instance), **(instance["lobby"] or {})}
+
 
-    def get_table_config(self, obj: GameTableModel) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        for row in obj.table_configs.all():
-            result[row.config_key] = row.value
-        return result
+def encode_table_cursor(table: dict[str, Any]) -> str:
+    """Position after the table row in table lists, ordered by (created_at, id)"""
+    return urlsafe_b64encode(f"{table['created_at'].isoformat()}|{table['id']}".encode()).decode()
+
+
+class TableCursorField(CharField):
+    """Cursor created by `encode_table_cursor`, decoded to (created_at, table id)"""
+
+    @override
+    def to_internal_value(self, data: Any) -> tuple[datetime, str]:
+        try:
+            created_at, table_id = urlsafe_b64decode(str(super().to_internal_value(data))).decode().split("|")
+            return datetime.fromisoformat(created_at), str(UUID(table_id))
+        except ValueError:
+            raise ValidationError("Invalid cursor.")
 
 
 class CreateGameTableRequestSerializer(Serializer[dict[str, Any]]):
@@ -100,6 +103,29 @@ class HistoryRequestQuerySerializer(Serializer[dict[str, int]]):
     event: IntegerField = IntegerField(required=True, min_value=0)
 
 
+MAX_HISTORY_RANGE_EVENTS = 5000  # events in a single JSON response, longer ranges have to be streamed
+
+
+class HistoryRangeRequestQuerySerializer(Serializer[dict[str, Any]]):
+    to: IntegerField = IntegerField(required=True, min_value=0)
+    states: BooleanField = BooleanField(required=False, default=False)  # full game states instead of events
+    stream: BooleanField = BooleanField(required=False, default=False)  # NDJSON, one line per state or event
+
+    @override
+    def get_fields(self):
+        fields = super().get_fields()
+        fields["from"] = IntegerField(required=True, min_value=0)  # keyword, can't be declared as an attribute
+        return fields
+
+    @override
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if attrs["from"] > attrs["to"]:
+            raise ValidationError({"from": "Must not be greater than 'to'."})
+        if not attrs["stream"] and attrs["to"] - attrs["from"] > MAX_HISTORY_RANGE_EVENTS:
+            raise ValidationError({"to": f"Ranges longer than {MAX_HISTORY_RANGE_EVENTS} events must be streamed."})
+        return attrs
+
+
 class CommaSeparatedMultipleChoiceField(MultipleChoiceField):
     """MultipleChoiceField that accepts comma-separated values"""
 
@@ -110,6 +136,12 @@ class CommaSeparatedMultipleChoiceField(MultipleChoiceField):
         return super().to_internal_value(split_data)
 
 
+TABLE_LIST_PAGE_SIZE = 10
+MAX_TABLE_LIST_PAGE_SIZE = 100
+
+
 class TableListRequestQuerySerializer(Serializer[dict[str, Any]]):
     status = CommaSeparatedMultipleChoiceField(required=False, default=None, choices=[s.value for s in TableStatus])
     game_name = CommaSeparatedMultipleChoiceField(required=False, default=None, choices=[g.value for g in GameName])
+    cursor = TableCursorField(required=False, default=None)
+    limit = IntegerField(required=False, default=TABLE_LIST_PAGE_SIZE, min_value=1, max_value=MAX_TABLE_LIST_PAGE_SIZE)
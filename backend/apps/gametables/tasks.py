@@ -1,7 +1,12 @@
 import dramatiq
 import logging
 
-from .dependencies import get_table_manager, get_task_lock_repository
+from config import settings
+from game.game_name import GameName
+from .application.game_table_manager import ARCHIVAL_BATCH_SIZE, COMPACTION_BATCH_SIZE
+from .dependencies import get_game_event_repository, get_table_manager, get_task_lock_repository
+from .infra.game_event_archive import export_game_events_archive
+from .registries.game_event_columns_encoders import get_game_event_columns_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +36,92 @@ def create_all_game_state_snapshots_for_table(table_id: str) -> None:
         )
 
         logger.info(f"Game state snapshots for table {table_id} created and stored successfully!")
-    except Exception as e:
-        logger.error(f"Error: {e}")
+    except Exception:
+        logger.exception(f"Game state snapshots creation for table {table_id} failed")
     finally:
         get_task_lock_repository().release_lock(lock_key)
+
+
+@dramatiq.actor(time_limit=60 * 60 * 1000)
+def export_finished_games_events(archive_name: str, game_name: str, table_ids: list[str] | None = None) -> None:
+    """Exports event logs of finished tables to a columnar archive in GAME_EVENT_ARCHIVES_DIR"""
+    lock_key = f"export_finished_games_events:{archive_name}"
+
+    lock_acquired = get_task_lock_repository().set_lock(lock_key)
+
+    if not lock_acquired:
+        logger.info(f"Export of game events to archive {archive_name} already in progress, skipping...")
+        return
+
+    try:
+        path = settings.GAME_EVENT_ARCHIVES_DIR / archive_name
+        if path.parent != settings.GAME_EVENT_ARCHIVES_DIR:
+            logger.error(f"Invalid archive name: {archive_name}")
+            return
+
+        logger.info(f"Starting to export game events of {game_name} tables to archive {path}")
+        parsed_game_name = GameName.from_str(game_name)
+        writer = export_game_events_archive(
+            get_game_event_repository(),
+            get_game_event_columns_encoder(parsed_game_name),
+            path,
+            parsed_game_name,
+            table_ids,
+        )
+
+        logger.info(f"Exported {writer.events_count} events of {len(writer.table_ids)} tables to archive {path}")
+    except Exception:
+        logger.exception(f"Export of game events to archive {archive_name} failed")
+    finally:
+        get_task_lock_repository().release_lock(lock_key)
+
+
+@dramatiq.actor(time_limit=30 * 60 * 1000)
+def compact_ended_games_events() -> None:
+    """Compacts game events of a batch of tables with ended games, enqueues itself until none is left"""
+    lock_key = "compact_ended_games_events"
+
+    lock_acquired = get_task_lock_repository().set_lock(lock_key)
+
+    if not lock_acquired:
+        logger.info("Game events compaction already in progress, skipping...")
+        return
+
+    has_more = False
+    try:
+        tables_count, events_count = get_table_manager().compact_ended_games_events(COMPACTION_BATCH_SIZE)
+        logger.info(f"Compacted {events_count} game events of {tables_count} tables")
+        has_more = tables_count == COMPACTION_BATCH_SIZE
+    except Exception:
+        logger.exception("Game events compaction failed")
+    finally:
+        get_task_lock_repository().release_lock(lock_key)
+
+    if has_more:
+        _ = compact_ended_games_events.send()
+
+
+@dramatiq.actor(time_limit=30 * 60 * 1000)
+def archive_ended_tables() -> None:
+    """Moves a batch of tables with ended games and their game events to the archive, enqueues itself
+    until none is left"""
+    lock_key = "archive_ended_tables"
+
+    lock_acquired = get_task_lock_repository().set_lock(lock_key)
+
+    if not lock_acquired:
+        logger.info("Game tables archival already in progress, skipping...")
+        return
+
+    has_more = False
+    try:
+        tables_count, events_count = get_table_manager().archive_ended_tables(ARCHIVAL_BATCH_SIZE)
+        logger.info(f"Archived {tables_count} tables with {events_count} game events")
+        has_more = tables_count == ARCHIVAL_BATCH_SIZE
+    except Exception:
+        logger.exception("Game tables archival failed")
+    finally:
+        get_task_lock_repository().release_lock(lock_key)
+
+    if has_more:
+        _ = archive_ended_tables.send()
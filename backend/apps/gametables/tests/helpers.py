@@ -0,0 +1,147 @@
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+from apps.users.models import User
+from core.exceptions.not_exist_exception import NotExistException
+from game.common.bot_strategy import BotStrategy
+from game.common.game_event import GameEvent
+from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
+from game.game_name import GameName
+
+from ..application.itable_lease_repository import TableLeaseAcquisition
+from ..configs.five_hundred_table_config import FiveHundredTableConfig
+from ..domain.game_table import GameTable
+from ..domain.game_table_config import GameTableConfig
+from ..registries.game_engines import get_game_engine
+
+OWNER_ID = 1
+
+
+def create_owner() -> User:
+    """User owning tables created by `create_table`, for tests storing them"""
+    return User.objects.create_user(
+        id=OWNER_ID, username="alice", email="alice@example.com", password="alicepass123", screen_name="Alice"
+    )
+
+
+def create_table(
+    bot_strategies: Mapping[int, BotStrategy], owner_seat_number: int | None = None, table_id: str = "test-table-id"
+) -> GameTable:
+    """Five Hundred table with bots at given seats and optionally the owner seated as a human player"""
+    config = GameTableConfig(
+        game_name=GameName.FIVE_HUNDRED,
+        game_config=FiveHundredGameConfig(max_rounds=100, max_bid_no_marriage=120, min_bid=60, give_up_points=50),
+        table_config=FiveHundredTableConfig(automatic_start=False, bots_allowed=True, min_seats=3, max_seats=3),
+    )
+    table = GameTable(
+        table_id=table_id, config=config, engine=get_game_engine(GameName.FIVE_HUNDRED), owner_id=OWNER_ID
+    )
+    if owner_seat_number is not None:
+        table.add_human_player(user_id=OWNER_ID, screen_name="Alice", preferred_seat_number=owner_seat_number)
+    for seat_number, bot_strategy in bot_strategies.items():
+        table.add_bot_player(bot_strategy=bot_strategy, initiated_by=OWNER_ID, preferred_seat_number=seat_number)
+    return table
+
+
+class FakeGameTableRepository:
+    """Keeps tables in memory, modifiers are applied directly like within a transaction"""
+
+    def __init__(self, *tables: GameTable) -> None:
+        self.tables: dict[str, GameTable] = {table.id: table for table in tables}
+        self.find_by_id_calls: int = 0
+
+    def find_by_id(self, id: str) -> GameTable:
+        self.find_by_id_calls += 1
+        if id not in self.tables:
+            raise NotExistException(reason="game_table_not_exist")
+        return self.tables[id]
+
+    def exists(self, id: str) -> bool:
+        return id in self.tables
+
+    def modify_during_game_action(
+        self, table_id: str, modifier: Callable[[GameTable], Sequence[GameEvent]]
+    ) -> tuple[Sequence[GameEvent], GameTable]:
+        table = self.tables[table_id]
+        return modifier(table), table
+
+
+class FakeGameEventRepository:
+    """Serves serialized game events of tables from memory"""
+
+    def __init__(self, raw_events_by_table: Mapping[str, Sequence[dict[str, Any]]] | None = None) -> None:
+        self.raw_events_by_table: dict[str, list[dict[str, Any]]] = {
+            table_id: list(raw_events) for table_id, raw_events in (raw_events_by_table or {}).items()
+        }
+
+    def iter_data(
+        self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None, chunk_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        for raw_event in self.raw_events_by_table.get(table_id, []):
+            if start_inclusive is not None and raw_event["seq_number"] < start_inclusive:
+                continue
+            if end_inclusive is not None and raw_event["seq_number"] > end_inclusive:
+                continue
+            yield raw_event
+
+
+class FakeGameStateSnapshotRepository:
+    """Keeps keyframes and deltas in memory and looks them up like the Redis repository does"""
+
+    def __init__(self) -> None:
+        self.snapshots: dict[str, dict[int, dict[str, Any]]] = {}
+        self.deltas: dict[str, dict[int, list[dict[str, Any]]]] = {}
+        self.store_calls: list[tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]] = []
+
+    def get_exact_or_nearest_snapshot_data(self, table_id: str, event_number: int = 0) -> Mapping[str, Any] | None:
+        snapshots = self.snapshots.get(table_id, {})
+        if event_number in snapshots:
+            return {"is_exact": True, "snapshot": snapshots[event_number], "deltas": []}
+        keyframe_event_number = max((number for number in snapshots if number <= event_number), default=None)
+        if keyframe_event_number is None:
+            return None
+        return {
+            "is_exact": False,
+            "snapshot": snapshots[keyframe_event_number],
+            "deltas": self.deltas.get(table_id, {}).get(keyframe_event_number, []),
+        }
+
+    def store(
+        self,
+        table_id: str,
+        raw_snapshots: Sequence[dict[str, Any]],
+        raw_deltas_by_keyframe: Mapping[int, Sequence[dict[str, Any]]] | None = None,
+    ) -> None:
+        raw_deltas_by_keyframe = {
+            number: list(raw_deltas) for number, raw_deltas in (raw_deltas_by_keyframe or {}).items()
+        }
+        self.store_calls.append((list(raw_snapshots), raw_deltas_by_keyframe))
+        for raw_snapshot in raw_snapshots:
+            self.snapshots.setdefault(table_id, {})[raw_snapshot["event_number"]] = raw_snapshot
+        self.deltas.setdefault(table_id, {}).update(raw_deltas_by_keyframe)
+
+
+class FakeTableLeaseRepository:
+    """Keeps leases in memory, shared by repositories standing for different processes"""
+
+    def __init__(self) -> None:
+        self.owners: dict[str, str] = {}
+        self.released: list[str] = []
+        self.error: Exception | None = None  # raised by every call when set, e.g. Redis being unavailable
+
+    def acquire(self, table_id: str, owner: str) -> TableLeaseAcquisition:
+        if self.error is not None:
+            raise self.error
+        if self.owners.get(table_id) == owner:
+            return TableLeaseAcquisition.RENEWED
+        if table_id in self.owners:
+            return TableLeaseAcquisition.REJECTED
+        self.owners[table_id] = owner
+        return TableLeaseAcquisition.ACQUIRED
+
+    def release(self, table_id: str, owner: str) -> None:
+        if self.error is not None:
+            raise self.error
+        if self.owners.get(table_id) == owner:
+            del self.owners[table_id]
+            self.released.append(table_id)
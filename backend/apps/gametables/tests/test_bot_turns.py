@@ -0,0 +1,168 @@
+from typing import Any, override
+
+from django.test import SimpleTestCase
+
+from game.bot_strategy_kind import BotStrategyKind
+from game.common.bot_strategy import BotStrategy
+from game.common.game_command import GameCommand
+from game.common.game_exception import GameRulesException
+from game.common.game_state import GameState
+from game.five_hundred.domain.five_hundred_command import MakeBidCommand
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+
+from ..application.game_table_manager import GameTableManager
+from ..domain.game_table import BOT_COMMAND_ATTEMPTS, GameTable
+from ..domain.table_status import TableStatus
+from ..exceptions import GameTableRulesException
+from .helpers import (
+    OWNER_ID,
+    FakeGameEventRepository,
+    FakeGameStateSnapshotRepository,
+    FakeGameTableRepository,
+    create_table,
+)
+
+
+class RecordingBotStrategy(BotStrategy):
+    """Random bot which remembers game states it was asked for commands, a retried turn repeats its game state"""
+
+    kind: BotStrategyKind = BotStrategyKind.RANDOM
+
+    def __init__(self) -> None:
+        self.game_states: list[GameState] = []
+        self._strategy: FiveHundredRandomBotStrategy = FiveHundredRandomBotStrategy()
+
+    @override
+    def create_command(self, game_state: GameState) -> GameCommand:
+        self.game_states.append(game_state)
+        return self._strategy.create_command(game_state)
+
+    @property
+    def turns(self) -> int:
+        return len({id(game_state) for game_state in self.game_states})
+
+
+class FailingBotStrategy(RecordingBotStrategy):
+    @override
+    def create_command(self, game_state: GameState) -> GameCommand:
+        self.game_states.append(game_state)
+        return MakeBidCommand(bid=7)  # never valid, bids are multiples of the bid step
+
+
+def create_manager(table: GameTable, max_chained_bot_turns: int) -> GameTableManager:
+    fake: Any = FakeGameTableRepository(table)
+    return GameTableManager(
+        game_table_repository=fake,
+        game_event_repository=FakeGameEventRepository(),
+        game_state_snapshot_repository=FakeGameStateSnapshotRepository(),
+        max_chained_bot_turns=max_chained_bot_turns,
+    )
+
+
+class TestTakeBotTurns(SimpleTestCase):
+    def test_chains_bot_turns_up_to_human_turn(self):
+        bots = {2: RecordingBotStrategy(), 3: RecordingBotStrategy()}
+        table = create_table(bots, owner_seat_number=1)
+        _ = table.start_game(initiated_by=OWNER_ID)
+        human_strategy = FiveHundredRandomBotStrategy()
+
+        for _ in range(50):
+            _ = table.take_bot_turns(max_turns=1000)
+            if table.status != TableStatus.IN_PROGRESS:
+                break
+
+            self.assertFalse(table.active_player.is_bot)
+            try:
+                _ = table.take_regular_turn(
+                    user_id=table.active_player.user_id, command=human_strategy.create_command(table.game_state)
+                )
+            except GameRulesException:
+                continue  # random commands may be invalid, the human tries again
+
+        self.assertGreater(sum(bot.turns for bot in bots.values()), 0)
+
+    def test_stops_after_failed_command_attempts(self):
+        failing_bot = FailingBotStrategy()
+        table = create_table({1: failing_bot, 2: failing_bot, 3: failing_bot})
+        _ = table.start_game(initiated_by=OWNER_ID)
+        active_player = table.active_player
+
+        events = table.take_bot_turns(max_turns=10)
+
+        self.assertEqual(events, [])
+        self.assertEqual(len(failing_bot.game_states), BOT_COMMAND_ATTEMPTS)
+        self.assertEqual(failing_bot.turns, 1)
+        self.assertEqual(table.active_player, active_player)
+        self.assertEqual(table.status, TableStatus.IN_PROGRESS)
+
+    def test_takes_at_most_max_turns(self):
+        bot = RecordingBotStrategy()
+        table = create_table({1: bot, 2: bot, 3: bot})
+        _ = table.start_game(initiated_by=OWNER_ID)
+
+        events = table.take_bot_turns(max_turns=5)
+
+        self.assertEqual(bot.turns, 5)
+        self.assertTrue(events)
+        self.assertTrue(table.active_player.is_bot)
+        self.assertEqual(table.status, TableStatus.IN_PROGRESS)
+
+    def test_does_not_take_turns_before_game_starts(self):
+        bot = RecordingBotStrategy()
+        table = create_table({1: bot, 2: bot, 3: bot})
+
+        self.assertEqual(table.take_bot_turns(max_turns=5), [])
+        self.assertEqual(bot.game_states, [])
+
+
+class TestChainedBotTurns(SimpleTestCase):
+    def test_bot_turns_are_chained_up_to_cap(self):
+        bot = RecordingBotStrategy()
+        table = create_table({1: bot, 2: bot, 3: bot})
+        manager = create_manager(table, max_chained_bot_turns=20)
+
+        events, _ = manager.start_game(table_id=table.id, initiated_by=OWNER_ID)
+
+        # start event(s) and one chain of bot turns, the game is left at a bot's turn for the next action
+        self.assertEqual(bot.turns, 20)
+        self.assertGreater(len(events), 20)
+        self.assertTrue(table.active_player.is_bot)
+
+    def test_automatic_turn_takes_exactly_one_bot_turn(self):
+        bot = RecordingBotStrategy()
+        table = create_table({2: bot, 3: bot}, owner_seat_number=1)
+        manager = create_manager(table, max_chained_bot_turns=0)
+        _ = manager.start_game(table_id=table.id, initiated_by=OWNER_ID)
+        human_strategy = FiveHundredRandomBotStrategy()
+
+        for _ in range(100):
+            if table.active_player.is_bot:
+                break
+            try:
+                _ = table.take_regular_turn(user_id=OWNER_ID, command=human_strategy.create_command(table.game_state))
+            except GameRulesException:
+                continue  # random commands may be invalid, the human tries again
+        self.assertTrue(table.active_player.is_bot)
+        event_number = table.game_state.event_number
+
+        for _ in range(BOT_COMMAND_ATTEMPTS):
+            try:
+                _ = manager.take_automatic_turn(table_id=table.id, initiated_by=OWNER_ID)
+                break
+            except GameRulesException:
+                continue  # a random command of the bot may be invalid, the player tries again
+
+        self.assertEqual(bot.turns, 1)
+        self.assertGreater(table.game_state.event_number, event_number)
+
+    def test_automatic_turn_is_rejected_for_owner_without_seat(self):
+        bot = RecordingBotStrategy()
+        table = create_table({1: bot, 2: bot, 3: bot})
+        manager = create_manager(table, max_chained_bot_turns=0)
+        _ = manager.start_game(table_id=table.id, initiated_by=OWNER_ID)
+
+        with self.assertRaises(GameTableRulesException) as context:
+            _ = manager.take_automatic_turn(table_id=table.id, initiated_by=OWNER_ID)
+
+        self.assertEqual(context.exception.reason, "not_player_of_table")
+        self.assertEqual(bot.game_states, [])
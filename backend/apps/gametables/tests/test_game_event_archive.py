@@ -0,0 +1,113 @@
+import tempfile
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, cast
+
+from django.test import SimpleTestCase
+
+from core.exceptions.infrastructure_exception import InfrastructureException
+from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
+from game.five_hundred.five_hundred_event_columns import FiveHundredEventColumnsEncoder
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from game.five_hundred.five_hundred_simulation import play_game
+from game.game_name import GameName
+
+from ..domain.table_status import TableStatus
+from ..infra import game_event_archive
+from ..infra.game_event_archive import GameEventArchive, GameEventArchiveWriter, export_game_events_archive
+
+CONFIG = FiveHundredGameConfig(max_rounds=3, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+BOTS = [FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy]
+
+
+class FakeGameEventRepository:
+    """Streams serialized events of tables from memory, sorted like the database repository does"""
+
+    def __init__(self, raw_events_by_table: Mapping[str, Sequence[dict[str, Any]]]) -> None:
+        self.raw_events_by_table: Mapping[str, Sequence[dict[str, Any]]] = raw_events_by_table
+
+    def iter_tables_events(
+        self,
+        game_name: GameName,
+        table_ids: Collection[str] | None = None,
+        statuses: Collection[TableStatus] | None = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple[str, int, dict[str, Any]]]:
+        for table_id in sorted(self.raw_events_by_table):
+            if table_ids is None or table_id in table_ids:
+                for raw_event in self.raw_events_by_table[table_id]:
+                    yield table_id, raw_event["seq_number"], raw_event
+
+
+class TestGameEventArchive(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.raw_events_by_table = {
+            f"table-{seed}": play_game(CONFIG, BOTS, seed=seed, collect_events=True).events for seed in range(3)
+        }
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.path = Path(temp_dir.name) / "archive"
+        self.encoder = FiveHundredEventColumnsEncoder()
+        self.repository = cast(Any, FakeGameEventRepository(self.raw_events_by_table))
+
+    def test_archived_events_decode_to_encoded_rows(self):
+        writer = export_game_events_archive(self.repository, self.encoder, self.path, GameName.FIVE_HUNDRED)
+
+        self.assertEqual(writer.table_ids, sorted(self.raw_events_by_table))
+        with GameEventArchive(self.path) as archive:
+            self.assertEqual(list(archive.table_ids), sorted(self.raw_events_by_table))
+            self.assertEqual(list(archive.event_types), list(self.encoder.event_types))
+            self.assertEqual(len(archive), sum(len(events) for events in self.raw_events_by_table.values()))
+            columns = archive.columns
+            for table_index, table_id in enumerate(archive.table_ids):
+                raw_events = self.raw_events_by_table[table_id]
+                rows = archive.table_rows(table_index)
+                self.assertEqual(len(rows), len(raw_events))
+                for row, raw_event in zip(rows, raw_events, strict=True):
+                    expected = self.encoder.to_row(raw_event)
+                    self.assertEqual(columns["table"][row], table_index)
+                    self.assertEqual(columns["seq"][row], raw_event["seq_number"])
+                    self.assertEqual(
+                        (columns["type"][row], columns["seat"][row], columns["card"][row], columns["bid"][row]),
+                        (expected.type_code, expected.seat, expected.card, expected.bid),
+                    )
+                    self.assertEqual(archive.cards(row).tolist(), list(expected.cards))
+                    self.assertEqual(archive.points(row).tolist(), list(expected.points))
+
+    def test_columns_are_flushed_in_buffers(self):
+        original_buffer_size = game_event_archive.COLUMN_BUFFER_SIZE
+        game_event_archive.COLUMN_BUFFER_SIZE = 7
+        self.addCleanup(setattr, game_event_archive, "COLUMN_BUFFER_SIZE", original_buffer_size)
+
+        _ = export_game_events_archive(self.repository, self.encoder, self.path, GameName.FIVE_HUNDRED)
+
+        with GameEventArchive(self.path) as archive:
+            self.assertEqual(
+                archive.columns["seq"].tolist()[: len(self.raw_events_by_table["table-0"])],
+                [raw_event["seq_number"] for raw_event in self.raw_events_by_table["table-0"]],
+            )
+            self.assertEqual(archive.columns["table_offsets"][-1], len(archive))
+
+    def test_selected_tables_are_exported(self):
+        writer = export_game_events_archive(
+            self.repository, self.encoder, self.path, GameName.FIVE_HUNDRED, table_ids=["table-1"]
+        )
+
+        self.assertEqual(writer.table_ids, ["table-1"])
+        self.assertEqual(writer.events_count, len(self.raw_events_by_table["table-1"]))
+
+    def test_failed_export_can_not_be_opened(self):
+        with (
+            self.assertRaises(ValueError),
+            GameEventArchiveWriter(self.path, GameName.FIVE_HUNDRED, self.encoder.event_types) as writer,
+        ):
+            writer.add_event("table-0", 1, self.encoder.to_row(self.raw_events_by_table["table-0"][0]))
+            raise ValueError("export failed")
+
+        with self.assertRaises(InfrastructureException) as context:
+            _ = GameEventArchive(self.path)
+        self.assertEqual(context.exception.reason, "game_event_archive_error")
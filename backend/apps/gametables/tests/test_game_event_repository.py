@@ -0,0 +1,136 @@
+from typing import Any
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.test import TestCase
+
+from game.game_name import GameName
+
+from ..domain.table_status import TableStatus
+from ..infra.game_event_repository import GameEventRepository
+from ..models import CompactedGameEventsModel, GameEventModel, GameTableModel
+
+
+def create_table_model(status: TableStatus = TableStatus.FINISHED) -> str:
+    table_id = str(uuid4())
+    _ = GameTableModel.objects.create(id=table_id, game_name=GameName.FIVE_HUNDRED.value, status=status.value)
+    return table_id
+
+
+def raw_event(table_id: str, seq_number: int) -> dict[str, Any]:
+    return {"type": "card_played", "table": table_id, "seq_number": seq_number}
+
+
+def add_event_rows(table_id: str, seq_numbers: range) -> list[dict[str, Any]]:
+    raw_events = [raw_event(table_id, seq_number) for seq_number in seq_numbers]
+    _ = GameEventModel.objects.bulk_create(
+        [GameEventModel(game_table_id=table_id, sequence_number=data["seq_number"], data=data) for data in raw_events]
+    )
+    return raw_events
+
+
+class TestGameEventsCompaction(TestCase):
+    def setUp(self):
+        self.repository = GameEventRepository()
+        self.table_id = create_table_model()
+        self.raw_events = add_event_rows(self.table_id, range(1, 21))
+
+    def test_event_rows_are_replaced_by_compacted_events(self):
+        compacted_count = self.repository.compact(self.table_id)
+
+        self.assertEqual(compacted_count, 20)
+        self.assertFalse(GameEventModel.objects.filter(game_table_id=self.table_id).exists())
+        compacted = CompactedGameEventsModel.objects.get(game_table_id=self.table_id)
+        self.assertEqual((compacted.first_sequence_number, compacted.events_count), (1, 20))
+        self.assertEqual(list(self.repository.iter_data(self.table_id)), self.raw_events)
+        self.assertEqual([event.data for event in self.repository.find_many(self.table_id)], self.raw_events)
+
+    def test_events_of_tables_in_progress_are_not_compacted(self):
+        table_id = create_table_model(TableStatus.IN_PROGRESS)
+        _ = add_event_rows(table_id, range(1, 4))
+
+        self.assertEqual(self.repository.compact(table_id), 0)
+        self.assertEqual(GameEventModel.objects.filter(game_table_id=table_id).count(), 3)
+        self.assertEqual(self.repository.find_table_ids_to_compact(limit=10), [self.table_id])
+
+    def test_ranges_of_compacted_events(self):
+        _ = self.repository.compact(self.table_id)
+
+        # (start_inclusive, end_inclusive) -> sequence numbers
+        ranges = {
+            (None, None): list(range(1, 21)),
+            (5, 9): [5, 6, 7, 8, 9],
+            (0, 1): [1],
+            (20, 20): [20],
+            (19, None): [19, 20],
+            (None, 19): list(range(1, 20)),
+            (18, 25): [18, 19, 20],
+            (21, None): [],
+            (10, 9): [],
+        }
+        for (start_inclusive, end_inclusive), seq_numbers in ranges.items():
+            with self.subTest(start_inclusive=start_inclusive, end_inclusive=end_inclusive):
+                raw_events = self.repository.iter_data(self.table_id, start_inclusive, end_inclusive)
+                self.assertEqual([data["seq_number"] for data in raw_events], seq_numbers)
+                events = self.repository.find_many(self.table_id, start_inclusive, end_inclusive)
+                self.assertEqual([event.sequence_number for event in events], seq_numbers)
+
+    def test_rows_added_after_compaction_are_read_and_compacted_again(self):
+        _ = self.repository.compact(self.table_id)
+        late_raw_events = add_event_rows(self.table_id, range(21, 24))
+
+        self.assertEqual(
+            list(self.repository.iter_data(self.table_id, 19, 22)), self.raw_events[18:] + late_raw_events[:2]
+        )
+        self.assertEqual(self.repository.find_table_ids_to_compact(limit=10), [self.table_id])
+
+        self.assertEqual(self.repository.compact(self.table_id), 3)
+        compacted = CompactedGameEventsModel.objects.get(game_table_id=self.table_id)
+        self.assertEqual((compacted.first_sequence_number, compacted.events_count), (1, 23))
+        self.assertEqual(list(self.repository.iter_data(self.table_id)), self.raw_events + late_raw_events)
+        self.assertEqual(self.repository.find_table_ids_to_compact(limit=10), [])
+
+
+class TestTablesEvents(TestCase):
+    def setUp(self):
+        self.repository = GameEventRepository()
+        # tables sorted by ID have different event counts and are stored as rows, compacted or archived in turns
+        table_ids = sorted(create_table_model() for _ in range(6))
+        self.raw_events_by_table: dict[str, list[dict[str, Any]]] = {
+            table_id: add_event_rows(table_id, range(1, 6 + index)) for index, table_id in enumerate(table_ids)
+        }
+        for table_id in table_ids[1::3]:
+            _ = self.repository.compact(table_id)
+        for table_id in table_ids[2::3]:
+            _ = self.repository.archive(table_id)
+        # a row added after compaction
+        next_seq_number = self.raw_events_by_table[table_ids[1]][-1]["seq_number"] + 1
+        self.raw_events_by_table[table_ids[1]] += add_event_rows(
+            table_ids[1], range(next_seq_number, next_seq_number + 1)
+        )
+
+    def test_events_of_rows_compacted_and_archived_tables_are_merged_in_order(self):
+        with patch("apps.gametables.infra.game_event_repository.COMPACTED_TABLES_CHUNK_SIZE", 1):
+            events = list(self.repository.iter_tables_events(GameName.FIVE_HUNDRED, chunk_size=4))
+
+        expected = [
+            (table_id, data["seq_number"], data)
+            for table_id in sorted(self.raw_events_by_table)
+            for data in self.raw_events_by_table[table_id]
+        ]
+        self.assertEqual(events, expected)
+
+    def test_events_of_selected_tables(self):
+        table_ids = sorted(self.raw_events_by_table)[1:3]
+
+        events = list(self.repository.iter_tables_events(GameName.FIVE_HUNDRED, table_ids=table_ids, chunk_size=4))
+
+        self.assertEqual(
+            [table_id for table_id, _, _ in events],
+            [table_id for table_id in table_ids for _ in self.raw_events_by_table[table_id]],
+        )
+
+    def test_events_of_tables_with_other_statuses_are_skipped(self):
+        events = list(self.repository.iter_tables_events(GameName.FIVE_HUNDRED, statuses=[TableStatus.ABORTED]))
+
+        self.assertEqual(events, [])
@@ -0,0 +1,315 @@
+import itertools
+import json
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, cast, override
+from unittest.mock import PropertyMock, patch
+
+from django.test import SimpleTestCase
+from rest_framework.test import APIClient
+
+from core.exceptions.app_exception import AppException
+from core.exceptions.infrastructure_exception import InfrastructureException
+from core.exceptions.not_exist_exception import NotExistException
+from game.common.game_state import GameState
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+
+from ..application.game_table_manager import SNAPSHOTS_STORE_BATCH_SIZE, GameTableManager
+from ..domain.game_table import GameTable
+from ..domain.snapshot_policy import SnapshotPolicy
+from ..domain.table_status import TableStatus
+from ..registries.game_event_parsers import get_game_event_parser
+from ..serializers import MAX_HISTORY_RANGE_EVENTS
+from .helpers import (
+    OWNER_ID,
+    FakeGameEventRepository,
+    FakeGameStateSnapshotRepository,
+    FakeGameTableRepository,
+    create_table,
+)
+
+
+@dataclass(frozen=True)
+class FakeGameState:
+    event_number: int
+    replay_safe_event_number: int
+
+
+def play_bots_only_game(seed: int) -> tuple[GameTable, list[dict[str, Any]]]:
+    """Plays a game of bots to its end, returns the table and its serialized events"""
+    bot = FiveHundredRandomBotStrategy(random.Random(seed))
+    table = create_table({1: bot, 2: bot, 3: bot})
+    events = list(table.start_game(initiated_by=OWNER_ID))
+    while table.status == TableStatus.IN_PROGRESS:
+        events.extend(table.take_bot_turns(max_turns=100))
+    return table, [event.to_dict() for event in events]
+
+
+class TestSnapshotPolicy(SimpleTestCase):
+    def is_checkpoint(self, policy: SnapshotPolicy, event_number: int, replay_safe_event_number: int) -> bool:
+        return policy.is_checkpoint(cast(GameState, FakeGameState(event_number, replay_safe_event_number)))
+
+    def test_initial_game_state_is_checkpoint(self):
+        policy = SnapshotPolicy(at_replay_safe_events=False, every_n_events=None)
+
+        self.assertTrue(self.is_checkpoint(policy, 0, 0))
+        self.assertFalse(self.is_checkpoint(policy, 5, 5))
+
+    def test_checkpoint_at_replay_safe_events(self):
+        policy = SnapshotPolicy(at_replay_safe_events=True, every_n_events=None)
+
+        self.assertTrue(self.is_checkpoint(policy, 25, 25))
+        self.assertFalse(self.is_checkpoint(policy, 26, 25))
+
+    def test_checkpoint_every_n_events(self):
+        policy = SnapshotPolicy(at_replay_safe_events=True, every_n_events=10)
+
+        self.assertTrue(self.is_checkpoint(policy, 20, 13))
+        self.assertTrue(self.is_checkpoint(policy, 13, 13))
+        self.assertFalse(self.is_checkpoint(policy, 21, 13))
+
+
+class BotsOnlyGameTestCase(SimpleTestCase):
+    """Manager with fake repositories serving one ended game of bots"""
+
+    table: GameTable
+    raw_events: list[dict[str, Any]]
+    game_states: list[dict[str, Any]]
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.table, cls.raw_events = play_bots_only_game(seed=7)
+        # game states after each event, replayed without snapshots
+        game_state = cls.table.get_initial_or_after_event_game_state(None, None)
+        cls.game_states = [game_state.to_dict()]
+        for event in get_game_event_parser(cls.table.config.game_name).parse_many(cls.raw_events):
+            game_state = cls.table.get_initial_or_after_event_game_state(game_state, event)
+            cls.game_states.append(game_state.to_dict())
+
+    def setUp(self):
+        self.table_repository = FakeGameTableRepository(self.table)
+        self.snapshot_repository = FakeGameStateSnapshotRepository()
+        self.manager = GameTableManager(
+            game_table_repository=cast(Any, self.table_repository),
+            game_event_repository=cast(Any, FakeGameEventRepository({self.table.id: self.raw_events})),
+            game_state_snapshot_repository=self.snapshot_repository,
+        )
+
+    def checkpoint_event_numbers(self) -> list[int]:
+        # Five Hundred checkpoints are the initial game state and game states at replay safe events (round ends)
+        return [
+            game_state["event_number"]
+            for game_state in self.game_states
+            if game_state["event_number"] in (0, game_state["replay_safe_event_number"])
+        ]
+
+
+class TestGameStateSnapshots(BotsOnlyGameTestCase):
+    def test_snapshot_chain_is_complete_up_to_last_delta(self):
+        data = {"snapshot": {"event_number": 10}, "deltas": [{}, {}, {}]}
+
+        self.assertTrue(self.manager._is_snapshot_chain_complete(data, 10))
+        self.assertTrue(self.manager._is_snapshot_chain_complete(data, 13))
+        self.assertFalse(self.manager._is_snapshot_chain_complete(data, 14))
+
+    def test_keyframes_are_stored_only_at_checkpoints(self):
+        raw_game_state = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+
+        self.assertEqual(raw_game_state, self.table.game_state.to_dict())
+        keyframe_event_numbers = sorted(self.snapshot_repository.snapshots[self.table.id])
+        self.assertEqual(keyframe_event_numbers, self.checkpoint_event_numbers())
+        self.assertLess(len(keyframe_event_numbers), len(self.raw_events) // 5)
+
+    def test_deltas_follow_each_keyframe_up_to_the_next_one(self):
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+
+        deltas = self.snapshot_repository.deltas[self.table.id]
+        for keyframe_event_number, raw_deltas in deltas.items():
+            self.assertEqual(
+                [raw_delta["seq_number"] for raw_delta in raw_deltas],
+                list(range(keyframe_event_number + 1, keyframe_event_number + 1 + len(raw_deltas))),
+            )
+        # every event is stored exactly once
+        self.assertEqual(
+            sorted(raw_delta["seq_number"] for raw_deltas in deltas.values() for raw_delta in raw_deltas),
+            [raw_event["seq_number"] for raw_event in self.raw_events],
+        )
+
+    def test_snapshots_are_stored_in_batches(self):
+        self.assertGreater(len(self.raw_events), 2 * SNAPSHOTS_STORE_BATCH_SIZE)
+
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+
+        store_calls = self.snapshot_repository.store_calls
+        self.assertGreater(len(store_calls), 1)
+        for _, raw_deltas_by_keyframe in store_calls[:-1]:
+            # a batch is stored at the first keyframe after collecting enough deltas, so it ends at a keyframe
+            deltas_count = sum(len(raw_deltas) for raw_deltas in raw_deltas_by_keyframe.values())
+            last_chain_length = len(raw_deltas_by_keyframe[max(raw_deltas_by_keyframe)])
+            self.assertGreaterEqual(deltas_count, SNAPSHOTS_STORE_BATCH_SIZE)
+            self.assertLess(deltas_count - last_chain_length, SNAPSHOTS_STORE_BATCH_SIZE)
+
+    def test_replay_can_be_resumed_from_stored_keyframe(self):
+        up_to_event_number = len(self.raw_events) // 2
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=up_to_event_number
+        )
+        data = self.snapshot_repository.get_exact_or_nearest_snapshot_data(self.table.id, up_to_event_number)
+        assert data is not None
+
+        raw_game_state = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=data["snapshot"], up_to_event_number=None
+        )
+
+        self.assertEqual(raw_game_state, self.table.game_state.to_dict())
+        self.assertEqual(sorted(self.snapshot_repository.snapshots[self.table.id]), self.checkpoint_event_numbers())
+
+    def test_game_states_are_rebuilt_from_keyframes_and_deltas(self):
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+
+        for event_number in [0, 1, 2, 7, 30, len(self.raw_events) // 2, len(self.raw_events)]:
+            raw_game_state = self.manager.get_game_state_snapshot(self.table.id, event_number)
+            self.assertEqual(raw_game_state, self.game_states[event_number], event_number)
+
+
+class TestGameHistoryCache(BotsOnlyGameTestCase):
+    def setUp(self):
+        super().setUp()
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+
+    def test_adjacent_game_states_are_served_from_cache(self):
+        _ = self.manager.get_game_state_snapshot(self.table.id, 30)
+
+        for event_number in [31, 32, 33]:
+            raw_game_state = self.manager.get_game_state_snapshot(self.table.id, event_number)
+            self.assertEqual(raw_game_state, self.game_states[event_number])
+        self.assertEqual(self.table_repository.find_by_id_calls, 1)
+
+    def test_deleted_table_is_not_served_from_cache(self):
+        _ = self.manager.get_game_state_snapshot(self.table.id, 30)
+
+        del self.table_repository.tables[self.table.id]
+
+        for event_number in [30, 31]:
+            with self.assertRaises(NotExistException):
+                _ = self.manager.get_game_state_snapshot(self.table.id, event_number)
+
+    def test_only_validated_events_are_cached(self):
+        # the table is loaded mid-round, while deltas of the whole round (and game) are stored
+        replay_safe_event_number = next(number for number in self.checkpoint_event_numbers() if number > 100) + 5
+        with patch.object(
+            GameTable, "replay_safe_game_event_number", new_callable=PropertyMock, return_value=replay_safe_event_number
+        ):
+            _ = self.manager.get_game_state_snapshot(self.table.id, replay_safe_event_number - 1)
+            with self.assertRaises(AppException) as context:
+                _ = self.manager.get_game_state_snapshot(self.table.id, replay_safe_event_number + 1)
+
+        self.assertEqual(context.exception.reason, "event_number_too_large")
+        for event_number in range(replay_safe_event_number + 1, len(self.raw_events) + 1):
+            self.assertIsNone(self.manager._game_events_cache.get((self.table.id, event_number)), event_number)
+            self.assertIsNone(self.manager._game_states_cache.get((self.table.id, event_number)), event_number)
+
+
+class FailingGameEventRepository(FakeGameEventRepository):
+    """Fails after serving a few events, like a lost database connection while streaming"""
+
+    @override
+    def iter_data(
+        self, table_id: str, start_inclusive: int | None = None, end_inclusive: int | None = None, chunk_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        yield from itertools.islice(super().iter_data(table_id, start_inclusive, end_inclusive, chunk_size), 3)
+        raise InfrastructureException(reason="database_error")
+
+
+class TestGameHistory(BotsOnlyGameTestCase):
+    def test_game_states_follow_game_state_at_from_event(self):
+        game_state, items = self.manager.get_game_history(self.table.id, 30, 40, with_game_states=True)
+
+        self.assertEqual(game_state, self.game_states[30])
+        self.assertEqual(list(items), self.game_states[31:41])
+
+    def test_events_follow_game_state_at_from_event(self):
+        game_state, items = self.manager.get_game_history(self.table.id, 30, 40)
+
+        self.assertEqual(game_state, self.game_states[30])
+        self.assertEqual(list(items), self.raw_events[30:40])
+
+    def test_table_is_loaded_once(self):
+        _, items = self.manager.get_game_history(self.table.id, 30, 40, with_game_states=True)
+        _ = list(items)
+
+        self.assertEqual(self.table_repository.find_by_id_calls, 1)
+
+    def test_range_beyond_replay_safe_event_is_rejected(self):
+        with (
+            patch.object(GameTable, "replay_safe_game_event_number", new_callable=PropertyMock, return_value=35),
+            self.assertRaises(AppException) as context,
+        ):
+            _ = self.manager.get_game_history(self.table.id, 30, 40)
+
+        self.assertEqual(context.exception.reason, "event_number_too_large")
+        self.assertEqual(context.exception.context["operation"], "get_game_history")
+
+    def test_errors_while_iterating_carry_context(self):
+        _ = self.manager.create_and_store_game_state_snapshots(
+            self.table, raw_initial_game_state=None, up_to_event_number=None
+        )
+        self.manager._game_event_repository = FailingGameEventRepository({self.table.id: self.raw_events})
+        _, items = self.manager.get_game_history(self.table.id, 30, 40)
+
+        with self.assertRaises(InfrastructureException) as context:
+            _ = list(items)
+
+        self.assertEqual(
+            context.exception.context,
+            {"table_id": self.table.id, "event_number": 40, "operation": "get_game_history"},
+        )
+
+
+class TestGameHistoryView(BotsOnlyGameTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.url = f"/api/v1/tables/{self.table.id}/game-history/"
+        patcher = patch("apps.gametables.views.get_table_manager", return_value=self.manager)
+        _ = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_range_is_streamed_as_ndjson(self):
+        response = self.client.get(self.url, {"from": 30, "to": 40, "stream": "true"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(lines[0], {"game_state": self.game_states[30]})
+        self.assertEqual(lines[1:], [{"event": raw_event} for raw_event in self.raw_events[30:40]])
+
+    def test_range_of_game_states_is_returned_as_json(self):
+        response = self.client.get(self.url, {"from": 30, "to": 33, "states": "true"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"game_state": self.game_states[30], "game_states": self.game_states[31:34]})
+
+    def test_from_greater_than_to_is_rejected(self):
+        response = self.client.get(self.url, {"from": 40, "to": 30})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("from", response.json())
+
+    def test_long_range_has_to_be_streamed(self):
+        response = self.client.get(self.url, {"from": 0, "to": MAX_HISTORY_RANGE_EVENTS + 1})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("to", response.json())
@@ -0,0 +1,380 @@
+import random
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any, cast
+from unittest.mock import patch
+from uuid import uuid4
+
+from django.db.models import F
+from django.test import TestCase
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from core.exceptions.infrastructure_exception import InfrastructureException
+from game.common.game_ending import GameEndingReason
+from game.common.game_event import GameEvent
+from game.common.game_exception import GameRulesException
+from game.five_hundred.domain.five_hundred_command import EndGameCommand
+from game.five_hundred.five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+
+from ..domain.game_table import GameTable
+from ..domain.table_status import TableStatus
+from ..exceptions import GameTableInternalException, GameTableRulesException
+from ..infra.game_event_repository import GameEventRepository
+from ..infra.game_table_repository import MODIFY_ATTEMPTS, GameTableRepository
+from ..models import ArchivedGameTableModel, CompactedGameEventsModel, GameEventModel, GameTableModel
+from .helpers import OWNER_ID, FakeTableLeaseRepository, create_owner, create_table
+
+SNAPSHOT_INTERVAL_EVENTS = 20
+
+
+class GameTableRepositoryTestCase(TestCase):
+    """Bots-only table stored by a repository with leases, game actions are taken by bots turn by turn"""
+
+    @classmethod
+    def setUpTestData(cls):
+        _ = create_owner()
+
+    def setUp(self):
+        self.leases = FakeTableLeaseRepository()
+        self.repository = self.create_repository()
+        bot = FiveHundredRandomBotStrategy(random.Random(3))
+        self.table_id = self.repository.create(create_table({1: bot, 2: bot, 3: bot}, table_id=str(uuid4())))
+
+    def create_repository(self) -> GameTableRepository:
+        """Repository of another process, sharing the leases"""
+        return GameTableRepository(
+            table_lease_repository=cast(Any, self.leases), snapshot_interval_events=SNAPSHOT_INTERVAL_EVENTS
+        )
+
+    def start_game(self) -> GameTable:
+        _, table = self.repository.modify_during_game_action(
+            self.table_id, lambda table: table.start_game(initiated_by=OWNER_ID)
+        )
+        return table
+
+    def take_bot_turn(self, repository: GameTableRepository | None = None) -> tuple[Sequence[GameEvent], GameTable]:
+        repository = repository or self.repository
+        return repository.modify_during_game_action(self.table_id, lambda table: table.take_bot_turns(max_turns=1))
+
+    def stored_version(self) -> int:
+        return GameTableModel.objects.get(id=self.table_id).version
+
+    def stored_seq_numbers(self) -> list[int]:
+        return list(
+            GameEventModel.objects.filter(game_table_id=self.table_id)
+            .order_by("sequence_number")
+            .values_list("sequence_number", flat=True)
+        )
+
+
+class TestHotGameTables(GameTableRepositoryTestCase):
+    def test_table_in_progress_is_kept_in_memory_of_lease_owner(self):
+        table = self.start_game()
+
+        hot_table = self.repository._hot_tables.get(self.table_id)
+        assert hot_table is not None
+        self.assertIs(hot_table.game_table, table)
+        self.assertEqual(hot_table.version, self.stored_version())
+
+        _, table = self.take_bot_turn()
+
+        self.assertIs(table, hot_table.game_table)
+        self.assertEqual(self.stored_seq_numbers(), list(range(1, table.game_state.event_number + 1)))
+
+    def test_snapshots_are_stored_at_round_ends_every_interval_and_status_changes(self):
+        table = self.start_game()
+        hot_table = self.repository._hot_tables.get(self.table_id)
+        assert hot_table is not None
+        persisted_event_number = table.game_state.event_number
+
+        reasons: set[str] = set()
+        for _ in range(500):
+            version = self.stored_version()
+            _, table = self.take_bot_turn()
+            game_state = table.game_state
+
+            reason = None
+            if game_state.replay_safe_event_number > persisted_event_number:
+                reason = "round_end"
+            elif game_state.event_number - persisted_event_number >= SNAPSHOT_INTERVAL_EVENTS:
+                reason = "interval"
+            self.assertEqual(self.stored_version(), version if reason is None else version + 1, game_state)
+            self.assertEqual(self.stored_seq_numbers(), list(range(1, game_state.event_number + 1)))
+            if reason is not None:
+                reasons.add(reason)
+                persisted_event_number = game_state.event_number
+                self.assertEqual(hot_table.persisted_event_number, persisted_event_number)
+            if reasons == {"round_end", "interval"}:
+                break
+        self.assertEqual(reasons, {"round_end", "interval"})
+
+        version = self.stored_version()
+        _, table = self.repository.modify_during_game_action(
+            self.table_id,
+            lambda table: table.cancel_game(
+                initiated_by=OWNER_ID, command=EndGameCommand(reason=GameEndingReason.CANCELLED)
+            ),
+        )
+
+        self.assertEqual(table.status, TableStatus.CANCELLED)
+        self.assertEqual(self.stored_version(), version + 1)
+        self.assertEqual(GameTableModel.objects.get(id=self.table_id).status, TableStatus.CANCELLED.value)
+        # ended tables are not kept in memory
+        self.assertIsNone(self.repository._hot_tables.get(self.table_id))
+        self.assertEqual(self.leases.released, [self.table_id])
+
+    def test_stored_snapshot_is_caught_up_with_events_when_loaded(self):
+        table = self.start_game()
+        version = self.stored_version()
+        # a few bidding turns, before the round could end or the interval could pass
+        for _ in range(2):
+            _, table = self.take_bot_turn()
+
+        self.assertEqual(table.replay_safe_game_event_number, 0)
+        self.assertEqual(self.stored_version(), version)
+        loaded_table = self.create_repository().find_by_id(self.table_id)
+
+        self.assertEqual(loaded_table.game_state.event_number, table.game_state.event_number)
+        self.assertEqual(loaded_table.game_state.to_dict(), table.game_state.to_dict())
+
+    def test_outdated_table_in_memory_is_dropped_and_action_repeated_on_stored_table(self):
+        self.start_game()
+        other_repository = self.create_repository()
+        _, other_table = self.take_bot_turn(other_repository)  # the lease is held by the first repository
+        self.assertIsNone(other_repository._hot_tables.get(self.table_id))
+
+        _, table = self.take_bot_turn()
+
+        self.assertIsNone(self.repository._hot_tables.get(self.table_id))
+        self.assertEqual(self.leases.released, [self.table_id])
+        self.assertGreater(table.game_state.event_number, other_table.game_state.event_number)
+        self.assertEqual(self.stored_seq_numbers(), list(range(1, table.game_state.event_number + 1)))
+        self.assertEqual(
+            self.create_repository().find_by_id(self.table_id).game_state.to_dict(), table.game_state.to_dict()
+        )
+
+    def test_rejected_action_keeps_table_in_memory(self):
+        table = self.start_game()
+        hot_table = self.repository._hot_tables.get(self.table_id)
+        game_state = table.game_state
+
+        with self.assertRaises(GameTableRulesException):
+            _ = self.repository.modify_during_game_action(
+                self.table_id, lambda table: table.start_game(initiated_by=OWNER_ID)
+            )
+
+        self.assertIsNotNone(hot_table)
+        self.assertIs(self.repository._hot_tables.get(self.table_id), hot_table)
+        self.assertIs(table.game_state, game_state)
+
+    def test_table_in_memory_is_dropped_after_unexpected_error(self):
+        self.start_game()
+
+        def _modifier(table: GameTable) -> Sequence[GameEvent]:
+            _ = table.take_bot_turns(max_turns=1)
+            raise RuntimeError("unexpected")
+
+        with self.assertRaises(RuntimeError):
+            _ = self.repository.modify_during_game_action(self.table_id, _modifier)
+
+        self.assertIsNone(self.repository._hot_tables.get(self.table_id))
+
+    def test_table_in_memory_is_dropped_when_bot_turn_fails_after_human_move(self):
+        bot = FiveHundredRandomBotStrategy(random.Random(3))
+        self.table_id = self.repository.create(
+            create_table({2: bot, 3: bot}, owner_seat_number=1, table_id=str(uuid4()))
+        )
+        human = FiveHundredRandomBotStrategy(random.Random(5))
+
+        def take_human_turn(table: GameTable) -> Sequence[GameEvent]:
+            while True:
+                try:
+                    return table.take_regular_turn(OWNER_ID, human.create_command(table.game_state))
+                except GameRulesException:
+                    continue
+
+        def _modifier(table: GameTable) -> Sequence[GameEvent]:
+            events = take_human_turn(table)
+            error = GameTableInternalException(reason="bot_failed", detail="Could not take bot's turn")
+            with patch.object(FiveHundredRandomBotStrategy, "create_command", side_effect=error):
+                return [*events, *table.take_bot_turns(max_turns=1)]
+
+        table = self.start_game()
+        # the human move may be followed by the human's turn again, then it's repeated until a bot follows it
+        for _ in range(50):
+            while table.active_player.is_bot:
+                _, table = self.take_bot_turn()
+            game_state = table.game_state.to_dict()
+            seq_numbers = self.stored_seq_numbers()
+            try:
+                _, table = self.repository.modify_during_game_action(self.table_id, _modifier)
+            except GameTableInternalException:
+                break
+        else:
+            self.fail("human move was never followed by a bot turn")
+
+        self.assertIsNone(self.repository._hot_tables.get(self.table_id))
+        self.assertEqual(self.stored_seq_numbers(), seq_numbers)
+        self.assertEqual(self.create_repository().find_by_id(self.table_id).game_state.to_dict(), game_state)
+
+        _, table = self.repository.modify_during_game_action(self.table_id, take_human_turn)
+
+        self.assertEqual(self.stored_seq_numbers(), list(range(1, table.game_state.event_number + 1)))
+
+    def test_tables_are_modified_without_leases_when_redis_is_unavailable(self):
+        self.leases.error = RedisConnectionError("unavailable")
+
+        table = self.start_game()
+        _, table = self.take_bot_turn()
+
+        self.assertIsNone(self.repository._hot_tables.get(self.table_id))
+        self.assertEqual(self.stored_seq_numbers(), list(range(1, table.game_state.event_number + 1)))
+        self.repository.delete(self.table_id)
+        self.assertFalse(GameTableModel.objects.filter(id=self.table_id).exists())
+
+
+class TestConcurrentModifications(GameTableRepositoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.start_game()
+        # repositories without leases modify stored tables only
+        self.repository = GameTableRepository()
+        patcher = patch("apps.gametables.infra.game_table_repository.time.sleep")
+        _ = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_modification_is_repeated_when_version_changed_after_load(self):
+        attempts: list[int] = []
+
+        def _modifier(table: GameTable) -> None:
+            attempts.append(table.game_state.event_number)
+            if len(attempts) == 1:
+                _ = GameTableModel.objects.filter(id=self.table_id).update(version=F("version") + 1)
+
+        version = self.stored_version()
+        _ = self.repository.modify(self.table_id, _modifier)
+
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(self.repository.conflicts, 1)
+        self.assertEqual(self.stored_version(), version + 2)
+
+    def test_modification_fails_after_all_attempts_conflicted(self):
+        def _modifier(table: GameTable) -> Sequence[GameEvent]:
+            _ = GameTableModel.objects.filter(id=self.table_id).update(version=F("version") + 1)
+            return table.take_bot_turns(max_turns=1)
+
+        seq_numbers = self.stored_seq_numbers()
+        with self.assertRaises(InfrastructureException) as context:
+            _ = self.repository.modify_during_game_action(self.table_id, _modifier)
+
+        self.assertEqual(context.exception.reason, "game_table_modified_concurrently")
+        self.assertEqual(self.repository.conflicts, MODIFY_ATTEMPTS)
+        # events of failed attempts are rolled back with their snapshots
+        self.assertEqual(self.stored_seq_numbers(), seq_numbers)
+
+    def test_game_action_is_repeated_when_its_events_were_stored_concurrently(self):
+        other_repository = GameTableRepository()
+        attempts: list[int] = []
+
+        def _modifier(table: GameTable) -> Sequence[GameEvent]:
+            attempts.append(table.game_state.event_number)
+            if len(attempts) == 1:
+                db_game_table = GameTableModel.objects.get(id=self.table_id)
+                _ = self.take_bot_turn(other_repository)
+                # the stored version is left as loaded, so only the event sequence numbers clash
+                _ = GameTableModel.objects.filter(id=self.table_id).update(version=db_game_table.version)
+            return table.take_bot_turns(max_turns=1)
+
+        with patch.object(
+            GameTableRepository, "_store_snapshot", autospec=True, side_effect=GameTableRepository._store_snapshot
+        ) as store_snapshot:
+            _, table = self.repository.modify_during_game_action(self.table_id, _modifier)
+
+        self.assertEqual(len(attempts), 2)
+        self.assertGreater(attempts[1], attempts[0])
+        self.assertEqual(self.repository.conflicts, 1)
+        # the first attempt failed on inserting events, before its snapshot was stored
+        stored_by_repository = [call for call in store_snapshot.call_args_list if call.args[0] is self.repository]
+        self.assertEqual(len(stored_by_repository), 1)
+        self.assertEqual(self.stored_seq_numbers(), list(range(1, table.game_state.event_number + 1)))
+
+
+class TestArchivedGameTables(GameTableRepositoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.event_repository = GameEventRepository()
+        self.start_game()
+        for _ in range(3):
+            _ = self.take_bot_turn()
+        _, self.table = self.repository.modify_during_game_action(
+            self.table_id,
+            lambda table: table.cancel_game(
+                initiated_by=OWNER_ID, command=EndGameCommand(reason=GameEndingReason.CANCELLED)
+            ),
+        )
+        self.raw_events = list(self.event_repository.iter_data(self.table_id))
+
+    def test_ended_table_is_moved_to_archive_with_its_events(self):
+        archived_count = self.event_repository.archive(self.table_id)
+
+        self.assertEqual(archived_count, self.table.game_state.event_number)
+        self.assertFalse(GameTableModel.objects.filter(id=self.table_id).exists())
+        self.assertFalse(GameEventModel.objects.filter(game_table_id=self.table_id).exists())
+        archived_table = ArchivedGameTableModel.objects.get(id=self.table_id)
+        self.assertEqual(archived_table.status, TableStatus.CANCELLED.value)
+        self.assertEqual(list(self.event_repository.iter_data(self.table_id)), self.raw_events)
+
+    def test_compacted_events_are_archived(self):
+        _ = self.event_repository.compact(self.table_id)
+
+        self.assertEqual(self.event_repository.archive(self.table_id), len(self.raw_events))
+        self.assertFalse(CompactedGameEventsModel.objects.filter(game_table_id=self.table_id).exists())
+        self.assertEqual(list(self.event_repository.iter_data(self.table_id, 2, 3)), self.raw_events[1:3])
+
+    def test_table_in_progress_is_not_archived(self):
+        table_id = self.repository.create(create_table({}, owner_seat_number=1, table_id=str(uuid4())))
+
+        self.assertEqual(self.event_repository.archive(table_id), 0)
+        self.assertTrue(GameTableModel.objects.filter(id=table_id).exists())
+
+    def test_tables_ended_before_are_found_to_archive_oldest_first(self):
+        ended_at = GameTableModel.objects.get(id=self.table_id).updated_at
+        other_table_id = self.repository.create(create_table({}, owner_seat_number=1, table_id=str(uuid4())))
+        _ = GameTableModel.objects.filter(id=other_table_id).update(
+            status=TableStatus.FINISHED.value, updated_at=ended_at - timedelta(hours=1)
+        )
+
+        find = self.event_repository.find_table_ids_to_archive
+        self.assertEqual(find(limit=10, ended_before=ended_at + timedelta(seconds=1)), [other_table_id, self.table_id])
+        self.assertEqual(find(limit=1, ended_before=ended_at + timedelta(seconds=1)), [other_table_id])
+        self.assertEqual(find(limit=10, ended_before=ended_at), [other_table_id])
+
+    def test_archived_table_is_found_by_id(self):
+        _ = self.event_repository.archive(self.table_id)
+
+        table = self.create_repository().find_by_id(self.table_id)
+
+        self.assertEqual(table.status, TableStatus.CANCELLED)
+        self.assertEqual(table.game_state.to_dict(), self.table.game_state.to_dict())
+        self.assertTrue(self.repository.exists(self.table_id))
+
+    def test_archived_tables_are_listed_only_with_ended_statuses(self):
+        table_id = self.repository.create(create_table({}, owner_seat_number=1, table_id=str(uuid4())))
+        _ = self.event_repository.archive(self.table_id)
+
+        def listed(statuses: set[str]) -> set[str]:
+            return {str(table["id"]) for table in self.repository.find_many(filters={"status": statuses})}
+
+        self.assertEqual(listed(set()), {table_id, self.table_id})
+        self.assertEqual(listed({TableStatus.CANCELLED.value}), {self.table_id})
+        self.assertEqual(listed({TableStatus.NOT_STARTED.value}), {table_id})
+        tables, _ = self.repository.find_page(filters={"status": {TableStatus.CANCELLED.value}}, limit=10)
+        self.assertEqual([str(table["id"]) for table in tables], [self.table_id])
+
+    def test_archived_table_is_deleted(self):
+        _ = self.event_repository.archive(self.table_id)
+
+        self.repository.delete(self.table_id)
+
+        self.assertFalse(self.repository.exists(self.table_id))
+        self.assertEqual(list(self.event_repository.iter_data(self.table_id)), [])
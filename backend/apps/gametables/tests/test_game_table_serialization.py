@@ -1,18 +1,19 @@
 import json
-from django.test import TestCase
 
-from .domain.table_status import TableStatus
-from game.five_hundred.five_hundred_command_parser import FiveHundredCommandParser
+from django.test import TestCase
 
-from .configs.five_hundred_table_config import FiveHundredTableConfig
-from game.game_name import GameName
 from game.bot_strategy_kind import BotStrategyKind
 from game.five_hundred.domain.five_hundred_game_config import FiveHundredGameConfig
-from .domain.game_table import GameTable
-from .domain.game_table_config import GameTableConfig
-from .infra.game_table_deserializer import GameTableDeserializer
-from .registries.game_engines import get_game_engine
-from .registries.bot_strategies import get_bot_strategy
+from game.five_hundred.five_hundred_command_parser import FiveHundredCommandParser
+from game.game_name import GameName
+
+from ..configs.five_hundred_table_config import FiveHundredTableConfig
+from ..domain.game_table import GameTable
+from ..domain.game_table_config import GameTableConfig
+from ..domain.table_status import TableStatus
+from ..infra.game_table_deserializer import GameTableDeserializer
+from ..registries.bot_strategies import get_bot_strategy
+from ..registries.game_engines import get_game_engine
 
 
 class TestGameTableSerialization(TestCase):
@@ -23,20 +24,20 @@ class TestGameTableSerialization(TestCase):
         # Arrange - Create and start game
         config = GameTableConfig(
             game_name=GameName.FIVE_HUNDRED,
-            game_config=FiveHundredGameConfig(max_rounds=100, max_bid_no_marriage=120, min_bid=60),
+            game_config=FiveHundredGameConfig(max_rounds=100, max_bid_no_marriage=120, min_bid=60, give_up_points=50),
             table_config=FiveHundredTableConfig(automatic_start=True, bots_allowed=True, min_seats=3, max_seats=3),
         )
         engine = get_game_engine(GameName.FIVE_HUNDRED)
         original_table = GameTable(table_id="test-table-id", config=config, engine=engine, owner_id=1)
 
-        original_table.add_player(user_id=1, screen_name="Alice", preferred_seat_number=1)
-        original_table.add_player(user_id=2, screen_name="Bob", preferred_seat_number=2)
-        original_table.add_player(
-            screen_name="Charlie",
-            preferred_seat_number=3,
+        original_table.add_human_player(user_id=1, screen_name="Alice", preferred_seat_number=1)
+        original_table.add_human_player(user_id=2, screen_name="Bob", preferred_seat_number=2)
+        original_table.add_bot_player(
             bot_strategy=get_bot_strategy(GameName.FIVE_HUNDRED, BotStrategyKind.RANDOM),
+            initiated_by=1,
+            preferred_seat_number=3,
         )
-        original_table.start_game()
+        original_table.start_game(initiated_by=1)
         _ = original_table.take_regular_turn(
             user_id=1, command=FiveHundredCommandParser().from_dict({"type": "make_bid", "params": {"bid": 100}})
         )
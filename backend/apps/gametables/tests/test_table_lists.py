@@ -0,0 +1,202 @@
+import importlib
+from base64 import urlsafe_b64encode
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from django.apps import apps
+from django.test import SimpleTestCase, TestCase
+from rest_framework.exceptions import ValidationError
+
+from ..domain.table_status import TableStatus
+from ..infra.game_table_repository import GameTableRepository
+from ..infra.game_table_serializer import GameTableSerializer
+from ..models import ArchivedGameTableModel, GameTableModel
+from ..serializers import GameTableListSerializer, TableCursorField, encode_table_cursor
+from .helpers import OWNER_ID, create_owner, create_table
+
+lobby_projection_migration = importlib.import_module("apps.gametables.migrations.0005_lobby_projection")
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def encode(text: str) -> str:
+    return urlsafe_b64encode(text.encode()).decode()
+
+
+class TestTableCursorField(SimpleTestCase):
+    def test_cursor_is_decoded_to_position_of_table(self):
+        table_id = str(uuid4())
+
+        position = TableCursorField().to_internal_value(encode_table_cursor({"created_at": CREATED_AT, "id": table_id}))
+
+        self.assertEqual(position, (CREATED_AT, table_id))
+
+    def test_invalid_cursors_are_rejected(self):
+        cursors = {
+            "bad base64": "not-base64!",
+            "bad utf-8": urlsafe_b64encode(b"\xff\xfe").decode(),
+            "no separator": encode(CREATED_AT.isoformat()),
+            "bad date": encode(f"yesterday|{uuid4()}"),
+            "bad UUID": encode(f"{CREATED_AT.isoformat()}|not-a-uuid"),
+        }
+        for name, cursor in cursors.items():
+            with self.subTest(name), self.assertRaises(ValidationError):
+                _ = TableCursorField().to_internal_value(cursor)
+
+
+class TestGameTableListSerializer(SimpleTestCase):
+    def test_lobby_projection_is_merged_into_table_row(self):
+        lobby = {"players": [{"user": OWNER_ID, "seat_number": 1}], "player_count": 1, "table_config": {}}
+        table_id = uuid4()
+        table = {
+            "id": table_id,
+            "game_name": "five_hundred",
+            "status": "not_started",
+            "owner_id": OWNER_ID,
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+            "lobby": lobby,
+        }
+
+        data = GameTableListSerializer(table).data
+
+        self.assertEqual(data["id"], str(table_id))
+        self.assertEqual(data["owner_id"], OWNER_ID)
+        self.assertEqual(data["created_at"], CREATED_AT.isoformat().replace("+00:00", "Z"))
+        self.assertEqual(data["players"], lobby["players"])
+        self.assertEqual(data["player_count"], 1)
+        self.assertNotIn("lobby", data)
+
+    def test_table_without_lobby_projection_is_listed_without_players(self):
+        table = {
+            "id": uuid4(),
+            "game_name": "five_hundred",
+            "status": "not_started",
+            "owner_id": None,
+            "created_at": CREATED_AT,
+            "updated_at": CREATED_AT,
+            "lobby": None,
+        }
+
+        data = GameTableListSerializer(table).data
+
+        self.assertEqual(set(data), {"id", "game_name", "status", "owner_id", "created_at", "updated_at"})
+
+
+class TestTablePages(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        _ = create_owner()
+
+    def setUp(self):
+        self.repository = GameTableRepository()
+        # tables created at the same time are ordered by ID, hot and archived tables interleave
+        self.table_ids: list[str] = []
+        for index in range(7):
+            created_at = CREATED_AT + timedelta(minutes=index // 2)
+            if index % 3 == 2:
+                self.table_ids.append(self.create_archived_table(created_at))
+            else:
+                self.table_ids.append(self.create_table(created_at))
+
+    def create_table(self, created_at: datetime) -> str:
+        table_id = self.repository.create(create_table({}, table_id=str(uuid4())))
+        _ = GameTableModel.objects.filter(id=table_id).update(created_at=created_at)
+        return table_id
+
+    def create_archived_table(self, created_at: datetime) -> str:
+        table = ArchivedGameTableModel.objects.create(
+            id=uuid4(),
+            game_name="five_hundred",
+            status=TableStatus.FINISHED.value,
+            owner_id=OWNER_ID,
+            created_at=created_at,
+            updated_at=created_at,
+            lobby={"players": [], "player_count": 0},
+        )
+        return str(table.id)
+
+    def list_pages(self, filters: dict[str, Any], limit: int) -> list[list[str]]:
+        pages: list[list[str]] = []
+        after = None
+        while True:
+            tables, has_next = self.repository.find_page(filters=filters, limit=limit, after=after)
+            pages.append([str(table["id"]) for table in tables])
+            if not has_next:
+                return pages
+            after = (tables[-1]["created_at"], str(tables[-1]["id"]))
+
+    def newest_first(self, table_ids: list[str]) -> list[str]:
+        created_at = {
+            str(table["id"]): table["created_at"]
+            for model in (GameTableModel, ArchivedGameTableModel)
+            for table in model.objects.filter(id__in=table_ids).values("id", "created_at")
+        }
+        return sorted(table_ids, key=lambda table_id: (created_at[table_id], table_id), reverse=True)
+
+    def test_hot_and_archived_tables_are_paged_newest_first(self):
+        pages = self.list_pages(filters={}, limit=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([table_id for page in pages for table_id in page], self.newest_first(self.table_ids))
+
+    def test_last_full_page_has_no_next_page(self):
+        pages = self.list_pages(filters={}, limit=7)
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(pages[0], self.newest_first(self.table_ids))
+
+    def test_archive_is_not_read_for_active_statuses(self):
+        hot_table_ids = [str(table_id) for table_id in GameTableModel.objects.values_list("id", flat=True)]
+
+        with self.assertNumQueries(2):
+            pages = self.list_pages(filters={"status": {TableStatus.NOT_STARTED.value}}, limit=3)
+
+        self.assertEqual([table_id for page in pages for table_id in page], self.newest_first(hot_table_ids))
+
+    def test_table_being_archived_is_listed_once(self):
+        # the table is copied to the archive before it's deleted from hot tables
+        db_game_table = GameTableModel.objects.get(id=self.table_ids[0])
+        _ = ArchivedGameTableModel.objects.create(
+            id=db_game_table.id,
+            game_name=db_game_table.game_name,
+            status=TableStatus.FINISHED.value,
+            owner_id=db_game_table.owner_id,
+            created_at=db_game_table.created_at,
+            updated_at=db_game_table.updated_at,
+            lobby=db_game_table.lobby,
+        )
+
+        pages = self.list_pages(filters={}, limit=3)
+
+        self.assertEqual([table_id for page in pages for table_id in page], self.newest_first(self.table_ids))
+
+
+class TestLobbyProjectionMigration(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        _ = create_owner()
+
+    def test_projections_of_packed_and_json_snapshots_match_live_ones(self):
+        repository = GameTableRepository()
+        table = create_table({}, owner_seat_number=2, table_id=str(uuid4()))
+        packed_table_id = repository.create(table)
+        json_table_id = repository.create(create_table({}, owner_seat_number=1, table_id=str(uuid4())))
+        json_table = GameTableModel.objects.get(id=json_table_id)
+        _ = GameTableModel.objects.filter(id=json_table_id).update(
+            snapshot=repository.codec.decode(json_table.packed_snapshot), packed_snapshot=None
+        )
+        expected = {
+            table_id: GameTableSerializer.serialize_lobby(
+                GameTableSerializer.serialize_table(repository.find_by_id(table_id))
+            )
+            for table_id in (packed_table_id, json_table_id)
+        }
+        _ = GameTableModel.objects.update(lobby=None)
+
+        lobby_projection_migration.fill_lobby_projections(apps, schema_editor=None)
+
+        for table_id, lobby in expected.items():
+            self.assertEqual(GameTableModel.objects.get(id=table_id).lobby, lobby)
+        self.assertEqual(expected[packed_table_id]["players"][0]["seat_number"], 2)
@@ -1,4 +1,7 @@
-from typing import override
+from collections.abc import Iterator
+from typing import Any, override
+import json
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.viewsets import ViewSet
@@ -6,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework.permissions import AllowAny, BasePermission, IsAuthenticated
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.utils.urls import replace_query_param
 import logging
 
 from .tasks import create_all_game_state_snapshots_for_table
@@ -13,12 +17,14 @@ from .tasks import create_all_game_state_snapshots_for_table
 from .serializers import (
     AddBotRequestSerializer,
     CreateGameTableRequestSerializer,
-    GameTableWithRelationsSerializer,
+    GameTableListSerializer,
+    HistoryRangeRequestQuerySerializer,
     HistoryRequestQuerySerializer,
     JoinGameTableRequestSerializer,
     RemoveBotRequestSerializer,
     TableListRequestQuerySerializer,
     TakeRegularTurnRequestSerializer,
+    encode_table_cursor,
 )
 from .dependencies import get_game_table_repository, get_table_manager
 
@@ -35,20 +41,32 @@ class GameTableViewSet(ViewSet):
 
     def list(self, request: Request):
         """
-        GET /status=not_started,in_progress&game_name=five_hundred
+        GET /?status=not_started,in_progress&game_name=five_hundred&limit=10&cursor=...
         Query params:
           - status: multiple choice (e.g., status=not_started, in_progress, finished)
           - game_name: multiple choice (e.g., game_name=five_hundred, other_game_name)
+          - limit: tables per page, 10 by default
+          - cursor: position after the last table of the previous page, as in `next` of the previous response
+          - offset: page by offset instead of cursor, the response also counts all tables (slow on deep pages)
+        Tables are listed newest first.
         """
         request_serializer = TableListRequestQuerySerializer(data=request.query_params)
         _ = request_serializer.is_valid(raise_exception=True)
-
-        tables = get_game_table_repository().find_many(filters=request_serializer.validated_data)
-
-        paginator = LimitOffsetPagination()
-        page = paginator.paginate_queryset(tables, request)
-        response_serializer = GameTableWithRelationsSerializer(page, many=True)
-        return paginator.get_paginated_response(response_serializer.data)
+        filters = request_serializer.validated_data
+        repository = get_game_table_repository()
+
+        if "offset" in request.query_params:
+            paginator = LimitOffsetPagination()
+            page = paginator.paginate_queryset(repository.find_many(filters=filters), request)
+            return paginator.get_paginated_response(GameTableListSerializer(page, many=True).data)
+
+        tables, has_next = repository.find_page(filters=filters, limit=filters["limit"], after=filters["cursor"])
+        next_url = (
+            replace_query_param(request.build_absolute_uri(), "cursor", encode_table_cursor(tables[-1]))
+            if has_next
+            else None
+        )
+        return Response({"next": next_url, "results": GameTableListSerializer(tables, many=True).data})
 
     def create(self, request: Request):
         """
@@ -194,10 +212,19 @@ class GameTableViewSet(ViewSet):
         return Response({}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=["get"], url_path="game-history")
-    def get_game_history(self, request: Request, pk: str) -> Response:
+    def get_game_history(self, request: Request, pk: str) -> Response | StreamingHttpResponse:
         """
         GET /{table_id}/game-history?event=12
+        GET /{table_id}/game-history?from=12&to=80&states=false&stream=false
+        Query params for a range:
+          - from, to: event numbers, the game state after `from` is returned with events up to `to`
+          - states: return game states after each event instead of the events
+          - stream: stream as NDJSON, the first line is {"game_state": ...}, then {"event": ...}
+            or {"game_state": ...} per event
         """
+        if "from" in request.query_params or "to" in request.query_params:
+            return self._get_game_history_range(request, pk)
+
         serializer = HistoryRequestQuerySerializer(data=request.query_params)
         _ = serializer.is_valid(raise_exception=True)
 
@@ -207,6 +234,31 @@ class GameTableViewSet(ViewSet):
 
         return Response(data={"game_state": snapshot}, status=status.HTTP_200_OK)
 
+    def _get_game_history_range(self, request: Request, pk: str) -> Response | StreamingHttpResponse:
+        serializer = HistoryRangeRequestQuerySerializer(data=request.query_params)
+        _ = serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        game_state, items = get_table_manager().get_game_history(
+            table_id=pk,
+            from_event_number=params["from"],
+            to_event_number=params["to"],
+            with_game_states=params["states"],
+        )
+        items_key = "game_state" if params["states"] else "event"
+
+        if params["stream"]:
+
+            def _lines() -> Iterator[str]:
+                yield json.dumps({"game_state": game_state}) + "\n"
+                for item in items:
+                    yield json.dumps({items_key: item}) + "\n"
+
+            return StreamingHttpResponse(_lines(), content_type="application/x-ndjson")
+
+        data: dict[str, Any] = {"game_state": game_state, f"{items_key}s": list(items)}
+        return Response(data=data, status=status.HTTP_200_OK)
+
     @action(detail=True, methods=["POST"], url_path="create-game-history")
     def create_game_history(self, request: Request, pk: str) -> Response:
         """
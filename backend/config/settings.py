@@ -167,6 +167,12 @@ DRAMATIQ_BROKER = {
 DRAMATIQ_TASKS_DATABASE = "default"
 DRAMATIQ_AUTODISCOVER_MODULES = ["tasks"]
 
+# game tables in progress are kept in memory of the process holding their lease, so game actions store only events
+HOT_GAME_TABLES_ENABLED = os.getenv("HOT_GAME_TABLES_ENABLED", "true").lower() == "true"
+
+# local directory for columnar game event archives exported by background tasks
+GAME_EVENT_ARCHIVES_DIR = Path(os.getenv("GAME_EVENT_ARCHIVES_DIR", BASE_DIR / "archives")).resolve()
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
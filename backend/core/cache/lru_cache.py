@@ -0,0 +1,44 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class LruCache[K: Hashable, V]:
+    """Bounded in-process cache: least recently used entries are evicted above `max_size`,
+    entries older than `ttl_seconds` are treated as missing. Safe to share between threads."""
+
+    def __init__(self, max_size: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self._max_size: int = max_size
+        self._ttl_seconds: float = ttl_seconds
+        self._clock: Callable[[], float] = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()  # key -> (expires at, value)
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                _ = self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            _ = self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
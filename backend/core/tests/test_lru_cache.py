@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from core.cache.lru_cache import LruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLruCache(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache: LruCache[str, int] = LruCache(max_size=2, ttl_seconds=10, clock=self.clock)
+
+    def test_get_returns_put_value_and_counts_hits_and_misses(self):
+        self.cache.put("a", 1)
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_least_recently_used_entry_is_evicted_above_max_size(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        _ = self.cache.get("a")  # "b" becomes the least recently used entry
+
+        self.cache.put("c", 3)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_put_of_existing_key_replaces_value_without_eviction(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+
+        self.cache.put("a", 10)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get("a"), 10)
+        self.assertEqual(self.cache.get("b"), 2)
+
+    def test_entry_expires_after_ttl(self):
+        self.cache.put("a", 1)
+
+        self.clock.now = 9.9
+        self.assertEqual(self.cache.get("a"), 1)
+
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_put_renews_ttl(self):
+        self.cache.put("a", 1)
+        self.clock.now = 5
+        self.cache.put("a", 2)
+
+        self.clock.now = 14
+        self.assertEqual(self.cache.get("a"), 2)
+
+    def test_discard_removes_entry(self):
+        self.cache.put("a", 1)
+
+        self.cache.discard("a")
+        self.cache.discard("missing")
+
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
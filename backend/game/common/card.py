@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Self, override
+from typing import Any, Self, override
 
 from .game_exception import GameParsingException
 
@@ -112,14 +113,98 @@ SUIT_COLORS = {
 }
 
 
+class CardRegistry:
+    """Interned (flyweight) cards of a single card class together with lookup tables built once per class.
+
+    Every suit/rank combination has exactly one instance, so parsing and constructing cards is a table lookup.
+    Ordinals (see `Card.ordinal`) are assigned lazily, because they depend on card strength.
+    """
+
+    def __init__(self, card_class: type["Card"]) -> None:
+        self.card_class: type[Card] = card_class
+        self.by_suit_and_rank: dict[tuple[Suit, Rank], Card] = {}
+        self.by_string: dict[str, Card] = {}
+        self._all_cards: tuple[Card, ...] | None = None
+
+        for suit in Suit:
+            for rank in Rank:
+                card = object.__new__(card_class)
+                object.__setattr__(card, "suit", suit)
+                object.__setattr__(card, "rank", rank)
+                object.__setattr__(card, "_symbol", f"{rank.symbol}{suit.symbol}")
+                card._precompute()
+                self.by_suit_and_rank[(suit, rank)] = card
+                for rank_symbol in {rank.symbol.upper(), rank.symbol.lower()}:
+                    for suit_symbol in {suit.symbol.upper(), suit.symbol.lower()}:
+                        self.by_string[f"{rank_symbol}{suit_symbol}"] = card
+
+    @property
+    def all_cards(self) -> tuple["Card", ...]:
+        if self._all_cards is None:
+            ranks = set(self.card_class.ranks())
+            cards_in_play = sorted(
+                (card for card in self.by_suit_and_rank.values() if card.rank in ranks),
+                key=lambda card: (card.suit.symbol, -card.strength().value),
+            )
+            cards_not_in_play = [card for card in self.by_suit_and_rank.values() if card.rank not in ranks]
+            # cards not in play get ordinals after all cards in play, so they never collide with them in card sets
+            for ordinal, card in enumerate(cards_in_play + cards_not_in_play):
+                object.__setattr__(card, "_ordinal", ordinal)
+            self._all_cards = tuple(cards_in_play)
+        return self._all_cards
+
+
+_REGISTRIES: dict[type["Card"], CardRegistry] = {}
+
+
 @dataclass(frozen=True, slots=True)
 class Card(ABC):
+    """Playing card. Cards are interned: constructing or parsing a card returns the canonical instance of its class."""
+
     suit: Suit
     rank: Rank
+    _symbol: str = field(init=False, repr=False, compare=False)
+    _ordinal: int = field(init=False, repr=False, compare=False)
+
+    def __new__(cls, suit: Suit, rank: Rank) -> Self:
+        return cls.registry().by_suit_and_rank[(suit, rank)]
+
+    @classmethod
+    def registry(cls) -> CardRegistry:
+        registry = _REGISTRIES.get(cls)
+        if registry is None:
+            registry = CardRegistry(cls)
+            _REGISTRIES[cls] = registry
+        return registry
+
+    def _precompute(self) -> None:
+        """Hook for card classes to precompute per-card values once, when the interned instance is created"""
+
+    @classmethod
+    def ranks(cls) -> Sequence[Rank]:
+        """Ranks this card class is played with. Defaults to the full rank range."""
+        return tuple(Rank)
+
+    @classmethod
+    def all_cards(cls) -> Sequence[Self]:
+        """Every distinct card of this class in hand order: grouped by suit symbol, strongest card first."""
+        return cls.registry().all_cards
+
+    @property
+    def ordinal(self) -> int:
+        """Position of the card in `all_cards()`, used as its bit index in card sets"""
+        try:
+            return self._ordinal
+        except AttributeError:
+            _ = type(self).registry().all_cards
+            return self._ordinal
 
     @classmethod
     def from_string(cls, card_str: str) -> Self:
         """Create a card from string representation. Format is 'rank' + 'suit'. E.g. 'Ah', '2D', 'Tc'."""
+        card = cls.registry().by_string.get(card_str)
+        if card is not None:
+            return card
         rank = Rank.from_string(card_str[0])
         suit = Suit.from_string(card_str[1])
         return cls(suit=suit, rank=rank)
@@ -129,16 +214,21 @@ class Card(ABC):
 
     def to_dict(self) -> str:
         """Serialize to JSON-compatible string"""
-        return f"{self.rank.symbol}{self.suit.symbol}"
+        return self._symbol
 
     @classmethod
     def from_dict(cls, data: str) -> Self:
         """Reconstruct from JSON-compatible string"""
         return cls.from_string(data)
 
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        # unpickled/copied cards resolve back to the interned instance
+        return (type(self).from_string, (self._symbol,))
+
     @override
     def __str__(self) -> str:
-        return f"{SUIT_COLORS[self.suit]}{self.rank.symbol}{self.suit.symbol}\033[0m"
+        return f"{SUIT_COLORS[self.suit]}{self._symbol}\033[0m"
 
     @override
     def __repr__(self) -> str:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
 from random import shuffle
 from typing import Callable, Generic, Self, TypeVar, override
 
@@ -10,44 +11,56 @@ TCard = TypeVar("TCard", bound=Card)
 
 @dataclass(frozen=True, slots=True)
 class Deck(ABC, Generic[TCard]):
-    _cards: list[TCard]
+    """Immutable deck. Cards are never removed from it - drawing returns the drawn cards and a deck with
+    the deal cursor moved, so the same deck (e.g. one stored in an event) can be dealt from any number of times.
+    """
+
+    _cards: Sequence[TCard]  # whole deck in its initial order, top of the deck is the last card
     shuffle_fn: Callable[[list[TCard]], None] = shuffle
     shuffle_on_init: bool = True  # if True, the deck is shuffled when it is initialized
-    _undealed_deck: list[TCard] = field(default_factory=list)
+    dealt_count: int = 0  # deal cursor: how many cards are already drawn from the top of the deck
 
     def __post_init__(self) -> None:
         if self.shuffle_on_init:
-            self.shuffle_fn(self._cards)
-        object.__setattr__(self, "_undealed_deck", self._cards.copy())
+            cards = list(self._cards)
+            self.shuffle_fn(cards)
+            object.__setattr__(self, "_cards", tuple(cards))
+        elif not isinstance(self._cards, tuple):
+            object.__setattr__(self, "_cards", tuple(self._cards))
+
+    @property
+    def remaining_cards(self) -> Sequence[TCard]:
+        return self._cards[: len(self._cards) - self.dealt_count]
 
-    def draw_one(self) -> TCard:
-        return self._cards.pop()
+    def draw_one(self) -> tuple[TCard, Self]:
+        top_index = len(self._cards) - self.dealt_count - 1
+        return self._cards[top_index], replace(self, shuffle_on_init=False, dealt_count=self.dealt_count + 1)
 
-    def draw_many(self, count: int) -> list[TCard]:
-        take = min(max(count, 0), len(self._cards))
-        dealt = self._cards[-take:]
-        del self._cards[-take:]
-        return dealt
+    def draw_many(self, count: int) -> tuple[list[TCard], Self]:
+        end = len(self._cards) - self.dealt_count
+        take = min(max(count, 0), end)
+        dealt = list(self._cards[end - take : end])
+        return dealt, replace(self, shuffle_on_init=False, dealt_count=self.dealt_count + take)
 
     @classmethod
     @abstractmethod
-    def build(cls) -> Self: ...
+    def build(cls, shuffle_fn: Callable[[list[TCard]], None] = shuffle) -> Self: ...
 
     @classmethod
     @abstractmethod
     def from_card_strings(cls, card_strings: list[str]) -> Self: ...
 
     def to_dict(self) -> list[str]:
-        return [card.to_dict() for card in self._undealed_deck]
+        return [card.to_dict() for card in self._cards]
 
     @classmethod
     def from_dict(cls, data: list[str], card_class: type[TCard]) -> Self:
         """Reconstruct from JSON-compatible list of strings"""
-        return cls([card_class.from_dict(card) for card in data], shuffle_on_init=False)
+        return cls(tuple(card_class.from_dict(card) for card in data), shuffle_on_init=False)
 
     @override
     def __str__(self) -> str:
-        return f"{' '.join(str(card) for card in self._cards)}"
+        return f"{' '.join(str(card) for card in self.remaining_cards)}"
 
     @override
     def __repr__(self) -> str:
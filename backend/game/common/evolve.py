@@ -0,0 +1,8 @@
+from typing import Any
+
+# Helpers of fast-path `dataclasses.replace` methods (`evolve`) of frozen game state dataclasses, which copy
+# an instance field by field without going through the generated __init__ and __post_init__.
+
+KEEP: Any = object()  # default of `evolve` parameters, for fields which are not changed
+
+set_field = object.__setattr__  # sets fields of frozen dataclasses
@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+NO_VALUE = -1  # stored in numeric columns of events without the field
+
+
+@dataclass(frozen=True, slots=True)
+class GameEventRow:
+    """Serialized game event flattened to numeric columns, for columnar exports of event logs."""
+
+    type_code: int  # index of the event type in `GameEventColumnsEncoder.event_types`
+    seat: int = NO_VALUE
+    card: int = NO_VALUE  # card ordinal
+    bid: int = NO_VALUE
+    cards: Sequence[int] = ()  # card ordinals of events with many cards, e.g. shuffled deck, taken trick
+    points: Sequence[int] = ()  # points gained by the seat, or per-seat points ordered by seat number
+
+
+class GameEventColumnsEncoder(Protocol):
+    @property
+    def event_types(self) -> Sequence[str]:
+        """Event types of the game, position in the sequence is the type code. New types are only appended."""
+        ...
+
+    def to_row(self, data: dict[str, Any]) -> GameEventRow: ...
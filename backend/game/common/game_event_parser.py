@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any, Protocol
 
 from .game_event import GameEvent
@@ -5,3 +6,7 @@ from .game_event import GameEvent
 
 class GameEventParser(Protocol):
     def from_dict(self, data: dict[str, Any]) -> GameEvent: ...
+
+    def parse_many(self, rows: Sequence[dict[str, Any]]) -> list[GameEvent]:
+        """Parses a batch of serialized events, in order. Parsers can override it to avoid per-event overhead."""
+        return [self.from_dict(data) for data in rows]
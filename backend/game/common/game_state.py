@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Self
 
 from .game_ending import GameEnding
 from .game_config import GameConfig
-from .seat import Seat, SeatNumber
+from .seat import Seat, SeatNumber, SeatRing
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,6 +16,12 @@ class GameState(ABC):
     turn_number: int  # total turns made in the game so far
     event_number: int  # total events processed so far
     replay_safe_event_number: int  # event number to which we can replay game history without exposing private details
+    seat_ring: SeatRing = field(
+        init=False, repr=False, compare=False
+    )  # derived from taken_seats, shared between states
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "seat_ring", SeatRing.of(self.taken_seats))
 
     @classmethod
     @abstractmethod
@@ -0,0 +1,12 @@
+from typing import Any, Protocol
+
+from .game_state import GameState
+
+
+class GameStateCodec(Protocol):
+    """Compact, storage-only encoding of game states (JSON-compatible flat list).
+    `GameState.to_dict` stays the format exposed through the public API."""
+
+    def encode(self, game_state: GameState) -> list[Any]: ...
+
+    def decode(self, data: list[Any]) -> GameState: ...
@@ -1,37 +1,98 @@
-from collections.abc import Sequence
-from dataclasses import dataclass
-from typing import Generic, TypeVar, override
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Generic, TypeVar, override
 
 from .game_exception import GameEngineException
-from .card import Card
+from .card import Card, Suit
 
 TCard = TypeVar("TCard", bound=Card)
 
+# per card class: bitmask of all cards of given suit
+_SUIT_MASKS: dict[type[Card], dict[Suit, int]] = {}
+
+
+def _suit_mask(card_class: type[Card], suit: Suit) -> int:
+    suit_masks = _SUIT_MASKS.get(card_class)
+    if suit_masks is None:
+        suit_masks = {s: 0 for s in Suit}
+        for card in card_class.all_cards():
+            suit_masks[card.suit] |= 1 << card.ordinal
+        _SUIT_MASKS[card_class] = suit_masks
+    return suit_masks[suit]
+
 
-@dataclass(frozen=True, slots=True)
 class Hand(Generic[TCard]):
-    cards: tuple[TCard, ...]
+    """Immutable set of cards, stored as a bitmask over card ordinals (see `Card.all_cards`).
+
+    Bits are ordered the same way cards are sorted in hand, so iterating set bits from the lowest one
+    yields cards already sorted by suit and strength.
+    """
+
+    __slots__ = ("_card_class", "_mask")
+
+    _mask: int
+    _card_class: type[TCard] | None  # None only for a hand which never had any card and was not given a card class
+
+    def __init__(self, cards: Iterable[TCard] = (), card_class: type[TCard] | None = None) -> None:
+        mask = 0
+        for card in cards:
+            if card_class is None:
+                card_class = type(card)
+            mask |= 1 << card.ordinal
+        object.__setattr__(self, "_mask", mask)
+        object.__setattr__(self, "_card_class", card_class)
+
+    @classmethod
+    def from_mask(cls, mask: int, card_class: type[TCard] | None) -> "Hand[TCard]":
+        hand: Hand[TCard] = cls.__new__(cls)
+        object.__setattr__(hand, "_mask", mask)
+        object.__setattr__(hand, "_card_class", card_class)
+        return hand
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def cards(self) -> tuple[TCard, ...]:
+        """Cards in hand order (by suit symbol, strongest card first)"""
+        if self._card_class is None:
+            return ()
+        all_cards = self._card_class.all_cards()
+        result: list[TCard] = []
+        mask = self._mask
+        while mask:
+            lowest_bit = mask & -mask
+            result.append(all_cards[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return tuple(result)
+
+    def of_suit(self, suit: Suit) -> "Hand[TCard]":
+        if self._card_class is None:
+            return self
+        return Hand.from_mask(self._mask & _suit_mask(self._card_class, suit), self._card_class)
 
-    def __post_init__(self) -> None:
-        # Sort cards on construction (frozen dataclass workaround)
-        sorted_cards = tuple(sorted(self.cards, key=lambda card: (card.suit.symbol, -card.strength().value)))
-        object.__setattr__(self, "cards", sorted_cards)
+    def _mask_of(self, cards: Iterable[TCard]) -> tuple[int, type[TCard] | None]:
+        card_class = self._card_class
+        mask = 0
+        for card in cards:
+            if card_class is None:
+                card_class = type(card)
+            mask |= 1 << card.ordinal
+        return mask, card_class
 
     def with_added_cards(self, cards: Sequence[TCard]) -> "Hand[TCard]":
-        return Hand(self.cards + tuple(cards))
+        # hand is a set: adding a card which is already in the hand keeps a single copy of it
+        added_mask, card_class = self._mask_of(cards)
+        return Hand.from_mask(self._mask | added_mask, card_class)
 
     def without_cards(self, cards: Sequence[TCard]) -> "Hand[TCard]":
-        for c in cards:
-            if c not in self.cards:
-                raise GameEngineException(
-                    reason="card_not_in_hand",
-                    detail=f"Could not remove card from hand: card {c} is not in the hand {self.cards}",
-                )
-        result: list[TCard] = []
-        for c in self.cards:
-            if c not in cards:
-                result.append(c)
-        return Hand(tuple(result))
+        removed_mask, card_class = self._mask_of(cards)
+        if self._mask & removed_mask != removed_mask:
+            raise GameEngineException(
+                reason="card_not_in_hand",
+                detail=f"Could not remove cards from hand: some of cards {list(cards)} are not in the hand {self}",
+            )
+        return Hand.from_mask(self._mask & ~removed_mask, card_class)
 
     def to_dict(self) -> list[str]:
         """Serialize to JSON-compatible list of strings"""
@@ -40,7 +101,36 @@ class Hand(Generic[TCard]):
     @staticmethod
     def from_dict(data: list[str], card_class: type[TCard]) -> "Hand[TCard]":
         """Reconstruct from JSON-compatible list of strings"""
-        return Hand(tuple(card_class.from_dict(card) for card in data))
+        return Hand((card_class.from_dict(card) for card in data), card_class)
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __contains__(self, card: object) -> bool:
+        if not isinstance(card, Card) or type(card) is not self._card_class:
+            return False
+        return bool(self._mask >> card.ordinal & 1)
+
+    def __iter__(self) -> Iterator[TCard]:
+        return iter(self.cards)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Could not set attribute '{name}': Hand is immutable")
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Hand.from_mask, (self._mask, self._card_class))
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self._mask == other._mask and (self._mask == 0 or self._card_class is other._card_class)
+
+    @override
+    def __hash__(self) -> int:
+        return hash(self._mask)
 
     @override
     def __str__(self) -> str:
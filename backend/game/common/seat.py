@@ -1,33 +1,34 @@
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
-from typing import override
+from typing import Any, Self, override
 
 from .game_exception import GameEngineException
 
 type SeatNumber = int
 
+MAX_INTERNED_SEAT_NUMBER = 64  # seats with numbers in range [0, 64) are interned, others are allocated as usual
+
+_INTERNED_SEATS: dict[SeatNumber, "Seat"] = {}
+_SEAT_RINGS: dict[frozenset["Seat"], "SeatRing"] = {}
+
 
 @dataclass(frozen=True, slots=True)
 class Seat:
     number: SeatNumber
 
+    def __new__(cls, number: SeatNumber) -> Self:
+        seat = _INTERNED_SEATS.get(number)
+        if seat is None:
+            seat = object.__new__(cls)  # `number` is set by the generated __init__
+            if 0 <= number < MAX_INTERNED_SEAT_NUMBER:
+                _INTERNED_SEATS[number] = seat
+        return seat
+
     def next(self, possible_seats: Collection["Seat"]) -> "Seat":
-        if len(possible_seats) == 0:
-            raise GameEngineException(detail="Could not get next seat: no possible seats given")
-        if self.number >= max(seat.number for seat in possible_seats):
-            return Seat(min(seat.number for seat in possible_seats))
-        else:
-            next_num = min(seat.number for seat in possible_seats if seat.number > self.number)
-            return Seat(next_num)
+        return SeatRing.of(possible_seats).next(self)
 
     def prev(self, possible_seats: Collection["Seat"]) -> "Seat":
-        if len(possible_seats) == 0:
-            raise GameEngineException(detail="Could not get previous seat: no possible seats given")
-        if self.number <= min(seat.number for seat in possible_seats):
-            return Seat(max(seat.number for seat in possible_seats))
-        else:
-            prev_num = max(seat.number for seat in possible_seats if seat.number < self.number)
-            return Seat(prev_num)
+        return SeatRing.of(possible_seats).prev(self)
 
     def to_dict(self) -> str:
         """Serialize to seat number"""
@@ -38,6 +39,11 @@ class Seat:
         """Reconstruct from seat number"""
         return Seat(int(data))
 
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        # unpickled/copied seats resolve back to the interned instance
+        return (Seat, (self.number,))
+
     @override
     def __str__(self) -> str:
         return f"-{self.number}-"
@@ -45,3 +51,47 @@ class Seat:
     @override
     def __repr__(self) -> str:
         return self.__str__()
+
+
+@dataclass(frozen=True, slots=True)
+class SeatRing:
+    """Seats ordered by seat number, with next/prev neighbours precomputed (wrapping around the table).
+
+    Rings are cached per set of seats, so a ring is built once per game and shared by all of its states.
+    """
+
+    seats: tuple[Seat, ...]
+    _next_by_number: Mapping[SeatNumber, Seat]
+    _prev_by_number: Mapping[SeatNumber, Seat]
+
+    @staticmethod
+    def of(seats: Collection[Seat]) -> "SeatRing":
+        key = seats if isinstance(seats, frozenset) else frozenset(seats)
+        ring = _SEAT_RINGS.get(key)
+        if ring is None:
+            ordered = tuple(sorted(key, key=lambda seat: seat.number))
+            ring = SeatRing(
+                seats=ordered,
+                _next_by_number={seat.number: ordered[(i + 1) % len(ordered)] for i, seat in enumerate(ordered)},
+                _prev_by_number={seat.number: ordered[i - 1] for i, seat in enumerate(ordered)},
+            )
+            _SEAT_RINGS[key] = ring
+        return ring
+
+    def next(self, seat: Seat) -> Seat:
+        next_seat = self._next_by_number.get(seat.number)
+        if next_seat is not None:
+            return next_seat
+        if len(self.seats) == 0:
+            raise GameEngineException(detail="Could not get next seat: no possible seats given")
+        # seat is not part of the ring: first seat with a higher number, wrapping around to the lowest one
+        return next((s for s in self.seats if s.number > seat.number), self.seats[0])
+
+    def prev(self, seat: Seat) -> Seat:
+        prev_seat = self._prev_by_number.get(seat.number)
+        if prev_seat is not None:
+            return prev_seat
+        if len(self.seats) == 0:
+            raise GameEngineException(detail="Could not get previous seat: no possible seats given")
+        # seat is not part of the ring: last seat with a lower number, wrapping around to the highest one
+        return next((s for s in reversed(self.seats) if s.number < seat.number), self.seats[-1])
@@ -0,0 +1,95 @@
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, override
+
+from .seat import Seat
+
+
+class SeatMap[V](Mapping[Seat, V]):
+    """Immutable mapping of per-seat data with cheap updates.
+
+    Values are kept in a tuple, positions of seats in a separate index. The index is never modified once built,
+    so every map derived from another one with `set`/`set_many`/`fill` shares it, and an update of
+    a single seat costs one new values tuple instead of a copy of the whole dict.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    _index: Mapping[Seat, int]  # seat -> position in _values, shared between derived maps
+    _values: tuple[V, ...]
+
+    def __init__(self, items: Mapping[Seat, V] | Iterable[tuple[Seat, V]] = ()) -> None:
+        pairs = items.items() if isinstance(items, Mapping) else items
+        index: dict[Seat, int] = {}
+        values: list[V] = []
+        for seat, value in pairs:
+            position = index.get(seat)
+            if position is None:
+                index[seat] = len(values)
+                values.append(value)
+            else:
+                values[position] = value
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_values", tuple(values))
+
+    @classmethod
+    def _from_index(cls, index: Mapping[Seat, int], values: tuple[V, ...]) -> "SeatMap[V]":
+        seat_map: SeatMap[V] = cls.__new__(cls)
+        object.__setattr__(seat_map, "_index", index)
+        object.__setattr__(seat_map, "_values", values)
+        return seat_map
+
+    def set(self, seat: Seat, value: V) -> "SeatMap[V]":
+        """New map with the value of given seat replaced (or added)"""
+        position = self._index.get(seat)
+        if position is None:
+            return SeatMap._from_index({**self._index, seat: len(self._values)}, self._values + (value,))
+        values = list(self._values)
+        values[position] = value
+        return SeatMap._from_index(self._index, tuple(values))
+
+    def set_many(self, changes: Mapping[Seat, V]) -> "SeatMap[V]":
+        """New map with values of all given seats replaced (or added)"""
+        if any(seat not in self._index for seat in changes):
+            return SeatMap(list(self.items()) + list(changes.items()))
+        values = list(self._values)
+        for seat, value in changes.items():
+            values[self._index[seat]] = value
+        return SeatMap._from_index(self._index, tuple(values))
+
+    def fill(self, value: V) -> "SeatMap[V]":
+        """New map with the same seats, all of them set to given value"""
+        return SeatMap._from_index(self._index, (value,) * len(self._values))
+
+    @override
+    def __getitem__(self, seat: Seat) -> V:
+        return self._values[self._index[seat]]
+
+    @override
+    def __contains__(self, seat: object) -> bool:
+        return seat in self._index
+
+    @override
+    def __iter__(self) -> Iterator[Seat]:
+        return iter(self._index)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Could not set attribute '{name}': SeatMap is immutable")
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SeatMap, (list(self.items()),))
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SeatMap) and other._index is self._index:
+            return self._values == other._values
+        return Mapping.__eq__(self, other)
+
+    @override
+    def __repr__(self) -> str:
+        return f"SeatMap({dict(self.items())})"
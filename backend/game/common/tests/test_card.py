@@ -1,3 +1,4 @@
+import pickle
 from typing import override
 import pytest
 
@@ -70,3 +71,15 @@ def test_card_from_string_and_to_dict_roundtrip():
 def test_card_from_string_invalid():
     with pytest.raises(GameParsingException):
         _ = DummyCard.from_string("AB")
+
+
+def test_cards_are_interned():
+    card = DummyCard.from_string("Ah")
+    assert DummyCard.from_string("aH") is card
+    assert DummyCard(Suit.HEART, Rank.ACE) is card
+    assert DummyCard.from_dict(card.to_dict()) is card
+
+
+def test_interned_card_survives_pickling():
+    card = DummyCard.from_string("Tc")
+    assert pickle.loads(pickle.dumps(card)) is card
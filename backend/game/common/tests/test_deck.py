@@ -1,4 +1,6 @@
 import pytest
+from collections.abc import Callable
+from random import shuffle
 from unittest.mock import Mock
 from typing import override, Self
 from ..card import Card, Rank, Suit, Strength
@@ -13,7 +15,7 @@ class DummyCard(Card):
 class DummyDeck(Deck[DummyCard]):
     @classmethod
     @override
-    def build(cls) -> Self: ...
+    def build(cls, shuffle_fn: Callable[[list[DummyCard]], None] = shuffle) -> Self: ...
 
     @classmethod
     @override
@@ -35,22 +37,31 @@ def dummy_deck() -> DummyDeck:
 
 
 def test_initial_deck_order_is_persisted(dummy_deck: DummyDeck):
-    assert dummy_deck._undealed_deck == cards
+    assert list(dummy_deck._cards) == cards
 
 
 def test_deck_draw_one_and_many(dummy_deck: DummyDeck):
     # deck is supposed to draw starting from last card (top of the deck card)
-    first_card = dummy_deck.draw_one()
+    first_card, deck = dummy_deck.draw_one()
     assert first_card == card4
 
-    next_two_cards = dummy_deck.draw_many(2)
+    next_two_cards, deck = deck.draw_many(2)
     assert next_two_cards == [card2, card3]
+    assert list(deck.remaining_cards) == [card1]
 
 
 def test_draw_many_more_than_available(dummy_deck: DummyDeck):
-    drawn = dummy_deck.draw_many(10)  # ask more than deck size
+    drawn, deck = dummy_deck.draw_many(10)  # ask more than deck size
     assert len(drawn) == 4
-    assert len(dummy_deck._cards) == 0  # deck is empty
+    assert len(deck.remaining_cards) == 0  # deck is empty
+
+
+def test_drawing_does_not_mutate_deck(dummy_deck: DummyDeck):
+    first_draw, _ = dummy_deck.draw_many(3)
+    second_draw, _ = dummy_deck.draw_many(3)
+    assert first_draw == second_draw
+    assert len(dummy_deck.remaining_cards) == 4
+    assert dummy_deck.to_dict() == [card.to_dict() for card in cards]
 
 
 def test_from_dict_and_to_dict_roundtrip(dummy_deck: DummyDeck):
@@ -52,3 +52,26 @@ def test_to_dict_and_from_dict_roundtrip(dummy_hand: Hand[DummyCard]):
     data = dummy_hand.to_dict()
     restored = Hand.from_dict(data, DummyCard)
     assert restored == dummy_hand
+
+
+def test_len_and_contains(dummy_hand: Hand[DummyCard]):
+    assert len(dummy_hand) == 4
+    assert card1 in dummy_hand
+    assert card5 not in dummy_hand
+
+
+def test_adding_card_already_in_hand_keeps_single_copy(dummy_hand: Hand[DummyCard]):
+    new_hand = dummy_hand.with_added_cards([card1])
+    assert new_hand == dummy_hand
+    assert len(new_hand) == 4
+
+
+def test_of_suit(dummy_hand: Hand[DummyCard]):
+    hearts = dummy_hand.with_added_cards([card5]).of_suit(Suit.HEART)
+    assert set(hearts.cards) == {card1, card5}
+    assert len(dummy_hand.of_suit(Suit.HEART).without_cards([card1])) == 0
+
+
+def test_equal_hands_regardless_of_input_order(dummy_hand: Hand[DummyCard]):
+    assert Hand((card4, card3, card2, card1)) == dummy_hand
+    assert Hand(()) == Hand((), DummyCard)
@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 from ..game_exception import GameEngineException
-from ..seat import Seat
+from ..seat import Seat, SeatRing
 
 
 def test_next_seat_valid():
@@ -33,3 +35,29 @@ def test_from_dict_and_to_dict_roundtrip():
     assert serialized == "1"
     deserialized = Seat.from_dict(int(serialized))
     assert deserialized == seat
+
+
+def test_seats_are_interned():
+    assert Seat(2) is Seat(2)
+    assert Seat.from_dict(2) is Seat(2)
+    assert pickle.loads(pickle.dumps(Seat(2))) is Seat(2)
+
+
+def test_seat_ring_wraps_around():
+    ring = SeatRing.of(frozenset({Seat(3), Seat(1), Seat(2)}))
+    assert ring.seats == (Seat(1), Seat(2), Seat(3))
+    assert ring.next(Seat(3)) == Seat(1)
+    assert ring.prev(Seat(1)) == Seat(3)
+    assert ring.next(Seat(1)) == Seat(2)
+    assert ring.prev(Seat(2)) == Seat(1)
+
+
+def test_seat_ring_is_shared_for_same_seats():
+    assert SeatRing.of([Seat(1), Seat(2)]) is SeatRing.of(frozenset({Seat(2), Seat(1)}))
+
+
+def test_seat_ring_of_seat_outside_the_ring():
+    ring = SeatRing.of([Seat(2), Seat(4)])
+    assert ring.next(Seat(3)) == Seat(4)
+    assert ring.prev(Seat(3)) == Seat(2)
+    assert ring.next(Seat(5)) == Seat(2)
@@ -0,0 +1,48 @@
+import pickle
+
+import pytest
+
+from ..seat import Seat
+from ..seat_map import SeatMap
+
+
+@pytest.fixture
+def seat_map() -> SeatMap[int]:
+    return SeatMap({Seat(1): 10, Seat(2): 20, Seat(3): 30})
+
+
+def test_behaves_like_mapping(seat_map: SeatMap[int]):
+    assert len(seat_map) == 3
+    assert seat_map[Seat(2)] == 20
+    assert Seat(3) in seat_map
+    assert Seat(4) not in seat_map
+    assert list(seat_map) == [Seat(1), Seat(2), Seat(3)]
+    assert seat_map == {Seat(1): 10, Seat(2): 20, Seat(3): 30}
+
+
+def test_set_returns_new_map_and_keeps_original(seat_map: SeatMap[int]):
+    updated = seat_map.set(Seat(2), 25)
+    assert updated[Seat(2)] == 25
+    assert seat_map[Seat(2)] == 20
+    assert updated._index is seat_map._index  # seat index is shared, not copied
+
+
+def test_set_adds_missing_seat(seat_map: SeatMap[int]):
+    updated = seat_map.set(Seat(4), 40)
+    assert updated == {Seat(1): 10, Seat(2): 20, Seat(3): 30, Seat(4): 40}
+    assert Seat(4) not in seat_map
+
+
+def test_set_many_and_fill(seat_map: SeatMap[int]):
+    assert seat_map.set_many({Seat(1): 11, Seat(3): 33}) == {Seat(1): 11, Seat(2): 20, Seat(3): 33}
+    assert seat_map.set_many({Seat(4): 40})[Seat(4)] == 40
+    assert seat_map.fill(0) == {Seat(1): 0, Seat(2): 0, Seat(3): 0}
+
+
+def test_is_immutable(seat_map: SeatMap[int]):
+    with pytest.raises(AttributeError):
+        seat_map._values = ()
+
+
+def test_pickle_roundtrip(seat_map: SeatMap[int]):
+    assert pickle.loads(pickle.dumps(seat_map)) == seat_map
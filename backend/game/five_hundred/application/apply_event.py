@@ -1,4 +1,3 @@
-from dataclasses import replace
 from ..domain.five_hundred_event import (
     DeckShuffledEvent,
     BiddingFinishedEvent,
@@ -28,7 +27,7 @@ from ..logic.take_trick import take_trick
 
 
 def apply_event(game: FiveHundredGame, event: FiveHundredEvent) -> FiveHundredGame:
-    game_updated = replace(game, event_number=event.seq_number)
+    game_updated = game.evolve(event_number=event.seq_number)
     match event:
         case DeckShuffledEvent(deck=deck):
             return deal_cards(game_updated, deck)
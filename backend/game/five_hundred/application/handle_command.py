@@ -1,4 +1,6 @@
-from ..logic.helpers import has_marriage_in_hand
+from collections.abc import Callable
+from random import shuffle
+
 from ...common.game_exception import GameRulesException
 from ...common.game_ending import GameEndingReason
 from ...common.seat import Seat
@@ -31,12 +33,15 @@ from ..domain.five_hundred_event import (
 )
 from ..domain.five_hundred_game import FiveHundredGame
 from ..domain.five_hundred_phase import FiveHundredPhase
+from ..domain.five_hundred_rules import has_marriage, is_legal_move
 
 
-def handle_command(game: FiveHundredGame, cmd: FiveHundredCommand) -> FiveHundredEvent:
+def handle_command(
+    game: FiveHundredGame, cmd: FiveHundredCommand, shuffle_fn: Callable[[list[FiveHundredCard]], None] = shuffle
+) -> FiveHundredEvent:
     match cmd:
         case StartGameCommand():
-            return handle_start_game(game)
+            return handle_start_game(game, shuffle_fn)
         case MakeBidCommand(bid=bid):
             return handle_make_bid(game, bid)
         case GiveUpCommand():
@@ -49,8 +54,8 @@ def handle_command(game: FiveHundredGame, cmd: FiveHundredCommand) -> FiveHundre
             return handle_end_game(game, reason, seat)
 
 
-def handle_start_game(game: FiveHundredGame) -> FiveHundredEvent:
-    deck = FiveHundredDeck.build()
+def handle_start_game(game: FiveHundredGame, shuffle_fn: Callable[[list[FiveHundredCard]], None]) -> FiveHundredEvent:
+    deck = FiveHundredDeck.build(shuffle_fn)
     return DeckShuffledEvent(deck=deck, seq_number=game.event_number + 1)
 
 
@@ -74,7 +79,7 @@ def handle_make_bid(game: FiveHundredGame, bid: int) -> FiveHundredEvent:
             detail=f"Could not make bid: bid must be greater than current highest bid ({game.round.highest_bid[1]})"
         )
     elif bid >= 0 and bid > game.game_config.max_bid_no_marriage:
-        if not has_marriage_in_hand(game.active_seats_info.hand):
+        if not has_marriage(game.active_seats_info.hand):
             raise GameRulesException(detail="Could not make bid: bid is too high for hand without marriage")
 
     return BidMadeEvent(bid=bid, made_by=game.active_seat, seq_number=game.event_number + 1)
@@ -95,12 +100,12 @@ def handle_pass_cards(
     if game.round.phase != FiveHundredPhase.FORMING_HANDS:
         raise GameRulesException(detail="Could not pass cards: not 'forming hands' phase")
 
-    active_seats_cards = game.active_seats_info.hand.cards
+    active_seats_hand = game.active_seats_info.hand
 
-    if len(active_seats_cards) != CARDS_IN_STARTING_HAND + CARDS_TO_TAKE:
+    if len(active_seats_hand) != CARDS_IN_STARTING_HAND + CARDS_TO_TAKE:
         raise GameRulesException(detail="Could not pass cards: bidding winner has not taken hidden cards yet")
 
-    if card_to_next_seat not in active_seats_cards or card_to_prev_seat not in active_seats_cards:
+    if card_to_next_seat not in active_seats_hand or card_to_prev_seat not in active_seats_hand:
         raise GameRulesException(detail="Could not pass cards: selected cards are not in the hand")
 
     return CardsPassedEvent(
@@ -114,16 +119,12 @@ def handle_play_card(game: FiveHundredGame, card: FiveHundredCard) -> FiveHundre
     if game.round.phase != FiveHundredPhase.PLAYING_CARDS:
         raise GameRulesException(detail="Could not play card: not 'playing cards' phase")
 
-    active_seats_cards = game.active_seats_info.hand.cards
+    active_seats_hand = game.active_seats_info.hand
 
-    if card not in active_seats_cards:
+    if card not in active_seats_hand:
         raise GameRulesException(detail="Could not play card: selected card is not in the hand")
 
-    cards_allowed_to_play = game.active_seats_info.cards_allowed_to_play(
-        game.round.required_suit, game.round.trump_suit
-    )
-
-    if card not in cards_allowed_to_play:
+    if not is_legal_move(active_seats_hand, card, game.round.required_suit, game.round.trump_suit):
         raise GameRulesException(detail="Could not play card: selected card is not allowed to play")
 
     return CardPlayedEvent(card=card, played_by=game.active_seat, seq_number=game.event_number + 1)
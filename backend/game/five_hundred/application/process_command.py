@@ -1,12 +1,15 @@
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from random import shuffle
 
 from ...common.game_ending import GameEndingReason
+from ...common.game_exception import GameEngineException
 from ..domain.constants import (
     EMPTY_HAND_SIZE,
     LARGE_MARRIAGE_POINTS,
     NOT_ALLOWED_TO_BID_THRESHOLD,
     SMALL_MARRIAGE_POINTS,
 )
+from ..domain.five_hundred_card import FiveHundredCard
 from ..domain.five_hundred_deck import FiveHundredDeck
 from ..domain.five_hundred_command import FiveHundredCommand
 from ..domain.five_hundred_event import (
@@ -26,7 +29,6 @@ from ..domain.five_hundred_game import FiveHundredGame
 from ..logic.helpers import (
     get_next_seat_to_bid,
     get_round_ending_points_per_seat,
-    get_trick_winning_card,
     is_played_card_part_of_marriage,
 )
 from .apply_event import apply_event
@@ -34,9 +36,11 @@ from .handle_command import handle_command
 
 
 def process_command(
-    game: FiveHundredGame, command: FiveHundredCommand
+    game: FiveHundredGame,
+    command: FiveHundredCommand,
+    shuffle_fn: Callable[[list[FiveHundredCard]], None] = shuffle,  # decks of new rounds are shuffled with it
 ) -> tuple[FiveHundredGame, Sequence[FiveHundredEvent]]:
-    event = handle_command(game, command)
+    event = handle_command(game, command, shuffle_fn)
 
     game_updated = game
     all_events: list[FiveHundredEvent] = []
@@ -47,17 +51,19 @@ def process_command(
         game_updated = apply_event(game_updated, current_event)
         all_events.append(current_event)
 
-        current_event = check_for_additional_events(game_updated, current_event)
+        current_event = check_for_additional_events(game_updated, current_event, shuffle_fn)
 
     return game_updated, all_events
 
 
-def check_for_additional_events(game: FiveHundredGame, last_event: FiveHundredEvent) -> FiveHundredEvent | None:
+def check_for_additional_events(
+    game: FiveHundredGame, last_event: FiveHundredEvent, shuffle_fn: Callable[[list[FiveHundredCard]], None] = shuffle
+) -> FiveHundredEvent | None:
     match last_event:
         case BidMadeEvent(made_by=made_by):
             current_highest_bidder = game.round.highest_bid[0] if game.round.highest_bid else None
-            next_seat_to_bid = get_next_seat_to_bid(game.active_seat, game.round.seat_infos)
-            have_all_seats_passed = all(seat_info.bid < 0 for seat_info in game.round.seat_infos.values())
+            next_seat_to_bid = get_next_seat_to_bid(game.active_seat, game.round.seat_infos, game.seat_ring)
+            have_all_seats_passed = game.round.active_bidders_count == 0
             is_current_bidder_the_highest_bidder = current_highest_bidder == made_by
             if (is_current_bidder_the_highest_bidder and next_seat_to_bid is None) or have_all_seats_passed:
                 return BiddingFinishedEvent(
@@ -95,8 +101,8 @@ def check_for_additional_events(game: FiveHundredGame, last_event: FiveHundredEv
 
             # if 1st card played, check for marriage.
             if cards_on_board_count == 1:
-                cards_left_in_hand = game.round.seat_infos[card_played_by].hand.cards
-                marriage_possible = is_played_card_part_of_marriage(played_card, cards_left_in_hand)
+                hand_left = game.round.seat_infos[card_played_by].hand
+                marriage_possible = is_played_card_part_of_marriage(played_card, hand_left)
 
                 if not marriage_possible:
                     return None
@@ -116,18 +122,16 @@ def check_for_additional_events(game: FiveHundredGame, last_event: FiveHundredEv
 
             # if 3rd card played for this trick, then trick is finished
             elif cards_on_board_count == 3:
-                cards_on_board = game.round.cards_on_board
-                trick_cards = [card for card in cards_on_board.values() if card is not None]
-                trick_winning_card = get_trick_winning_card(
-                    trick_cards, game.round.required_suit, game.round.trump_suit
-                )
-                trick_winning_seat = next(seat for seat, card in cards_on_board.items() if card == trick_winning_card)
+                trick_winning_seat = game.round.trick_winning_seat
+                if trick_winning_seat is None:
+                    raise GameEngineException(detail="Could not take the trick: no winning card on board")
+                trick_cards = [card for card in game.round.cards_on_board.values() if card is not None]
                 return TrickTakenEvent(taken_by=trick_winning_seat, cards=trick_cards, seq_number=game.event_number + 1)
             return None
 
         case TrickTakenEvent():
             # if any of seats does not have cards left, then round is finished
-            if len(game.active_seats_info.hand.cards) == EMPTY_HAND_SIZE:
+            if len(game.active_seats_info.hand) == EMPTY_HAND_SIZE:
                 points_per_seat = get_round_ending_points_per_seat(game, has_declarer_given_up=False)
                 return RoundFinishedEvent(
                     round_number=game.round.round_number,
@@ -145,7 +149,7 @@ def check_for_additional_events(game: FiveHundredGame, last_event: FiveHundredEv
                 return GameEndedEvent(reason=GameEndingReason.FINISHED, seat=None, seq_number=game.event_number + 1)
             if game.round.round_number >= game.game_config.max_rounds:
                 return GameEndedEvent(reason=GameEndingReason.FINISHED, seat=None, seq_number=game.event_number + 1)
-            deck = FiveHundredDeck.build()
+            deck = FiveHundredDeck.build(shuffle_fn)
             return DeckShuffledEvent(deck=deck, seq_number=game.event_number + 1)
 
         case _:
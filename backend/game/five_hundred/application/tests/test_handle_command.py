@@ -102,7 +102,7 @@ def test_handle_pass_cards_command_cards_not_in_hand(sample_game: FiveHundredGam
 
 def test_handle_pass_cards_command_happy_path(sample_game: FiveHundredGame):
     deck = FiveHundredDeck.build()
-    cards_to_add_to_hand = deck.draw_many(10)
+    cards_to_add_to_hand, _ = deck.draw_many(10)
     card_to_next_seat = cards_to_add_to_hand[0]
     card_to_prev_seat = cards_to_add_to_hand[1]
 
@@ -137,7 +137,7 @@ def test_handle_play_card_command_card_not_in_hand(sample_game: FiveHundredGame)
 
 def test_handle_play_card_command_happy_path(sample_game: FiveHundredGame):
     deck = FiveHundredDeck.build()
-    cards_to_add_to_hand = deck.draw_many(10)
+    cards_to_add_to_hand, _ = deck.draw_many(10)
     card_to_play = cards_to_add_to_hand[0]
 
     active_seats_info_updated = replace(
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import override
 
@@ -35,10 +36,26 @@ RANK_TO_STRENGTH: dict[Rank, Strength] = {
 
 @dataclass(slots=True, frozen=True, repr=False)
 class FiveHundredCard(Card):
+    # precomputed once per interned card, so sorting and trick evaluation do not go through rank lookups
+    _strength: Strength = field(init=False, repr=False, compare=False)
+    _points: CardPoints = field(init=False, repr=False, compare=False)
+
+    @override
+    def _precompute(self) -> None:
+        if self.rank in RANK_TO_STRENGTH:
+            object.__setattr__(self, "_strength", RANK_TO_STRENGTH[self.rank])
+            object.__setattr__(self, "_points", RANK_TO_VALUE[self.rank])
+
+    @override
+    @classmethod
+    def ranks(cls) -> Sequence[Rank]:
+        # Game 'Five Hundred' only uses 24 card deck, from 9 to Ace of each suit
+        return tuple(RANK_TO_STRENGTH)
+
     @property
     def points(self) -> CardPoints:
-        return RANK_TO_VALUE[self.rank]
+        return self._points
 
     @override
     def strength(self) -> Strength:
-        return RANK_TO_STRENGTH[self.rank]
+        return self._strength
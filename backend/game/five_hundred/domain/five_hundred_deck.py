@@ -1,4 +1,6 @@
+from collections.abc import Callable
 from dataclasses import dataclass
+from random import shuffle
 from typing import Self, override
 
 from ...common.card import Rank, Suit
@@ -13,8 +15,8 @@ RANKS = [Rank.NINE, Rank.JACK, Rank.QUEEN, Rank.KING, Rank.TEN, Rank.ACE]
 class FiveHundredDeck(Deck[FiveHundredCard]):
     @classmethod
     @override
-    def build(cls) -> Self:
-        return cls([FiveHundredCard(suit=suit, rank=rank) for suit in Suit for rank in RANKS])
+    def build(cls, shuffle_fn: Callable[[list[FiveHundredCard]], None] = shuffle) -> Self:
+        return cls([FiveHundredCard(suit=suit, rank=rank) for suit in Suit for rank in RANKS], shuffle_fn=shuffle_fn)
 
     @classmethod
     @override
@@ -2,6 +2,7 @@ from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Self, override
 
+from ...common.evolve import KEEP, set_field
 from ...common.game_ending import GameEnding
 from ...common.game_config import GameConfig
 from ...common.seat import Seat
@@ -49,6 +50,37 @@ class FiveHundredGame(GameState):
             replay_safe_event_number=0,
         )
 
+    def evolve(
+        self,
+        *,
+        round: FiveHundredRound = KEEP,
+        summary: Mapping[Seat, int] = KEEP,
+        active_seat: Seat = KEEP,
+        ending: GameEnding | None = KEEP,
+        turn_number: int = KEEP,
+        event_number: int = KEEP,
+        replay_safe_event_number: int = KEEP,
+    ) -> "FiveHundredGame":
+        """Fast-path `dataclasses.replace`: copies the game state with given fields changed, without going through
+        the generated __init__. Game config, taken seats and the seat ring never change during a game and are shared.
+        """
+        game: FiveHundredGame = object.__new__(FiveHundredGame)
+        set_field(game, "round", self.round if round is KEEP else round)
+        set_field(game, "summary", self.summary if summary is KEEP else summary)
+        set_field(game, "active_seat", self.active_seat if active_seat is KEEP else active_seat)
+        set_field(game, "ending", self.ending if ending is KEEP else ending)
+        set_field(game, "game_config", self.game_config)
+        set_field(game, "taken_seats", self.taken_seats)
+        set_field(game, "seat_ring", self.seat_ring)
+        set_field(game, "turn_number", self.turn_number if turn_number is KEEP else turn_number)
+        set_field(game, "event_number", self.event_number if event_number is KEEP else event_number)
+        set_field(
+            game,
+            "replay_safe_event_number",
+            self.replay_safe_event_number if replay_safe_event_number is KEEP else replay_safe_event_number,
+        )
+        return game
+
     @property
     def active_seats_info(self) -> FiveHundredSeatInfo:
         return self.round.seat_infos[self.active_seat]
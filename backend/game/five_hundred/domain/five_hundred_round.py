@@ -1,19 +1,22 @@
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
-from ...common.seat import Seat
+from ...common.evolve import KEEP, set_field
+from ...common.seat import Seat, SeatRing
+from ...common.seat_map import SeatMap
 from ...common.card import Suit
 from ...common.hand import Hand
 from .five_hundred_card import FiveHundredCard
 from .five_hundred_phase import FiveHundredPhase
+from .five_hundred_rules import beats
 from .five_hundred_seat_info import FiveHundredSeatInfo
 
 
 @dataclass(frozen=True, slots=True)
 class FiveHundredRound:
-    seat_infos: Mapping[Seat, FiveHundredSeatInfo]
-    cards_on_board: Mapping[Seat, FiveHundredCard | None]
+    seat_infos: SeatMap[FiveHundredSeatInfo]  # plain mappings given to the constructor are converted to SeatMap
+    cards_on_board: SeatMap[FiveHundredCard | None]
     tricks: Sequence[Mapping[Seat, FiveHundredCard]]  # tricks taken this round, just for UI
     cards_to_take: Sequence[FiveHundredCard]
     required_suit: Suit | None
@@ -23,21 +26,114 @@ class FiveHundredRound:
     round_number: int
     first_seat: Seat  # seat which started this round
     is_marriage_announced: bool
+    trick_lead_seat: Seat | None = None  # seat which played the first card of the trick on board
+
+    # derived from the fields above when constructed, afterwards maintained by the logic functions through `evolve`
+    cards_on_board_count: int = field(init=False, repr=False, compare=False)
+    trick_winning_seat: Seat | None = field(init=False, repr=False, compare=False)  # seat winning the trick on board
+    active_bidders_count: int = field(init=False, repr=False, compare=False)  # seats which have not passed
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.seat_infos, SeatMap):
+            set_field(self, "seat_infos", SeatMap(self.seat_infos))
+        if not isinstance(self.cards_on_board, SeatMap):
+            set_field(self, "cards_on_board", SeatMap(self.cards_on_board))
+
+        played = [(seat, card) for seat, card in self.cards_on_board.items() if card is not None]
+        set_field(self, "cards_on_board_count", len(played))
+        set_field(self, "active_bidders_count", sum(1 for info in self.seat_infos.values() if info.bid >= 0))
+
+        ring = SeatRing.of(self.cards_on_board.keys())
+        if self.trick_lead_seat is None and 0 < len(played) < len(self.cards_on_board):
+            # state serialized without lead seat: lead is the only played seat whose previous seat has not played
+            lead_seat = next(seat for seat, _ in played if self.cards_on_board[ring.prev(seat)] is None)
+            set_field(self, "trick_lead_seat", lead_seat)
+
+        if self.trick_lead_seat is not None and self.cards_on_board.get(self.trick_lead_seat) is not None:
+            # cards are compared in the order they were played, like `play_card` does, starting with the lead card
+            played = []
+            seat = self.trick_lead_seat
+            while (card := self.cards_on_board[seat]) is not None and len(played) < len(self.cards_on_board):
+                played.append((seat, card))
+                seat = ring.next(seat)
+        winning_seat: Seat | None = None
+        winning_card: FiveHundredCard | None = None
+        for seat, card in played:
+            if winning_card is None or beats(card, winning_card, self.required_suit, self.trump_suit):
+                winning_seat, winning_card = seat, card
+        set_field(self, "trick_winning_seat", winning_seat)
+
+    def evolve(
+        self,
+        *,
+        seat_infos: SeatMap[FiveHundredSeatInfo] = KEEP,
+        cards_on_board: SeatMap[FiveHundredCard | None] = KEEP,
+        tricks: Sequence[Mapping[Seat, FiveHundredCard]] = KEEP,
+        cards_to_take: Sequence[FiveHundredCard] = KEEP,
+        required_suit: Suit | None = KEEP,
+        trump_suit: Suit | None = KEEP,
+        highest_bid: tuple[Seat, int] | None = KEEP,
+        phase: FiveHundredPhase = KEEP,
+        round_number: int = KEEP,
+        first_seat: Seat = KEEP,
+        is_marriage_announced: bool = KEEP,
+        trick_lead_seat: Seat | None = KEEP,
+        cards_on_board_count: int = KEEP,
+        trick_winning_seat: Seat | None = KEEP,
+        active_bidders_count: int = KEEP,
+    ) -> "FiveHundredRound":
+        """Fast-path `dataclasses.replace`: copies the round with given fields changed, without going through
+        the generated __init__. Per-seat fields must already be SeatMaps and derived fields have to be passed
+        along with the fields they depend on."""
+        round: FiveHundredRound = object.__new__(FiveHundredRound)
+        set_field(round, "seat_infos", self.seat_infos if seat_infos is KEEP else seat_infos)
+        set_field(round, "cards_on_board", self.cards_on_board if cards_on_board is KEEP else cards_on_board)
+        set_field(round, "tricks", self.tricks if tricks is KEEP else tricks)
+        set_field(round, "cards_to_take", self.cards_to_take if cards_to_take is KEEP else cards_to_take)
+        set_field(round, "required_suit", self.required_suit if required_suit is KEEP else required_suit)
+        set_field(round, "trump_suit", self.trump_suit if trump_suit is KEEP else trump_suit)
+        set_field(round, "highest_bid", self.highest_bid if highest_bid is KEEP else highest_bid)
+        set_field(round, "phase", self.phase if phase is KEEP else phase)
+        set_field(round, "round_number", self.round_number if round_number is KEEP else round_number)
+        set_field(round, "first_seat", self.first_seat if first_seat is KEEP else first_seat)
+        set_field(
+            round,
+            "is_marriage_announced",
+            self.is_marriage_announced if is_marriage_announced is KEEP else is_marriage_announced,
+        )
+        set_field(round, "trick_lead_seat", self.trick_lead_seat if trick_lead_seat is KEEP else trick_lead_seat)
+        set_field(
+            round,
+            "cards_on_board_count",
+            self.cards_on_board_count if cards_on_board_count is KEEP else cards_on_board_count,
+        )
+        set_field(
+            round, "trick_winning_seat", self.trick_winning_seat if trick_winning_seat is KEEP else trick_winning_seat
+        )
+        set_field(
+            round,
+            "active_bidders_count",
+            self.active_bidders_count if active_bidders_count is KEEP else active_bidders_count,
+        )
+        return round
 
     @staticmethod
     def create(round_number: int, first_seat: Seat, taken_seats: frozenset[Seat]) -> "FiveHundredRound":
-        seat_infos: Mapping[Seat, FiveHundredSeatInfo] = {
-            seat: FiveHundredSeatInfo(
-                hand=Hand(tuple()),
-                bid=0,
-                points=0,
-                trick_count=0,
-                marriage_points=[],
+        seat_infos: SeatMap[FiveHundredSeatInfo] = SeatMap(
+            (
+                seat,
+                FiveHundredSeatInfo(
+                    hand=Hand(tuple()),
+                    bid=0,
+                    points=0,
+                    trick_count=0,
+                    marriage_points=[],
+                ),
             )
             for seat in taken_seats
-        }
+        )
 
-        cards_on_board: Mapping[Seat, FiveHundredCard | None] = {seat: None for seat in taken_seats}
+        cards_on_board: SeatMap[FiveHundredCard | None] = SeatMap((seat, None) for seat in taken_seats)
 
         return FiveHundredRound(
             seat_infos=seat_infos,
@@ -53,10 +149,6 @@ class FiveHundredRound:
             is_marriage_announced=False,
         )
 
-    @property
-    def cards_on_board_count(self) -> int:
-        return sum(1 for v in self.cards_on_board.values() if v is not None)
-
     def to_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict"""
         return {
@@ -73,20 +165,21 @@ class FiveHundredRound:
             "round_number": self.round_number,
             "first_seat": self.first_seat.to_dict(),
             "is_marriage_announced": self.is_marriage_announced,
+            "trick_lead_seat": self.trick_lead_seat.to_dict() if self.trick_lead_seat else None,
         }
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "FiveHundredRound":
         """Reconstruct from JSON-compatible dict"""
         return FiveHundredRound(
-            seat_infos={
-                Seat.from_dict(int(seat_num)): FiveHundredSeatInfo.from_dict(info)
+            seat_infos=SeatMap(
+                (Seat.from_dict(int(seat_num)), FiveHundredSeatInfo.from_dict(info))
                 for seat_num, info in data["seat_infos"].items()
-            },
-            cards_on_board={
-                Seat.from_dict(int(seat_num)): FiveHundredCard.from_dict(card) if card else None
+            ),
+            cards_on_board=SeatMap(
+                (Seat.from_dict(int(seat_num)), FiveHundredCard.from_dict(card) if card else None)
                 for seat_num, card in data["cards_on_board"].items()
-            },
+            ),
             cards_to_take=[FiveHundredCard.from_dict(card) for card in data["cards_to_take"]],
             tricks=[
                 {Seat.from_dict(int(seat_num)): FiveHundredCard.from_dict(card) for seat_num, card in trick.items()}
@@ -104,4 +197,5 @@ class FiveHundredRound:
             round_number=data["round_number"],
             first_seat=Seat.from_dict(data["first_seat"]),
             is_marriage_announced=data["is_marriage_announced"],
+            trick_lead_seat=Seat.from_dict(data["trick_lead_seat"]) if data.get("trick_lead_seat") else None,
         )
@@ -0,0 +1,91 @@
+from collections.abc import Iterable, Mapping
+
+from ...common.card import Rank, Suit
+from ...common.game_exception import GameEngineException
+from ...common.hand import Hand
+from .five_hundred_card import FiveHundredCard
+
+# Card rules of Five Hundred over the bitmask encoding used by `Hand`: bit N is set for the card with ordinal N.
+# Ordinals group cards by suit with the strongest card first, so the lowest set bit of a suit's mask is its
+# strongest card. Shared by command validation, event checks and bots.
+
+ALL_CARDS: tuple[FiveHundredCard, ...] = tuple(FiveHundredCard.all_cards())
+
+SUIT_MASKS: Mapping[Suit, int] = {
+    suit: sum(1 << card.ordinal for card in ALL_CARDS if card.suit == suit) for suit in Suit
+}
+
+# king and queen of each suit
+MARRIAGE_MASKS: Mapping[Suit, int] = {
+    suit: (1 << FiveHundredCard(suit, Rank.KING).ordinal) | (1 << FiveHundredCard(suit, Rank.QUEEN).ordinal)
+    for suit in Suit
+}
+
+
+def _lowest_card(mask: int) -> FiveHundredCard:
+    return ALL_CARDS[(mask & -mask).bit_length() - 1]
+
+
+def legal_moves_mask(hand_mask: int, required_suit: Suit | None, trump_suit: Suit | None) -> int:
+    """
+    Rules:
+    1. Card of required suit must be played if there is one in the hand
+    2. Otherwise trump card must be played if there is one in the hand
+    3. Otherwise any card can be played
+    """
+    if required_suit is None or trump_suit is None:
+        return hand_mask
+    required_suit_cards = hand_mask & SUIT_MASKS[required_suit]
+    if required_suit_cards:
+        return required_suit_cards
+    trump_cards = hand_mask & SUIT_MASKS[trump_suit]
+    if trump_cards:
+        return trump_cards
+    return hand_mask
+
+
+def legal_moves(
+    hand: Hand[FiveHundredCard], required_suit: Suit | None, trump_suit: Suit | None
+) -> Hand[FiveHundredCard]:
+    return Hand.from_mask(legal_moves_mask(hand.mask, required_suit, trump_suit), FiveHundredCard)
+
+
+def is_legal_move(
+    hand: Hand[FiveHundredCard], card: FiveHundredCard, required_suit: Suit | None, trump_suit: Suit | None
+) -> bool:
+    return bool(legal_moves_mask(hand.mask, required_suit, trump_suit) >> card.ordinal & 1)
+
+
+def trick_winning_card(
+    trick_cards: Iterable[FiveHundredCard], required_suit: Suit | None, trump_suit: Suit | None
+) -> FiveHundredCard:
+    """
+    Rules:
+    1. If trump cards are played, highest trump wins
+    2. Otherwise, highest card of required suit wins
+    """
+    trick_mask = 0
+    for card in trick_cards:
+        trick_mask |= 1 << card.ordinal
+    trump_cards = trick_mask & SUIT_MASKS[trump_suit] if trump_suit is not None else 0
+    if trump_cards:
+        return _lowest_card(trump_cards)
+    required_suit_cards = trick_mask & SUIT_MASKS[required_suit] if required_suit is not None else 0
+    if required_suit_cards:
+        return _lowest_card(required_suit_cards)
+    raise GameEngineException(detail="Could not get trick winning card: no trump or required suit card in the trick")
+
+
+def beats(card: FiveHundredCard, other: FiveHundredCard, required_suit: Suit | None, trump_suit: Suit | None) -> bool:
+    """Whether `card` takes the trick over `other`: trump beats any other suit, required suit beats
+    the remaining suits, otherwise the stronger card of the same suit wins"""
+    if card.suit == other.suit:
+        return card.ordinal < other.ordinal
+    if card.suit == trump_suit:
+        return True
+    return other.suit != trump_suit and card.suit == required_suit
+
+
+def has_marriage(hand: Hand[FiveHundredCard]) -> bool:
+    hand_mask = hand.mask
+    return any(hand_mask & marriage_mask == marriage_mask for marriage_mask in MARRIAGE_MASKS.values())
@@ -3,8 +3,10 @@ from dataclasses import dataclass
 from typing import Any, override
 
 from ...common.card import Suit
+from ...common.evolve import KEEP, set_field
 from ...common.hand import Hand
 from .five_hundred_card import FiveHundredCard
+from .five_hundred_rules import legal_moves
 
 
 # Seat info is round-specific information about a player
@@ -16,20 +18,26 @@ class FiveHundredSeatInfo:
     trick_count: int  # not essential for the game, but useful for better UI
     marriage_points: Sequence[int]  # not essential for the game, but useful for better UI
 
+    def evolve(
+        self,
+        *,
+        hand: Hand[FiveHundredCard] = KEEP,
+        bid: int = KEEP,
+        points: int = KEEP,
+        trick_count: int = KEEP,
+        marriage_points: Sequence[int] = KEEP,
+    ) -> "FiveHundredSeatInfo":
+        """Fast-path `dataclasses.replace`: copies the seat info with given fields changed"""
+        seat_info: FiveHundredSeatInfo = object.__new__(FiveHundredSeatInfo)
+        set_field(seat_info, "hand", self.hand if hand is KEEP else hand)
+        set_field(seat_info, "bid", self.bid if bid is KEEP else bid)
+        set_field(seat_info, "points", self.points if points is KEEP else points)
+        set_field(seat_info, "trick_count", self.trick_count if trick_count is KEEP else trick_count)
+        set_field(seat_info, "marriage_points", self.marriage_points if marriage_points is KEEP else marriage_points)
+        return seat_info
+
     def cards_allowed_to_play(self, required_suit: Suit | None, trump_suit: Suit | None) -> Sequence[FiveHundredCard]:
-        if required_suit is None:
-            return self.hand.cards
-        if trump_suit is None:
-            return self.hand.cards
-        cards_matching_required_suit = [card for card in self.hand.cards if card.suit == required_suit]
-        if len(cards_matching_required_suit) == 0:
-            cards_matching_trump = [card for card in self.hand.cards if card.suit == trump_suit]
-            if len(cards_matching_trump) == 0:
-                return self.hand.cards
-            else:
-                return cards_matching_trump
-        else:
-            return cards_matching_required_suit
+        return legal_moves(self.hand, required_suit, trump_suit).cards
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict"""
@@ -55,7 +63,7 @@ class FiveHundredSeatInfo:
     def to_public_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict, but exclude non-public information"""
         return {
-            "hand": len(self.hand.cards),
+            "hand": len(self.hand),
             "bid": self.bid,
             "points": None,
             "trick_count": self.trick_count,
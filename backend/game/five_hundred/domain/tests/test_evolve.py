@@ -0,0 +1,43 @@
+import inspect
+from dataclasses import fields
+from typing import Any
+
+import pytest
+
+from ....common.seat import Seat
+from ..five_hundred_game import FiveHundredGame
+from ..five_hundred_round import FiveHundredRound
+from ..five_hundred_seat_info import FiveHundredSeatInfo
+
+
+@pytest.fixture
+def evolvable(
+    request: pytest.FixtureRequest,
+    sample_game: FiveHundredGame,
+    sample_round: FiveHundredRound,
+    sample_seat_infos: dict[Seat, FiveHundredSeatInfo],
+) -> Any:
+    return {"game": sample_game, "round": sample_round, "seat_info": sample_seat_infos[Seat(1)]}[request.param]
+
+
+@pytest.mark.parametrize("evolvable", ["game", "round", "seat_info"], indirect=True)
+def test_evolve_keeps_every_field(evolvable: Any):
+    copy = evolvable.evolve()
+
+    # fields added to the dataclass but not to `evolve` are missing from the copy
+    assert type(copy) is type(evolvable)
+    for field in fields(evolvable):
+        assert getattr(copy, field.name) is getattr(evolvable, field.name), field.name
+
+
+@pytest.mark.parametrize("evolvable", ["game", "round", "seat_info"], indirect=True)
+def test_evolve_changes_only_given_field(evolvable: Any):
+    field_names = {field.name for field in fields(evolvable)}
+
+    for name in inspect.signature(evolvable.evolve).parameters:
+        assert name in field_names
+        value = object()
+        copy = evolvable.evolve(**{name: value})
+        for field in fields(evolvable):
+            expected = value if field.name == name else getattr(evolvable, field.name)
+            assert getattr(copy, field.name) is expected, (name, field.name)
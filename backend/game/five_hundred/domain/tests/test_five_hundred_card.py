@@ -12,3 +12,15 @@ def test_card_strength_mapping_is_consistent():
     for rank, expected_strength in RANK_TO_STRENGTH.items():
         card = FiveHundredCard(Suit.SPADE, rank)
         assert card.strength() == expected_strength
+
+
+def test_all_cards_are_24_distinct_cards_in_hand_order():
+    all_cards = FiveHundredCard.all_cards()
+    assert len(all_cards) == 24
+    assert len(set(all_cards)) == 24
+    assert list(all_cards) == sorted(all_cards, key=lambda card: (card.suit.symbol, -card.strength().value))
+    assert [card.ordinal for card in all_cards] == list(range(24))
+
+
+def test_card_not_in_play_gets_ordinal_outside_of_deck_range():
+    assert FiveHundredCard.from_string("2h").ordinal >= len(FiveHundredCard.all_cards())
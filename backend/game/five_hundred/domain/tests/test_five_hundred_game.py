@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from ....common.seat import Seat
@@ -39,3 +41,16 @@ def test_to_public_dict_hides_private_and_non_essential_info(sample_game: FiveHu
     # make sure that non-essential information for UI is also not included
     assert "game_config" not in public_data
     assert "taken_seats" not in public_data
+
+
+def test_seat_ring_is_shared_between_game_states(sample_game: FiveHundredGame):
+    next_state = replace(sample_game, turn_number=sample_game.turn_number + 1)
+    assert next_state.seat_ring is sample_game.seat_ring
+    assert FiveHundredGame.from_dict(sample_game.to_dict()).seat_ring is sample_game.seat_ring
+
+
+def test_evolve_matches_replace(sample_game: FiveHundredGame):
+    changes = {"active_seat": Seat(2), "turn_number": 5, "ending": None}
+    evolved = sample_game.evolve(**changes)
+    assert evolved == replace(sample_game, **changes)
+    assert evolved.seat_ring is sample_game.seat_ring
@@ -2,6 +2,7 @@ from dataclasses import replace
 
 from ....common.card import Rank, Suit
 from ....common.seat import Seat
+from ....common.seat_map import SeatMap
 from ..five_hundred_card import FiveHundredCard
 from ..five_hundred_round import FiveHundredRound
 from ..five_hundred_phase import FiveHundredPhase
@@ -40,3 +41,61 @@ def test_to_dict_and_from_dict_roundtrip(sample_round: FiveHundredRound):
     data = sample_round.to_dict()
     restored = FiveHundredRound.from_dict(data)
     assert restored == sample_round
+
+
+def test_plain_mappings_are_converted_to_seat_maps(sample_round: FiveHundredRound):
+    assert isinstance(sample_round.seat_infos, SeatMap)
+    assert isinstance(sample_round.cards_on_board, SeatMap)
+
+
+def test_evolve_matches_replace(sample_round: FiveHundredRound):
+    cards_on_board = sample_round.cards_on_board.set(Seat(2), FiveHundredCard(Suit.HEART, Rank.TEN))
+    changes = {
+        "cards_on_board": cards_on_board,
+        "required_suit": Suit.HEART,
+        "highest_bid": None,
+        "trick_lead_seat": Seat(2),
+    }
+    assert sample_round.evolve(**changes) == replace(sample_round, **changes)
+    assert sample_round.evolve() == sample_round
+
+
+def test_derived_fields_are_computed_on_construction(sample_round: FiveHundredRound):
+    cards_on_board = {
+        Seat(1): FiveHundredCard(Suit.CLUB, Rank.ACE),
+        Seat(2): None,
+        Seat(3): FiveHundredCard(Suit.HEART, Rank.NINE),
+    }
+    round = replace(sample_round, cards_on_board=cards_on_board, required_suit=Suit.HEART, trump_suit=Suit.SPADE)
+    assert round.cards_on_board_count == 2
+    assert round.trick_lead_seat == Seat(3)  # Seat(2) has not played yet, so the trick was started by Seat(3)
+    assert round.trick_winning_seat == Seat(3)
+    assert round.active_bidders_count == 3
+
+
+def test_trick_lead_seat_roundtrip(sample_round: FiveHundredRound):
+    cards_on_board = {Seat(1): FiveHundredCard(Suit.CLUB, Rank.ACE), Seat(2): FiveHundredCard(Suit.CLUB, Rank.NINE)}
+    round = replace(sample_round, cards_on_board=cards_on_board, required_suit=Suit.CLUB, trick_lead_seat=Seat(2))
+    restored = FiveHundredRound.from_dict(round.to_dict())
+    assert restored.trick_lead_seat == Seat(2)
+    assert restored.trick_winning_seat == Seat(1)
+
+
+def test_trick_winner_is_resolved_from_lead_seat(sample_round: FiveHundredRound):
+    # Seat(3) led with a club, Seat(1) trumped it and Seat(2) played a stronger club
+    cards_on_board = {
+        Seat(1): FiveHundredCard(Suit.SPADE, Rank.NINE),
+        Seat(2): FiveHundredCard(Suit.CLUB, Rank.ACE),
+        Seat(3): FiveHundredCard(Suit.CLUB, Rank.TEN),
+    }
+    round = replace(
+        sample_round,
+        cards_on_board=cards_on_board,
+        required_suit=Suit.CLUB,
+        trump_suit=Suit.SPADE,
+        trick_lead_seat=Seat(3),
+    )
+    assert round.trick_winning_seat == Seat(1)
+
+    restored = FiveHundredRound.from_dict(round.to_dict())
+    assert (restored.trick_lead_seat, restored.trick_winning_seat) == (Seat(3), Seat(1))
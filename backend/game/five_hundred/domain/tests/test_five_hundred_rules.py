@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from ....common.card import Rank, Suit
+from ....common.hand import Hand
+from ..five_hundred_card import FiveHundredCard
+from ..five_hundred_rules import (
+    ALL_CARDS,
+    beats,
+    has_marriage,
+    is_legal_move,
+    legal_moves,
+    trick_winning_card,
+)
+
+
+def _cards(*card_strings: str) -> list[FiveHundredCard]:
+    return [FiveHundredCard.from_string(card) for card in card_strings]
+
+
+@pytest.mark.parametrize(
+    argnames="required_suit, trump_suit, expected_cards",
+    argvalues=[
+        (None, None, _cards("9c", "Ac", "Th", "Kd")),
+        (Suit.CLUB, Suit.HEART, _cards("9c", "Ac")),
+        (Suit.SPADE, Suit.HEART, _cards("Th")),
+        (Suit.SPADE, Suit.SPADE, _cards("9c", "Ac", "Th", "Kd")),
+    ],
+    ids=["no_trick_started", "has_required_suit", "has_trump_only", "has_neither"],
+)
+def test_legal_moves(required_suit: Suit | None, trump_suit: Suit | None, expected_cards: list[FiveHundredCard]):
+    hand = Hand(_cards("9c", "Ac", "Th", "Kd"))
+    assert set(legal_moves(hand, required_suit, trump_suit)) == set(expected_cards)
+    for card in hand:
+        assert is_legal_move(hand, card, required_suit, trump_suit) == (card in expected_cards)
+
+
+def test_trick_winning_card_matches_pairwise_beats():
+    rng = random.Random(7)
+    for _ in range(500):
+        trick = rng.sample(ALL_CARDS, 3)
+        required_suit, trump_suit = trick[0].suit, rng.choice(list(Suit))
+        winner = trick[0]
+        for card in trick[1:]:
+            if beats(card, winner, required_suit, trump_suit):
+                winner = card
+        assert trick_winning_card(trick, required_suit, trump_suit) == winner
+
+
+def test_trick_winning_card_prefers_trump_over_required_suit():
+    trick = _cards("Ah", "9s", "Th")
+    assert trick_winning_card(trick, required_suit=Suit.HEART, trump_suit=Suit.SPADE) == FiveHundredCard(
+        Suit.SPADE, Rank.NINE
+    )
+    assert trick_winning_card(trick, required_suit=Suit.HEART, trump_suit=Suit.CLUB) == FiveHundredCard(
+        Suit.HEART, Rank.ACE
+    )
+
+
+def test_has_marriage():
+    assert has_marriage(Hand(_cards("Kc", "Qc", "9h")))
+    assert not has_marriage(Hand(_cards("Kc", "Qh", "9h")))
+    assert not has_marriage(Hand[FiveHundredCard]())
@@ -0,0 +1,82 @@
+from collections.abc import Sequence
+from typing import Any, override
+
+from ..common.game_event_columns import NO_VALUE, GameEventColumnsEncoder, GameEventRow
+from ..common.game_exception import GameParsingException
+from .domain.five_hundred_card import FiveHundredCard
+
+# append only, positions are type codes stored in exported archives
+EVENT_TYPES: tuple[str, ...] = (
+    "deck_shuffled",
+    "bid_made",
+    "bidding_finished",
+    "declarer_gave_up",
+    "hidden_cards_taken",
+    "cards_passed",
+    "card_played",
+    "marriage_points_added",
+    "trick_taken",
+    "round_finished",
+    "game_ended",
+)
+
+EVENT_TYPE_CODES: dict[str, int] = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+
+
+def _card(card_str: str) -> int:
+    return FiveHundredCard.from_string(card_str).ordinal
+
+
+def _seat(raw_seat: Any) -> int:
+    return int(raw_seat) if raw_seat is not None else NO_VALUE
+
+
+def _value(raw_value: int | None) -> int:
+    return raw_value if raw_value is not None else NO_VALUE  # e.g. passed bid
+
+
+class FiveHundredEventColumnsEncoder(GameEventColumnsEncoder):
+    """Flattens serialized Five Hundred events without parsing them into events: seats are seat numbers,
+    cards are card ordinals, round points are ordered by seat number, marriage points are the only points value. Event fields not listed in
+    `GameEventRow` (e.g. game ending reason) are not exported."""
+
+    @property
+    @override
+    def event_types(self) -> Sequence[str]:
+        return EVENT_TYPES
+
+    @override
+    def to_row(self, data: dict[str, Any]) -> GameEventRow:
+        event_type = data["type"]
+        type_code = EVENT_TYPE_CODES.get(event_type)
+        if type_code is None:
+            raise GameParsingException(
+                reason="game_event_parsing_error", detail=f"Could not encode five hundred game event: {data}"
+            )
+
+        match event_type:
+            case "deck_shuffled":
+                return GameEventRow(type_code, cards=[_card(card) for card in data["deck"]])
+            case "bid_made" | "bidding_finished":
+                return GameEventRow(type_code, seat=_seat(data["made_by"]), bid=_value(data["bid"]))
+            case "cards_passed":
+                return GameEventRow(
+                    type_code, cards=[_card(data["card_to_next_seat"]), _card(data["card_to_prev_seat"])]
+                )
+            case "card_played":
+                return GameEventRow(type_code, seat=_seat(data["played_by"]), card=_card(data["card"]))
+            case "trick_taken":
+                return GameEventRow(
+                    type_code, seat=_seat(data["taken_by"]), cards=[_card(card) for card in data["cards"]]
+                )
+            case "declarer_gave_up":
+                return GameEventRow(type_code, seat=_seat(data["made_by"]))
+            case "marriage_points_added":
+                return GameEventRow(type_code, seat=_seat(data["added_to"]), points=[data["points"]])
+            case "round_finished":
+                points = sorted(data["points"].items(), key=lambda item: int(item[0]))
+                return GameEventRow(type_code, seat=_seat(data["declarer"]), points=[value for _, value in points])
+            case "game_ended":
+                return GameEventRow(type_code, seat=_seat(data["seat"]))
+            case _:
+                return GameEventRow(type_code)
@@ -1,8 +1,13 @@
+from collections.abc import Callable, Sequence
 from typing import Any, override
 
+from ..common.game_ending import GameEndingReason
 from ..common.game_exception import GameParsingException
 from ..common.game_event import GameEvent
 from ..common.game_event_parser import GameEventParser
+from ..common.seat import MAX_INTERNED_SEAT_NUMBER, Seat
+from .domain.five_hundred_card import FiveHundredCard
+from .domain.five_hundred_deck import FiveHundredDeck
 from .domain.five_hundred_event import (
     BidMadeEvent,
     BiddingFinishedEvent,
@@ -15,39 +20,109 @@ from .domain.five_hundred_event import (
     TrickTakenEvent,
     RoundFinishedEvent,
     GameEndedEvent,
+    FiveHundredEvent,
 )
 
+# serialized seat (number as string or int) -> interned seat, so parsing a seat is a single lookup
+_SEATS: dict[str | int, Seat] = {
+    key: Seat(number) for number in range(MAX_INTERNED_SEAT_NUMBER) for key in (number, str(number))
+}
+
+EVENT_CLASSES: dict[str, type[FiveHundredEvent]] = {
+    event_class.type: event_class
+    for event_class in (
+        DeckShuffledEvent,
+        BidMadeEvent,
+        BiddingFinishedEvent,
+        DeclarerGaveUpEvent,
+        HiddenCardsTakenEvent,
+        CardsPassedEvent,
+        CardPlayedEvent,
+        MarriagePointsAddedEvent,
+        TrickTakenEvent,
+        RoundFinishedEvent,
+        GameEndedEvent,
+    )
+}
+
 
 class FiveHundredEventParser(GameEventParser):
+    """Parses serialized events through a table of constructors by event type. Constructors build events
+    directly from serialized fields with lookups of interned seats and cards. Input they can't handle
+    (non-canonical card strings, not interned seats, missing fields) is parsed by `from_dict` of event classes,
+    which stays the reference format and reports errors."""
+
+    def __init__(self) -> None:
+        seats = _SEATS
+        cards: dict[str, FiveHundredCard] = {
+            card.to_dict(): card for card in FiveHundredCard.all_cards() if isinstance(card, FiveHundredCard)
+        }
+
+        self._constructors: dict[str, Callable[[dict[str, Any]], GameEvent]] = {
+            DeckShuffledEvent.type: lambda data: DeckShuffledEvent(
+                deck=FiveHundredDeck([cards[card] for card in data["deck"]], shuffle_on_init=False),
+                seq_number=data["seq_number"],
+            ),
+            BidMadeEvent.type: lambda data: BidMadeEvent(
+                bid=data["bid"], made_by=seats[data["made_by"]], seq_number=data["seq_number"]
+            ),
+            BiddingFinishedEvent.type: lambda data: BiddingFinishedEvent(
+                bid=data["bid"],
+                made_by=seats[data["made_by"]] if data["made_by"] else None,
+                seq_number=data["seq_number"],
+            ),
+            DeclarerGaveUpEvent.type: lambda data: DeclarerGaveUpEvent(
+                made_by=seats[data["made_by"]], seq_number=data["seq_number"]
+            ),
+            HiddenCardsTakenEvent.type: lambda data: HiddenCardsTakenEvent(seq_number=data["seq_number"]),
+            CardsPassedEvent.type: lambda data: CardsPassedEvent(
+                card_to_next_seat=cards[data["card_to_next_seat"]],
+                card_to_prev_seat=cards[data["card_to_prev_seat"]],
+                seq_number=data["seq_number"],
+            ),
+            CardPlayedEvent.type: lambda data: CardPlayedEvent(
+                card=cards[data["card"]], played_by=seats[data["played_by"]], seq_number=data["seq_number"]
+            ),
+            MarriagePointsAddedEvent.type: lambda data: MarriagePointsAddedEvent(
+                points=data["points"], added_to=seats[data["added_to"]], seq_number=data["seq_number"]
+            ),
+            TrickTakenEvent.type: lambda data: TrickTakenEvent(
+                taken_by=seats[data["taken_by"]],
+                cards=[cards[card] for card in data["cards"]],
+                seq_number=data["seq_number"],
+            ),
+            RoundFinishedEvent.type: lambda data: RoundFinishedEvent(
+                round_number=data["round_number"],
+                declarer=seats[data["declarer"]] if data["declarer"] else None,
+                given_up=data["given_up"],
+                points={seats[seat_number]: value for seat_number, value in data["points"].items()},
+                seq_number=data["seq_number"],
+            ),
+            GameEndedEvent.type: lambda data: GameEndedEvent(
+                reason=GameEndingReason.from_string(data["reason"]),
+                seat=seats[data["seat"]] if data["seat"] else None,
+                seq_number=data["seq_number"],
+            ),
+        }
+
     @override
     def from_dict(self, data: dict[str, Any]) -> GameEvent:
-        event_type = data["type"]
-
-        match event_type:
-            case "deck_shuffled":
-                return DeckShuffledEvent.from_dict(data)
-            case "bid_made":
-                return BidMadeEvent.from_dict(data)
-            case "bidding_finished":
-                return BiddingFinishedEvent.from_dict(data)
-            case "declarer_gave_up":
-                return DeclarerGaveUpEvent.from_dict(data)
-            case "hidden_cards_taken":
-                return HiddenCardsTakenEvent.from_dict(data)
-            case "cards_passed":
-                return CardsPassedEvent.from_dict(data)
-            case "card_played":
-                return CardPlayedEvent.from_dict(data)
-            case "marriage_points_added":
-                return MarriagePointsAddedEvent.from_dict(data)
-            case "trick_taken":
-                return TrickTakenEvent.from_dict(data)
-            case "round_finished":
-                return RoundFinishedEvent.from_dict(data)
-            case "game_ended":
-                return GameEndedEvent.from_dict(data)
-            case _:
-                raise GameParsingException(
-                    reason="game_event_parsing_error",
-                    detail=f"Could not parse five hundred game event from input: {data}",
-                )
+        constructor = self._constructors.get(data["type"])
+        if constructor is None:
+            raise GameParsingException(
+                reason="game_event_parsing_error",
+                detail=f"Could not parse five hundred game event from input: {data}",
+            )
+        try:
+            return constructor(data)
+        except KeyError:
+            return EVENT_CLASSES[data["type"]].from_dict(data)
+
+    @override
+    def parse_many(self, rows: Sequence[dict[str, Any]]) -> list[GameEvent]:
+        constructors = self._constructors
+        try:
+            return [constructors[data["type"]](data) for data in rows]
+        except KeyError:
+            # some rows need the reference parsing or have unknown types, parse them one by one
+            return [self.from_dict(data) for data in rows]
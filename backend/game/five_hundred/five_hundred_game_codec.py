@@ -0,0 +1,169 @@
+from collections.abc import Sequence
+from typing import Any, override
+
+from ..common.card import Suit
+from ..common.game_ending import GameEnding
+from ..common.game_exception import GameEngineException, GameParsingException
+from ..common.game_state import GameState
+from ..common.game_state_codec import GameStateCodec
+from ..common.hand import Hand
+from ..common.seat import Seat
+from ..common.seat_map import SeatMap
+from .domain.five_hundred_card import FiveHundredCard
+from .domain.five_hundred_game import FiveHundredGame
+from .domain.five_hundred_game_config import FiveHundredGameConfig
+from .domain.five_hundred_phase import FiveHundredPhase
+from .domain.five_hundred_round import FiveHundredRound
+from .domain.five_hundred_seat_info import FiveHundredSeatInfo
+
+CODEC_VERSION = 1
+
+CARD_STRING_LENGTH = 2  # rank symbol + suit symbol, e.g. "Th"
+
+
+def _cards_to_string(cards: Sequence[FiveHundredCard]) -> str:
+    return "".join(card.to_dict() for card in cards)
+
+
+def _cards_from_string(data: str) -> list[FiveHundredCard]:
+    return [
+        FiveHundredCard.from_string(data[i : i + CARD_STRING_LENGTH]) for i in range(0, len(data), CARD_STRING_LENGTH)
+    ]
+
+
+class FiveHundredGameCodec(GameStateCodec):
+    """Flat layout of FiveHundredGame for table snapshots: one list of numbers and short strings, in field order.
+    Hands are stored as card-ordinal bitmasks, ordered card sequences as concatenated card strings,
+    and per-seat collections as a length followed by their entries.
+    """
+
+    @override
+    def encode(self, game_state: GameState) -> list[Any]:
+        if not isinstance(game_state, FiveHundredGame):
+            raise GameEngineException(
+                detail=f"Could not encode game state: expected FiveHundredGame, got {type(game_state).__name__}"
+            )
+        game = game_state
+        round = game.round
+        config = game.game_config
+
+        data: list[Any] = [
+            CODEC_VERSION,
+            game.turn_number,
+            game.event_number,
+            game.replay_safe_event_number,
+            game.active_seat.number,
+            config.max_rounds,
+            config.max_bid_no_marriage,
+            config.min_bid,
+            config.give_up_points,
+            game.ending.to_dict() if game.ending else None,
+            len(game.taken_seats),
+            *(seat.number for seat in game.taken_seats),
+            len(game.summary),
+        ]
+        for seat, points in game.summary.items():
+            data += (seat.number, points)
+
+        data += (
+            round.phase.value,
+            round.round_number,
+            round.first_seat.number,
+            round.required_suit.symbol if round.required_suit else None,
+            round.trump_suit.symbol if round.trump_suit else None,
+            round.highest_bid[0].number if round.highest_bid else None,
+            round.highest_bid[1] if round.highest_bid else None,
+            round.is_marriage_announced,
+            round.trick_lead_seat.number if round.trick_lead_seat else None,
+            _cards_to_string(round.cards_to_take),
+            len(round.seat_infos),
+        )
+        for seat, info in round.seat_infos.items():
+            data += (seat.number, info.hand.mask, info.bid, info.points, info.trick_count, len(info.marriage_points))
+            data += info.marriage_points
+
+        data.append(len(round.cards_on_board))
+        for seat, card in round.cards_on_board.items():
+            data += (seat.number, card.to_dict() if card else None)
+
+        data.append(len(round.tricks))
+        for trick in round.tricks:
+            data.append(len(trick))
+            for seat, card in trick.items():
+                data += (seat.number, card.to_dict())
+
+        return data
+
+    @override
+    def decode(self, data: list[Any]) -> GameState:
+        if not data or data[0] != CODEC_VERSION:
+            raise GameParsingException(
+                reason="game_state_decoding_error",
+                detail=f"Could not decode game state: unsupported codec version {data[0] if data else None}",
+            )
+        take = iter(data).__next__
+        _ = take()  # codec version
+
+        turn_number = take()
+        event_number = take()
+        replay_safe_event_number = take()
+        active_seat = Seat(take())
+        game_config = FiveHundredGameConfig(
+            max_rounds=take(), max_bid_no_marriage=take(), min_bid=take(), give_up_points=take()
+        )
+        raw_ending = take()
+        taken_seats = frozenset(Seat(take()) for _ in range(take()))
+        summary = {Seat(take()): take() for _ in range(take())}
+
+        phase = FiveHundredPhase(take())
+        round_number = take()
+        first_seat = Seat(take())
+        raw_required_suit = take()
+        raw_trump_suit = take()
+        raw_highest_bid_seat = take()
+        raw_highest_bid = take()
+        is_marriage_announced = bool(take())
+        raw_trick_lead_seat = take()
+        cards_to_take = _cards_from_string(take())
+
+        seat_infos: list[tuple[Seat, FiveHundredSeatInfo]] = []
+        for _ in range(take()):
+            seat = Seat(take())
+            hand = Hand.from_mask(take(), FiveHundredCard)
+            bid, points, trick_count = take(), take(), take()
+            marriage_points = [take() for _ in range(take())]
+            seat_infos.append((seat, FiveHundredSeatInfo(hand, bid, points, trick_count, marriage_points)))
+
+        cards_on_board: list[tuple[Seat, FiveHundredCard | None]] = []
+        for _ in range(take()):
+            seat = Seat(take())
+            raw_card = take()
+            cards_on_board.append((seat, FiveHundredCard.from_string(raw_card) if raw_card else None))
+
+        tricks = [{Seat(take()): FiveHundredCard.from_string(take()) for _ in range(take())} for _ in range(take())]
+
+        round = FiveHundredRound(
+            seat_infos=SeatMap(seat_infos),
+            cards_on_board=SeatMap(cards_on_board),
+            tricks=tricks,
+            cards_to_take=cards_to_take,
+            required_suit=Suit.from_string(raw_required_suit) if raw_required_suit else None,
+            trump_suit=Suit.from_string(raw_trump_suit) if raw_trump_suit else None,
+            highest_bid=(Seat(raw_highest_bid_seat), raw_highest_bid) if raw_highest_bid_seat is not None else None,
+            phase=phase,
+            round_number=round_number,
+            first_seat=first_seat,
+            is_marriage_announced=is_marriage_announced,
+            trick_lead_seat=Seat(raw_trick_lead_seat) if raw_trick_lead_seat is not None else None,
+        )
+        return FiveHundredGame(
+            round=round,
+            summary=summary,
+            active_seat=active_seat,
+            ending=GameEnding.from_dict(raw_ending) if raw_ending else None,
+            game_config=game_config,
+            taken_seats=taken_seats,
+            turn_number=turn_number,
+            event_number=event_number,
+            replay_safe_event_number=replay_safe_event_number,
+        )
@@ -1,3 +1,4 @@
+import random
 from collections.abc import Sequence
 from typing import override
 
@@ -17,6 +18,10 @@ from .domain.five_hundred_game import FiveHundredGame
 
 
 class FiveHundredGameEngine(GameEngine):
+    def __init__(self, rng: random.Random | None = None) -> None:
+        # decks are shuffled with the module-level RNG unless a dedicated one is given, e.g. by seeded simulations
+        self._shuffle_fn = rng.shuffle if rng is not None else random.shuffle
+
     @override
     def process_command(self, game_state: GameState, command: GameCommand) -> tuple[GameState, Sequence[GameEvent]]:
         # Validate and narrow types to Five Hundred specifics
@@ -28,7 +33,7 @@ class FiveHundredGameEngine(GameEngine):
             raise GameEngineException(
                 detail=f"Could not process command: expected FiveHundredCommand, got {type(command).__name__}"
             )
-        game_state_updated, events = process_command(game_state, command)
+        game_state_updated, events = process_command(game_state, command, self._shuffle_fn)
         return game_state_updated, events
 
     @override
@@ -41,7 +46,7 @@ class FiveHundredGameEngine(GameEngine):
             )
         game_state = FiveHundredGame.init(game_config, taken_seat_numbers)
         command = StartGameCommand()
-        game_state_updated, events = process_command(game_state, command)
+        game_state_updated, events = process_command(game_state, command, self._shuffle_fn)
         return game_state_updated, events
 
     @override
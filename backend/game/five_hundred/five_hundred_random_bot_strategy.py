@@ -6,7 +6,6 @@ from ..bot_strategy_kind import BotStrategyKind
 from ..common.bot_strategy import BotStrategy
 from ..common.game_command import GameCommand
 from ..common.game_state import GameState
-from .logic.helpers import has_marriage_in_hand
 from .domain.constants import BID_STEP, MAX_BID, NOT_ALLOWED_TO_BID_THRESHOLD
 from .domain.five_hundred_command import (
     MakeBidCommand,
@@ -15,11 +14,15 @@ from .domain.five_hundred_command import (
 )
 from .domain.five_hundred_game import FiveHundredGame
 from .domain.five_hundred_phase import FiveHundredPhase
+from .domain.five_hundred_rules import has_marriage, legal_moves
 
 
 class FiveHundredRandomBotStrategy(BotStrategy):
     kind: BotStrategyKind = BotStrategyKind.RANDOM
 
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._rng: random.Random = rng if rng is not None else random.Random()
+
     @override
     def create_command(self, game_state: GameState) -> GameCommand:
         if not isinstance(game_state, FiveHundredGame):
@@ -35,10 +38,10 @@ class FiveHundredRandomBotStrategy(BotStrategy):
 
                 if game_state.summary[game_state.active_seat] >= NOT_ALLOWED_TO_BID_THRESHOLD:
                     return MakeBidCommand(bid=-1)
-                if random.random() < passing_probability:
+                if self._rng.random() < passing_probability:
                     return MakeBidCommand(bid=-1)
-                bid = random.choice(range(highest_bid, MAX_BID + 1, BID_STEP))
-                if bid > game_state.game_config.max_bid_no_marriage and not has_marriage_in_hand(
+                bid = self._rng.choice(range(highest_bid, MAX_BID + 1, BID_STEP))
+                if bid > game_state.game_config.max_bid_no_marriage and not has_marriage(
                     game_state.active_seats_info.hand
                 ):
                     return MakeBidCommand(bid=-1)
@@ -46,16 +49,16 @@ class FiveHundredRandomBotStrategy(BotStrategy):
 
             case FiveHundredPhase.FORMING_HANDS:
                 active_seats_cards = list(game_state.active_seats_info.hand.cards)
-                card1, card2 = random.sample(active_seats_cards, 2)
+                card1, card2 = self._rng.sample(active_seats_cards, 2)
 
                 return PassCardsCommand(card_to_next_seat=card1, card_to_prev_seat=card2)
 
             case FiveHundredPhase.PLAYING_CARDS:
-                cards_allowed_to_play = game_state.active_seats_info.cards_allowed_to_play(
-                    game_state.round.required_suit, game_state.round.trump_suit
+                cards_allowed_to_play = legal_moves(
+                    game_state.active_seats_info.hand, game_state.round.required_suit, game_state.round.trump_suit
                 )
 
-                card_to_play = random.choice(cards_allowed_to_play)
+                card_to_play = self._rng.choice(cards_allowed_to_play.cards)
                 return PlayCardCommand(card=card_to_play)
 
             case _:
@@ -0,0 +1,252 @@
+"""Headless self-play of Five Hundred between bot strategies, using only the game engine (no Django, no DB).
+
+Used to measure engine and bot throughput and to generate event logs for training and regression data:
+
+    python -m game.five_hundred.five_hundred_simulation --games 1000 --workers 4 --seed 7 --events-path events.jsonl
+"""
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+from ..bot_strategy_kind import BotStrategyKind
+from ..common.bot_strategy import BotStrategy
+from ..common.game_exception import GameEngineException, GameRulesException
+from .domain.five_hundred_game import FiveHundredGame
+from .domain.five_hundred_game_config import FiveHundredGameConfig
+from .five_hundred_game_engine import FiveHundredGameEngine
+from .five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+
+# bot strategies are created per game with the RNG of the game, so games are reproducible by their seeds
+type BotStrategyFactory = Callable[[random.Random], BotStrategy]
+
+BOT_STRATEGIES: dict[BotStrategyKind, BotStrategyFactory] = {
+    BotStrategyKind.RANDOM: FiveHundredRandomBotStrategy,
+}
+
+MAX_REJECTED_COMMANDS_IN_A_ROW = 100  # bots are random, but a bot stuck on invalid commands is a bug
+
+GAMES_PER_TASK = 16  # games sent to a worker at once, small enough to keep workers evenly loaded
+
+
+@dataclass(slots=True)
+class SimulationStats:
+    games: int = 0
+    events: int = 0
+    commands: int = 0
+    rejected_commands: int = 0  # invalid commands created by bots, retried
+    elapsed_seconds: float = 0.0  # wall-clock time of the whole simulation
+    phase_seconds: dict[str, float] = field(default_factory=dict)  # time spent processing commands, per phase
+    phase_commands: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def merge(self, other: "SimulationStats") -> None:
+        self.games += other.games
+        self.events += other.events
+        self.commands += other.commands
+        self.rejected_commands += other.rejected_commands
+        for phase, seconds in other.phase_seconds.items():
+            self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+        for phase, count in other.phase_commands.items():
+            self.phase_commands[phase] = self.phase_commands.get(phase, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "games": self.games,
+            "events": self.events,
+            "commands": self.commands,
+            "rejected_commands": self.rejected_commands,
+            "elapsed_seconds": self.elapsed_seconds,
+            "games_per_second": self.games_per_second,
+            "events_per_second": self.events_per_second,
+            "phase_seconds": self.phase_seconds,
+            "phase_commands": self.phase_commands,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SimulatedGame:
+    game_index: int
+    seed: int
+    final_state: FiveHundredGame
+    events: Sequence[dict[str, Any]]  # serialized events, only collected when requested
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "game_index": self.game_index,
+            "seed": self.seed,
+            "summary": {seat.to_dict(): points for seat, points in self.final_state.summary.items()},
+            "events": self.events,
+        }
+
+
+def play_game(
+    game_config: FiveHundredGameConfig,
+    bot_strategy_factories: Sequence[BotStrategyFactory],
+    seed: int,
+    game_index: int = 0,
+    collect_events: bool = False,
+    stats: SimulationStats | None = None,
+) -> SimulatedGame:
+    """Plays one game to its end, bot strategy created by the factory at index i takes seat i + 1.
+    Deck shuffling and bots share an RNG seeded with `seed`, so the game can be replayed."""
+    rng = random.Random(seed)
+    engine = FiveHundredGameEngine(rng)
+    stats = stats if stats is not None else SimulationStats()
+    strategies_by_seat = {
+        seat_number: create_strategy(rng) for seat_number, create_strategy in enumerate(bot_strategy_factories, start=1)
+    }
+
+    game_state, events = engine.start_game(game_config, frozenset(strategies_by_seat))
+    event_count = len(events)
+    collected = [event.to_dict() for event in events] if collect_events else []
+    rejected_in_a_row = 0
+
+    while game_state.ending is None:
+        if not isinstance(game_state, FiveHundredGame):
+            raise GameEngineException(
+                detail=f"Could not simulate the game: expected FiveHundredGame, got {type(game_state).__name__}"
+            )
+        phase = game_state.round.phase.value
+        command = strategies_by_seat[game_state.active_seat.number].create_command(game_state)
+        started_at = time.perf_counter()
+        try:
+            game_state, events = engine.process_command(game_state, command)
+        except GameRulesException:
+            rejected_in_a_row += 1
+            stats.rejected_commands += 1
+            if rejected_in_a_row >= MAX_REJECTED_COMMANDS_IN_A_ROW:
+                raise GameEngineException(
+                    detail=f"Could not simulate the game: bot created {rejected_in_a_row} invalid commands in a row"
+                )
+            continue
+        # only accepted commands are timed, so the time per command matches `phase_commands`
+        stats.phase_seconds[phase] = stats.phase_seconds.get(phase, 0.0) + time.perf_counter() - started_at
+        rejected_in_a_row = 0
+        stats.commands += 1
+        stats.phase_commands[phase] = stats.phase_commands.get(phase, 0) + 1
+        event_count += len(events)
+        if collect_events:
+            collected.extend(event.to_dict() for event in events)
+
+    if not isinstance(game_state, FiveHundredGame):
+        raise GameEngineException(
+            detail=f"Could not simulate the game: expected FiveHundredGame, got {type(game_state).__name__}"
+        )
+    stats.games += 1
+    stats.events += event_count
+    return SimulatedGame(game_index=game_index, seed=seed, final_state=game_state, events=collected)
+
+
+def _play_games(
+    game_config: FiveHundredGameConfig,
+    bot_strategy_factories: Sequence[BotStrategyFactory],
+    seed: int,
+    game_indexes: range,
+    collect_events: bool,
+) -> tuple[SimulationStats, list[SimulatedGame]]:
+    stats = SimulationStats()
+    games = [
+        play_game(game_config, bot_strategy_factories, seed + game_index, game_index, collect_events, stats)
+        for game_index in game_indexes
+    ]
+    # final states are not needed by the caller when events are not collected, do not send them between processes
+    return stats, games if collect_events else []
+
+
+def _tasks(games: int) -> Iterator[range]:
+    for start in range(0, games, GAMES_PER_TASK):
+        yield range(start, min(start + GAMES_PER_TASK, games))
+
+
+def run_simulation(
+    games: int,
+    game_config: FiveHundredGameConfig,
+    bot_strategy_factories: Sequence[BotStrategyFactory],
+    seed: int = 0,
+    workers: int = 1,
+    events_output: TextIO | None = None,
+) -> SimulationStats:
+    """Plays `games` games, game N is seeded with `seed + N`, so results do not depend on the number of workers.
+    With `events_output` given, one JSON line per game (its seed, final summary and events) is written to it,
+    in the order games are finished - with more workers, batches of games may finish out of order."""
+    if games < 0 or workers < 1:
+        raise GameEngineException(detail=f"Could not run simulation: invalid games ({games}) or workers ({workers})")
+    collect_events = events_output is not None
+    stats = SimulationStats()
+    started_at = time.perf_counter()
+
+    def _collect(task_stats: SimulationStats, simulated_games: list[SimulatedGame]) -> None:
+        stats.merge(task_stats)
+        if events_output is not None:
+            for simulated_game in simulated_games:
+                events_output.write(json.dumps(simulated_game.to_dict()) + "\n")
+
+    if workers == 1:
+        for game_indexes in _tasks(games):
+            _collect(*_play_games(game_config, bot_strategy_factories, seed, game_indexes, collect_events))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_play_games, game_config, bot_strategy_factories, seed, game_indexes, collect_events)
+                for game_indexes in _tasks(games)
+            ]
+            for future in as_completed(futures):
+                _collect(*future.result())
+
+    stats.elapsed_seconds = time.perf_counter() - started_at
+    return stats
+
+
+def _format_report(stats: SimulationStats) -> str:
+    lines = [
+        f"games: {stats.games} in {stats.elapsed_seconds:.2f}s ({stats.games_per_second:.1f} games/sec)",
+        f"events: {stats.events} ({stats.events_per_second:.1f} events/sec)",
+        f"commands: {stats.commands} (+{stats.rejected_commands} rejected)",
+    ]
+    for phase, seconds in sorted(stats.phase_seconds.items(), key=lambda item: -item[1]):
+        count = stats.phase_commands.get(phase, 0)
+        per_command_us = seconds / count * 1e6 if count else 0.0
+        lines.append(f"  {phase}: {seconds:.3f}s, {count} commands, {per_command_us:.1f}us/command")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Five Hundred self-play between bots")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bots", default="random,random,random", help="comma separated bot strategy kinds, per seat")
+    parser.add_argument("--config", default="{}", help="game config as JSON, defaults are used for missing settings")
+    parser.add_argument("--events-path", help="write a JSON line with event log per game to this file")
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args(argv)
+
+    game_config = FiveHundredGameConfig.from_dict(json.loads(args.config))
+    bot_strategy_factories = [BOT_STRATEGIES[BotStrategyKind.from_str(kind.strip())] for kind in args.bots.split(",")]
+
+    if args.events_path:
+        with open(args.events_path, "w") as events_output:
+            stats = run_simulation(
+                args.games, game_config, bot_strategy_factories, args.seed, args.workers, events_output
+            )
+    else:
+        stats = run_simulation(args.games, game_config, bot_strategy_factories, args.seed, args.workers)
+
+    print(json.dumps(stats.to_dict()) if args.json else _format_report(stats))
+
+
+if __name__ == "__main__":
+    main()
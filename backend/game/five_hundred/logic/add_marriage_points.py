@@ -1,5 +1,3 @@
-from dataclasses import replace
-
 from ..domain.five_hundred_game import FiveHundredGame
 from ...common.seat import Seat
 
@@ -7,16 +5,15 @@ from ...common.seat import Seat
 def add_marriage_points(game: FiveHundredGame, points: int, add_to: Seat) -> FiveHundredGame:
     seat_info = game.round.seat_infos[add_to]
 
-    marriage_points_updated = list(seat_info.marriage_points) + [points]
+    marriage_points_updated = [*seat_info.marriage_points, points]
 
-    seat_info_updated = replace(
-        seat_info,
+    seat_info_updated = seat_info.evolve(
         marriage_points=marriage_points_updated,
         points=seat_info.points + points,
     )
 
-    seat_infos_updated = dict(game.round.seat_infos) | {add_to: seat_info_updated}
+    seat_infos_updated = game.round.seat_infos.set(add_to, seat_info_updated)
 
-    round_updated = replace(game.round, seat_infos=seat_infos_updated, is_marriage_announced=True)
+    round_updated = game.round.evolve(seat_infos=seat_infos_updated, is_marriage_announced=True)
 
-    return replace(game, round=round_updated)
+    return game.evolve(round=round_updated)
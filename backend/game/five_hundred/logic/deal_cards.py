@@ -1,6 +1,3 @@
-from collections.abc import Mapping
-from dataclasses import replace
-
 from ...common.hand import Hand
 from ..domain.five_hundred_deck import FiveHundredDeck
 from ...common.seat import Seat
@@ -11,15 +8,18 @@ from ..domain.five_hundred_game import FiveHundredGame
 
 
 def deal_cards(game: FiveHundredGame, deck: FiveHundredDeck) -> FiveHundredGame:
-    cards_to_take = deck.draw_many(CARDS_TO_TAKE)
+    # deck is immutable, drawing only moves the deal cursor, so the event's deck stays intact for replays
+    cards_to_take, deck = deck.draw_many(CARDS_TO_TAKE)
 
-    seat_infos_updated: Mapping[Seat, FiveHundredSeatInfo] = {
-        seat: replace(seat_info, hand=Hand(tuple(deck.draw_many(CARDS_IN_STARTING_HAND))))
-        for seat, seat_info in game.round.seat_infos.items()
-    }
+    hands_dealt: dict[Seat, FiveHundredSeatInfo] = {}
+    for seat, seat_info in game.round.seat_infos.items():
+        cards, deck = deck.draw_many(CARDS_IN_STARTING_HAND)
+        hands_dealt[seat] = seat_info.evolve(hand=Hand(cards))
 
-    round_updated = replace(
-        game.round, seat_infos=seat_infos_updated, cards_to_take=cards_to_take, phase=FiveHundredPhase.BIDDING
+    round_updated = game.round.evolve(
+        seat_infos=game.round.seat_infos.set_many(hands_dealt),
+        cards_to_take=cards_to_take,
+        phase=FiveHundredPhase.BIDDING,
     )
 
-    return replace(game, round=round_updated)
+    return game.evolve(round=round_updated)
@@ -1,7 +1,6 @@
 from collections.abc import Sequence
-from dataclasses import replace
-
 from ...common.seat import Seat
+from ...common.seat_map import SeatMap
 from ...common.game_ending import GameEnding, GameEndingReason
 from ..domain.constants import GAME_STARTING_POINTS
 from ..domain.five_hundred_game import FiveHundredGame
@@ -9,17 +8,20 @@ from ..domain.five_hundred_phase import FiveHundredPhase
 
 
 def end_game(game: FiveHundredGame, reason: GameEndingReason, blamed_seat: Seat | None) -> FiveHundredGame:
-    round_updated = replace(
-        game.round,
+    round_updated = game.round.evolve(
         phase=FiveHundredPhase.GAME_ENEDED,
-        seat_infos={},
-        cards_on_board={},
+        seat_infos=SeatMap(),
+        cards_on_board=SeatMap(),
         cards_to_take=[],
         required_suit=None,
         trump_suit=None,
         highest_bid=None,
         round_number=0,
         is_marriage_announced=False,
+        trick_lead_seat=None,
+        cards_on_board_count=0,
+        trick_winning_seat=None,
+        active_bidders_count=0,
     )
 
     winners: Sequence[Seat] = []
@@ -41,8 +43,7 @@ def end_game(game: FiveHundredGame, reason: GameEndingReason, blamed_seat: Seat
         case GameEndingReason.CANCELLED:
             pass  # default values are already set
 
-    return replace(
-        game,
+    return game.evolve(
         round=round_updated,
         ending=GameEnding(winners=winners, losers=losers, reason=reason, point_differences=point_differences),
         replay_safe_event_number=game.event_number,
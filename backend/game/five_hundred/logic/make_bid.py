@@ -1,5 +1,3 @@
-from dataclasses import replace
-
 from ..domain.five_hundred_game import FiveHundredGame
 from .helpers import get_next_seat_to_bid
 
@@ -9,22 +7,26 @@ def make_bid(game: FiveHundredGame, bid: int) -> FiveHundredGame:
 
     highest_bid_updated = (active_seat, bid) if (bid > 0) else game.round.highest_bid
 
-    active_seats_info_updated = replace(game.round.seat_infos[active_seat], bid=bid)
+    active_seats_info = game.round.seat_infos[active_seat]
+    active_seats_info_updated = active_seats_info.evolve(bid=bid)
+
+    # negative bid means passing, a seat which has passed does not bid again
+    has_seat_just_passed = bid < 0 <= active_seats_info.bid
+    active_bidders_count_updated = game.round.active_bidders_count - (1 if has_seat_just_passed else 0)
 
-    seat_infos_updated = dict(game.round.seat_infos) | {active_seat: active_seats_info_updated}
+    seat_infos_updated = game.round.seat_infos.set(active_seat, active_seats_info_updated)
 
-    round_updated = replace(
-        game.round,
+    round_updated = game.round.evolve(
         seat_infos=seat_infos_updated,
         highest_bid=highest_bid_updated,
+        active_bidders_count=active_bidders_count_updated,
     )
 
-    next_seat_to_bid = get_next_seat_to_bid(active_seat, game.round.seat_infos)
+    next_seat_to_bid = get_next_seat_to_bid(active_seat, game.round.seat_infos, game.seat_ring)
 
     turn_number_updated = game.turn_number + 1
 
-    return replace(
-        game,
+    return game.evolve(
         round=round_updated,
         active_seat=(next_seat_to_bid if next_seat_to_bid is not None else active_seat),
         turn_number=turn_number_updated,
@@ -1,5 +1,3 @@
-from dataclasses import replace
-
 from ..domain.five_hundred_card import FiveHundredCard
 from ..domain.five_hundred_game import FiveHundredGame
 from ..domain.five_hundred_phase import FiveHundredPhase
@@ -11,8 +9,8 @@ def pass_cards(
     card_to_prev_seat: FiveHundredCard,
 ) -> FiveHundredGame:
     active_seat = game.active_seat
-    next_seat = active_seat.next(game.taken_seats)
-    prev_seat = active_seat.prev(game.taken_seats)
+    next_seat = game.seat_ring.next(active_seat)
+    prev_seat = game.seat_ring.prev(active_seat)
 
     active_seats_info = game.active_seats_info
     next_seats_info = game.round.seat_infos[next_seat]
@@ -22,20 +20,21 @@ def pass_cards(
     next_seats_hand_updated = next_seats_info.hand.with_added_cards([card_to_next_seat])
     prev_seats_hand_updated = prev_seats_info.hand.with_added_cards([card_to_prev_seat])
 
-    active_seats_info_updated = replace(active_seats_info, hand=active_seats_hand_updated)
-    next_seats_info_updated = replace(next_seats_info, hand=next_seats_hand_updated)
-    prev_seats_info_updated = replace(prev_seats_info, hand=prev_seats_hand_updated)
-
-    round_updated = replace(
-        game.round,
-        seat_infos={
-            active_seat: active_seats_info_updated,
-            next_seat: next_seats_info_updated,
-            prev_seat: prev_seats_info_updated,
-        },
+    active_seats_info_updated = active_seats_info.evolve(hand=active_seats_hand_updated)
+    next_seats_info_updated = next_seats_info.evolve(hand=next_seats_hand_updated)
+    prev_seats_info_updated = prev_seats_info.evolve(hand=prev_seats_hand_updated)
+
+    round_updated = game.round.evolve(
+        seat_infos=game.round.seat_infos.set_many(
+            {
+                active_seat: active_seats_info_updated,
+                next_seat: next_seats_info_updated,
+                prev_seat: prev_seats_info_updated,
+            }
+        ),
         phase=FiveHundredPhase.PLAYING_CARDS,
     )
 
     turn_number_updated = game.turn_number + 1
 
-    return replace(game, round=round_updated, turn_number=turn_number_updated)
+    return game.evolve(round=round_updated, turn_number=turn_number_updated)
@@ -1,19 +1,20 @@
-from dataclasses import replace
-
 from ..domain.five_hundred_card import FiveHundredCard
 from ..domain.five_hundred_game import FiveHundredGame
+from ..domain.five_hundred_rules import beats
 
 
 def play_card(game: FiveHundredGame, card: FiveHundredCard) -> FiveHundredGame:
     cards_on_board_count = game.round.cards_on_board_count
 
-    cards_on_board_updated = dict(game.round.cards_on_board) | {game.active_seat: card}
+    cards_on_board_updated = game.round.cards_on_board.set(game.active_seat, card)
 
     active_seat = game.active_seat
     active_seats_info = game.active_seats_info
     active_seats_hand_updated = active_seats_info.hand.without_cards([card])
 
-    active_seats_info_updated = replace(active_seats_info, hand=active_seats_hand_updated)
+    active_seats_info_updated = active_seats_info.evolve(hand=active_seats_hand_updated)
+
+    seat_infos_updated = game.round.seat_infos.set(active_seat, active_seats_info_updated)
 
     turn_number_updated = game.turn_number + 1
 
@@ -22,30 +23,32 @@ def play_card(game: FiveHundredGame, card: FiveHundredCard) -> FiveHundredGame:
         required_suit_updated = card.suit
         trump_suit_updated = card.suit if game.round.trump_suit is None else game.round.trump_suit
 
-        seat_infos_updated = dict(game.round.seat_infos) | {active_seat: active_seats_info_updated}
-
-        round_updated = replace(
-            game.round,
+        round_updated = game.round.evolve(
             cards_on_board=cards_on_board_updated,
             seat_infos=seat_infos_updated,
             required_suit=required_suit_updated,
             trump_suit=trump_suit_updated,
-        )
-
-        return replace(
-            game, round=round_updated, active_seat=active_seat.next(game.taken_seats), turn_number=turn_number_updated
+            trick_lead_seat=active_seat,
+            trick_winning_seat=active_seat,
+            cards_on_board_count=1,
         )
 
     # 2nd or 3rd card played for this trick
     else:
-        seat_infos_updated = dict(game.round.seat_infos) | {active_seat: active_seats_info_updated}
-
-        round_updated = replace(
-            game.round,
+        trick_winning_seat = game.round.trick_winning_seat
+        trick_winning_card = game.round.cards_on_board[trick_winning_seat] if trick_winning_seat else None
+        if trick_winning_card is None or beats(
+            card, trick_winning_card, game.round.required_suit, game.round.trump_suit
+        ):
+            trick_winning_seat = active_seat
+
+        round_updated = game.round.evolve(
             cards_on_board=cards_on_board_updated,
             seat_infos=seat_infos_updated,
+            trick_winning_seat=trick_winning_seat,
+            cards_on_board_count=cards_on_board_count + 1,
         )
 
-        return replace(
-            game, round=round_updated, active_seat=active_seat.next(game.taken_seats), turn_number=turn_number_updated
-        )
+    return game.evolve(
+        round=round_updated, active_seat=game.seat_ring.next(active_seat), turn_number=turn_number_updated
+    )
@@ -1,7 +1,4 @@
-from dataclasses import replace
-
 from ...common.seat import Seat
-from ..domain.five_hundred_card import FiveHundredCard
 from ..domain.five_hundred_game import FiveHundredGame
 
 
@@ -12,24 +9,25 @@ def take_trick(game: FiveHundredGame, taken_by: Seat) -> FiveHundredGame:
     points_updated = trick_winning_seats_info.points + sum(card.points.value for card in trick.values())
     trick_count_updated = trick_winning_seats_info.trick_count + 1
 
-    trick_winning_seats_info_updated = replace(
-        trick_winning_seats_info,
+    trick_winning_seats_info_updated = trick_winning_seats_info.evolve(
         points=points_updated,
         trick_count=trick_count_updated,
     )
 
-    cards_on_board_updated: dict[Seat, FiveHundredCard | None] = dict.fromkeys(game.round.cards_on_board, None)
+    cards_on_board_updated = game.round.cards_on_board.fill(None)
 
-    seat_infos_updated = dict(game.round.seat_infos) | {taken_by: trick_winning_seats_info_updated}
+    seat_infos_updated = game.round.seat_infos.set(taken_by, trick_winning_seats_info_updated)
 
-    tricks_updated = list(game.round.tricks) + [trick]
+    tricks_updated = [*game.round.tricks, trick]
 
-    round_updated = replace(
-        game.round,
+    round_updated = game.round.evolve(
         cards_on_board=cards_on_board_updated,
         tricks=tricks_updated,
         required_suit=None,
         seat_infos=seat_infos_updated,
+        trick_lead_seat=None,
+        trick_winning_seat=None,
+        cards_on_board_count=0,
     )
 
-    return replace(game, round=round_updated, active_seat=taken_by)
+    return game.evolve(round=round_updated, active_seat=taken_by)
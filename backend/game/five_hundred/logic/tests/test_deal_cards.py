@@ -13,3 +13,8 @@ def test_deal_cards_logic(sample_game: FiveHundredGame):
     assert len(game.round.cards_to_take) == CARDS_TO_TAKE
     assert len(game.round.seat_infos[Seat(1)].hand.cards) == CARDS_IN_STARTING_HAND
     assert game.round.phase == FiveHundredPhase.BIDDING
+
+
+def test_deal_cards_can_be_repeated_with_same_deck(sample_game: FiveHundredGame):
+    deck = FiveHundredDeck.build()
+    assert deal_cards(sample_game, deck) == deal_cards(sample_game, deck)
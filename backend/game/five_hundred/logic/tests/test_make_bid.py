@@ -12,6 +12,7 @@ def test_make_bid_with_non_passing_bid(sample_game: FiveHundredGame):
     assert game.round.seat_infos[bid_making_seat].bid == bid
     assert game.round.highest_bid == (bid_making_seat, bid)
     assert game.active_seat == get_next_seat_to_bid(bid_making_seat, game.round.seat_infos)
+    assert game.round.active_bidders_count == sample_game.round.active_bidders_count
 
 
 def test_make_bid_with_passing_bid(sample_game: FiveHundredGame):
@@ -21,3 +22,4 @@ def test_make_bid_with_passing_bid(sample_game: FiveHundredGame):
     assert game.round.seat_infos[bid_making_seat].bid == -5
     assert game.round.highest_bid == sample_game.round.highest_bid
     assert game.active_seat == Seat(2)
+    assert game.round.active_bidders_count == sample_game.round.active_bidders_count - 1
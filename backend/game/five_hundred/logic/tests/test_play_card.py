@@ -1,5 +1,7 @@
 from dataclasses import replace
 from ....common.card import Rank, Suit
+from ....common.hand import Hand
+from ....common.seat import Seat
 from ...domain.five_hundred_card import FiveHundredCard
 from ...domain.five_hundred_game import FiveHundredGame
 from ..play_card import play_card
@@ -29,3 +31,26 @@ def test_play_first_card_sets_required_and_trump_suit(sample_game: FiveHundredGa
 
     # Active seat should move to the next player
     assert game.active_seat == sample_game.active_seat.next(sample_game.taken_seats)
+
+
+def test_play_cards_tracks_trick_lead_and_winning_seat(sample_game: FiveHundredGame):
+    first_card = FiveHundredCard(Suit.CLUB, Rank.TEN)
+    second_card = FiveHundredCard(Suit.CLUB, Rank.ACE)
+    third_card = FiveHundredCard(Suit.HEART, Rank.ACE)
+    seat_infos = {
+        Seat(1): replace(sample_game.round.seat_infos[Seat(1)], hand=Hand([first_card])),
+        Seat(2): replace(sample_game.round.seat_infos[Seat(2)], hand=Hand([second_card])),
+        Seat(3): replace(sample_game.round.seat_infos[Seat(3)], hand=Hand([third_card])),
+    }
+    round = replace(sample_game.round, seat_infos=seat_infos, trump_suit=Suit.SPADE)
+    game = replace(sample_game, round=round, active_seat=Seat(1))
+
+    game = play_card(game, card=first_card)
+    assert (game.round.trick_lead_seat, game.round.trick_winning_seat) == (Seat(1), Seat(1))
+
+    game = play_card(game, card=second_card)
+    assert (game.round.trick_lead_seat, game.round.trick_winning_seat) == (Seat(1), Seat(2))
+
+    game = play_card(game, card=third_card)  # neither required nor trump suit, does not take the trick
+    assert (game.round.trick_lead_seat, game.round.trick_winning_seat) == (Seat(1), Seat(2))
+    assert game.round.cards_on_board_count == 3
@@ -28,5 +28,10 @@ def test_take_trick_logic(sample_game: FiveHundredGame):
     assert game.round.tricks == tricks_before + [cards_on_board]
     assert game.round.cards_on_board == {Seat(1): None, Seat(2): None, Seat(3): None}
     assert game.round.required_suit is None
+    assert (game.round.cards_on_board_count, game.round.trick_lead_seat, game.round.trick_winning_seat) == (
+        0,
+        None,
+        None,
+    )
     assert game.round.seat_infos[Seat(3)].points == 15  # 11 + 4 + 0
     assert game.active_seat == Seat(3)
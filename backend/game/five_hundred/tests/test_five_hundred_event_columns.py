@@ -0,0 +1,43 @@
+from ...common.game_event_columns import NO_VALUE
+from ..domain.five_hundred_card import FiveHundredCard
+from ..domain.five_hundred_game_config import FiveHundredGameConfig
+from ..five_hundred_event_columns import EVENT_TYPES, FiveHundredEventColumnsEncoder
+from ..five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from ..five_hundred_simulation import play_game
+
+CONFIG = FiveHundredGameConfig(max_rounds=5, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+BOTS = [FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy]
+
+
+def test_event_rows():
+    encoder = FiveHundredEventColumnsEncoder()
+    card_ordinal = FiveHundredCard.from_string("Ah").ordinal
+
+    row = encoder.to_row({"type": "card_played", "card": "Ah", "played_by": "3", "seq_number": 10})
+    assert (EVENT_TYPES[row.type_code], row.seat, row.card, row.bid) == ("card_played", 3, card_ordinal, NO_VALUE)
+
+    row = encoder.to_row({"type": "bid_made", "bid": None, "made_by": "2", "seq_number": 3})
+    assert (row.seat, row.bid) == (2, NO_VALUE)
+
+    row = encoder.to_row(
+        {
+            "type": "round_finished",
+            "round_number": 1,
+            "declarer": "3",
+            "given_up": False,
+            "points": {"3": 120, "1": -10, "2": -5},
+            "seq_number": 42,
+        }
+    )
+    assert (row.seat, list(row.points)) == (3, [-10, -5, 120])
+
+
+def test_all_events_of_a_game_are_encoded():
+    encoder = FiveHundredEventColumnsEncoder()
+    game = play_game(CONFIG, BOTS, seed=3, collect_events=True)
+
+    rows = [encoder.to_row(data) for data in game.events]
+
+    assert [EVENT_TYPES[row.type_code] for row in rows] == [data["type"] for data in game.events]
+    deck = next(row for row in rows if EVENT_TYPES[row.type_code] == "deck_shuffled")
+    assert sorted(deck.cards) == sorted(card.ordinal for card in FiveHundredCard.all_cards())
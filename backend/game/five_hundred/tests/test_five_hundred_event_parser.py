@@ -0,0 +1,47 @@
+import pytest
+
+from ...common.game_exception import GameParsingException
+from ..domain.five_hundred_event import BidMadeEvent, CardPlayedEvent
+from ..domain.five_hundred_game_config import FiveHundredGameConfig
+from ..five_hundred_event_parser import EVENT_CLASSES, FiveHundredEventParser
+from ..five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from ..five_hundred_simulation import play_game
+
+CONFIG = FiveHundredGameConfig(max_rounds=10, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+BOTS = [FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy]
+
+
+def test_parse_many_matches_event_classes():
+    rows = list(play_game(CONFIG, BOTS, seed=4, collect_events=True).events)
+    parser = FiveHundredEventParser()
+
+    events = parser.parse_many(rows)
+
+    assert events == [EVENT_CLASSES[row["type"]].from_dict(row) for row in rows]
+    assert events == [parser.from_dict(row) for row in rows]
+    assert [event.to_dict() for event in events] == rows
+
+
+def test_parse_many_non_canonical_rows():
+    parser = FiveHundredEventParser()
+    rows = [
+        {"type": "bid_made", "bid": 60, "made_by": "1", "seq_number": 1},
+        {"type": "card_played", "card": "aH", "played_by": 2, "seq_number": 2},
+    ]
+
+    events = parser.parse_many(rows)
+
+    assert events == [BidMadeEvent.from_dict(rows[0]), CardPlayedEvent.from_dict(rows[1])]
+
+
+def test_parse_many_unknown_type():
+    parser = FiveHundredEventParser()
+    rows = [
+        {"type": "bid_made", "bid": 60, "made_by": "1", "seq_number": 1},
+        {"type": "unknown", "seq_number": 2},
+    ]
+
+    with pytest.raises(GameParsingException):
+        _ = parser.parse_many(rows)
+    with pytest.raises(GameParsingException):
+        _ = parser.from_dict(rows[1])
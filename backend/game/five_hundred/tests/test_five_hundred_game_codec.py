@@ -0,0 +1,47 @@
+import json
+import random
+
+import pytest
+
+from ...common.game_exception import GameParsingException, GameRulesException
+from ..domain.five_hundred_game import FiveHundredGame
+from ..domain.five_hundred_game_config import FiveHundredGameConfig
+from ..five_hundred_game_codec import FiveHundredGameCodec
+from ..five_hundred_game_engine import FiveHundredGameEngine
+from ..five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+
+
+def _roundtrip(game: FiveHundredGame) -> FiveHundredGame:
+    codec = FiveHundredGameCodec()
+    decoded = codec.decode(json.loads(json.dumps(codec.encode(game))))
+    assert isinstance(decoded, FiveHundredGame)
+    return decoded
+
+
+def test_roundtrip_sample_game(sample_game: FiveHundredGame):
+    decoded = _roundtrip(sample_game)
+    assert decoded == sample_game
+    assert decoded.to_dict() == sample_game.to_dict()
+
+
+def test_roundtrip_every_state_of_bot_games():
+    rng = random.Random(3)
+    engine = FiveHundredGameEngine(rng)
+    bot = FiveHundredRandomBotStrategy(rng)
+    config = FiveHundredGameConfig(max_rounds=3, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+    for _ in range(3):
+        game, _ = engine.start_game(config, frozenset({1, 2, 3}))
+        while game.ending is None:
+            try:
+                game, _ = engine.process_command(game, bot.create_command(game))
+            except GameRulesException:
+                continue
+            assert isinstance(game, FiveHundredGame)
+            decoded = _roundtrip(game)
+            assert decoded == game
+            assert decoded.round.trick_winning_seat == game.round.trick_winning_seat
+
+
+def test_decode_rejects_unknown_version():
+    with pytest.raises(GameParsingException):
+        _ = FiveHundredGameCodec().decode([999])
@@ -0,0 +1,58 @@
+import io
+import json
+import random
+
+import pytest
+
+from ...common.game_exception import GameEngineException
+from ..domain.five_hundred_game_config import FiveHundredGameConfig
+from ..five_hundred_random_bot_strategy import FiveHundredRandomBotStrategy
+from ..five_hundred_simulation import play_game, run_simulation
+
+CONFIG = FiveHundredGameConfig(max_rounds=20, max_bid_no_marriage=120, min_bid=60, give_up_points=50)
+BOTS = [FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy, FiveHundredRandomBotStrategy]
+
+
+def test_play_game_is_reproducible_by_seed():
+    game1 = play_game(CONFIG, BOTS, seed=5, collect_events=True)
+    game2 = play_game(CONFIG, BOTS, seed=5, collect_events=True)
+    assert game1.final_state.ending is not None
+    assert game1.events == game2.events
+    assert game1.final_state == game2.final_state
+
+
+def test_play_game_does_not_reseed_module_rng():
+    random.seed(11)
+    expected = random.random()
+    random.seed(11)
+
+    _ = play_game(CONFIG, BOTS, seed=5)
+
+    assert random.random() == expected
+
+
+def test_run_simulation_stats_and_event_log():
+    output = io.StringIO()
+    stats = run_simulation(3, CONFIG, BOTS, seed=1, events_output=output)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [line["game_index"] for line in lines] == [0, 1, 2]
+    assert [line["seed"] for line in lines] == [1, 2, 3]
+    assert stats.games == 3
+    assert stats.events == sum(len(line["events"]) for line in lines)
+    assert stats.commands == sum(stats.phase_commands.values())
+    assert set(stats.phase_seconds) == {"Bidding", "Forming Hands", "Playing Cards"}
+    assert stats.games_per_second > 0
+
+
+def test_run_simulation_results_do_not_depend_on_workers():
+    single, pooled = io.StringIO(), io.StringIO()
+    run_simulation(40, CONFIG, BOTS, seed=9, events_output=single)
+    run_simulation(40, CONFIG, BOTS, seed=9, workers=2, events_output=pooled)
+    # batches of games are written as workers finish them
+    assert sorted(single.getvalue().splitlines()) == sorted(pooled.getvalue().splitlines())
+
+
+def test_run_simulation_invalid_arguments():
+    with pytest.raises(GameEngineException):
+        run_simulation(1, CONFIG, BOTS, workers=0)